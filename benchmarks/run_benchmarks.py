@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Pipeline benchmark suite - Geophysics Contingency Analysis Tool v1.0
+
+Copyright (C) 2025 TraceSeis, Inc. All rights reserved.
+
+Times each stage of the analysis pipeline headlessly on deterministic
+synthetic SOM workbooks (see synthetic_workbooks.py) and writes the results
+as JSON. Results can be compared against a stored baseline to catch
+regressions from one run to the next.
+
+Stages:
+    open_workbook                   Open the workbook for streaming reads
+    read_sheets                     Read every sheet into a DataFrame
+    process_single_sheet_for_batch  Clean, convert and analyze every sheet
+    chi_square_qc_summary           QC summary of every sheet, computed each run
+    normalize_confusion_matrix      Row-normalize every confusion matrix
+    create_comparison_summary       Cross-sheet comparison table
+    analyze_workbook                Whole headless pipeline from the file
+    render_confusion_heatmap        Confusion heatmap of the first sheets (Agg)
+
+The GUI methods run on a GeophysicsAnalyzer created without a Tk root. The
+synthetic data is all numeric, so no dialogs are raised.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--preset NAME] [--repeat N] [--output FILE]
+    python benchmarks/run_benchmarks.py --neurons 1000 --facies 12 --samples 1e6 --sheets 20
+    python benchmarks/run_benchmarks.py --compare benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --save-baseline
+
+Exit status is 1 when --compare finds a stage slower than the threshold.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCHMARK_DIR)
+sys.path.insert(0, REPO_DIR)
+
+import numpy as np
+import pandas as pd
+
+from synthetic_workbooks import ensure_workbook, validate_parameters
+
+BASELINE_FILE = os.path.join(BENCHMARK_DIR, 'baseline.json')
+WORKBOOK_DIR = os.path.join(tempfile.gettempdir(), 'contingency_benchmark_workbooks')
+
+# Scenarios as (neurons, facies, samples, sheets)
+PRESETS = {
+    'quick': [
+        (16, 3, 1_000, 1),
+        (256, 8, 100_000, 10),
+    ],
+    'standard': [
+        (16, 3, 1_000, 1),
+        (256, 8, 100_000, 10),
+        (1_000, 12, 1_000_000, 50),
+        (10_000, 40, 100_000_000, 2),
+    ],
+    'sheets': [
+        (100, 6, 10_000, 100),
+        (100, 6, 10_000, 500),
+    ],
+}
+
+# Stage slowdown (current / baseline) reported as a regression
+DEFAULT_THRESHOLD = 1.25
+
+# Stages shorter than this are too noisy to compare
+MIN_COMPARABLE_SECONDS = 0.05
+
+
+def scenario_name(n_neurons, n_facies, n_samples, n_sheets):
+    """Readable scenario identifier"""
+    return f"neurons={n_neurons} facies={n_facies} samples={n_samples:.0e} sheets={n_sheets}"
+
+
+def time_stage(fn, repeat):
+    """Run fn repeat times; returns (timings, last result)"""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return timings, result
+
+
+def render_confusion_heatmap(gui, confusion_matrix):
+    """Draw a confusion heatmap the way the detailed sheet view does, on an Agg canvas"""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = gui.draw_chart('confusion_heatmap', {'matrix': confusion_matrix, 'title': 'Confusion Matrix'},
+                         (6, 4), dpi=100)
+    FigureCanvasAgg(fig).draw()
+
+
+def run_scenario(params, repeat, chart_sheets, workbook_dir):
+    """
+    Time every pipeline stage on one synthetic workbook.
+
+    Returns:
+        dict: Scenario name, parameters, workbook generation time and per-stage timings
+    """
+    import contingency_core as core
+    import multisheetcontingencysquares3 as gui
+
+    n_neurons, n_facies, n_samples, n_sheets = params
+    validate_parameters(n_neurons, n_facies, n_samples, n_sheets)
+
+    start = time.perf_counter()
+    path, generated = ensure_workbook(workbook_dir, n_neurons, n_facies, n_samples, n_sheets)
+    generate_seconds = time.perf_counter() - start if generated else None
+
+    analyzer = gui.GeophysicsAnalyzer.__new__(gui.GeophysicsAnalyzer)
+    stages = {}
+
+    def record(stage, fn):
+        timings, result = time_stage(fn, repeat)
+        stages[stage] = {
+            'min': min(timings),
+            'median': statistics.median(timings),
+            'runs': timings,
+        }
+        return result
+
+    reader = record('open_workbook', lambda: core.WorkbookReader(path))
+    sheet_names = reader.sheet_names
+    frames = record('read_sheets', lambda: {name: reader.read(name) for name in sheet_names})
+    reader.close()
+
+    results = record('process_single_sheet_for_batch', lambda: {
+        name: analyzer.process_single_sheet_for_batch(name, df) for name, df in frames.items()
+    })
+    results = {name: result for name, result in results.items() if result is not None}
+
+    # Sheet results keep their QC summary after the first call; time the computation, not the lookup
+    record('chi_square_qc_summary', lambda: [
+        core._chi_square_qc_summary(result) for result in results.values()
+    ])
+    record('normalize_confusion_matrix', lambda: [
+        analyzer.normalize_confusion_matrix(result['confusion_matrix']) for result in results.values()
+    ])
+
+    analyzer.batch_results = results
+    record('create_comparison_summary', analyzer.create_comparison_summary)
+    record('analyze_workbook', lambda: core.analyze_workbook(path))
+
+    if chart_sheets > 0:
+        charted = list(results.values())[:chart_sheets]
+        record('render_confusion_heatmap', lambda: [
+            render_confusion_heatmap(gui, result['confusion_matrix']) for result in charted
+        ])
+
+    return {
+        'name': scenario_name(*params),
+        'params': {
+            'neurons': n_neurons,
+            'facies': n_facies,
+            'samples': int(n_samples),
+            'sheets': n_sheets,
+        },
+        'analyzed_sheets': len(results),
+        'generate_seconds': generate_seconds,
+        'stages': stages,
+    }
+
+
+def environment_info():
+    """Machine and library versions recorded with the results"""
+    import scipy
+    import matplotlib
+
+    return {
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'scipy': scipy.__version__,
+        'matplotlib': matplotlib.__version__,
+    }
+
+
+def compare_results(current, baseline, threshold):
+    """
+    Print per-stage ratios against a baseline run.
+
+    Returns:
+        list: (scenario, stage, ratio) for every stage slower than threshold
+    """
+    baseline_scenarios = {scenario['name']: scenario for scenario in baseline['scenarios']}
+    regressions = []
+
+    for scenario in current['scenarios']:
+        reference = baseline_scenarios.get(scenario['name'])
+        if reference is None:
+            print(f"{scenario['name']}: not in baseline")
+            continue
+
+        print(scenario['name'])
+        for stage, timing in scenario['stages'].items():
+            reference_timing = reference['stages'].get(stage)
+            if reference_timing is None:
+                print(f"    {stage:<32} {timing['min']:9.4f}s  (new stage)")
+                continue
+
+            ratio = timing['min'] / reference_timing['min'] if reference_timing['min'] > 0 else float('inf')
+            flag = ''
+            if ratio > threshold and timing['min'] >= MIN_COMPARABLE_SECONDS:
+                regressions.append((scenario['name'], stage, ratio))
+                flag = '  REGRESSION'
+            print(f"    {stage:<32} {timing['min']:9.4f}s  baseline {reference_timing['min']:9.4f}s  "
+                  f"x{ratio:5.2f}{flag}")
+
+    return regressions
+
+
+def print_results(results):
+    """Print the minimum time of every stage"""
+    for scenario in results['scenarios']:
+        print(f"{scenario['name']} ({scenario['analyzed_sheets']} sheets analyzed)")
+        for stage, timing in scenario['stages'].items():
+            print(f"    {stage:<32} min {timing['min']:9.4f}s  median {timing['median']:9.4f}s")
+
+
+def build_parser():
+    """Create the command-line argument parser"""
+    parser = argparse.ArgumentParser(description="Time the analysis pipeline on synthetic SOM workbooks.")
+    parser.add_argument('--preset', choices=sorted(PRESETS), default='quick', help="Scenario set (default: quick)")
+    parser.add_argument('--neurons', type=int, help="Custom scenario: number of neurons")
+    parser.add_argument('--facies', type=int, help="Custom scenario: number of lithofacies")
+    parser.add_argument('--samples', type=float, help="Custom scenario: total samples per sheet (e.g. 1e6)")
+    parser.add_argument('--sheets', type=int, help="Custom scenario: number of sheets")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed runs per stage (default: 3)")
+    parser.add_argument('--chart-sheets', type=int, default=3, help="Sheets rendered in the chart stage, 0 to skip (default: 3)")
+    parser.add_argument('--workbook-dir', default=WORKBOOK_DIR, help="Where generated workbooks are kept between runs")
+    parser.add_argument('--output', help="Write the results as JSON to this file")
+    parser.add_argument('--compare', metavar='BASELINE', help="Compare against a baseline results file")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Slowdown ratio reported as a regression (default: {DEFAULT_THRESHOLD})")
+    parser.add_argument('--save-baseline', action='store_true', help=f"Store the results as the baseline ({BASELINE_FILE})")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    custom = (args.neurons, args.facies, args.samples, args.sheets)
+    if any(value is not None for value in custom):
+        if any(value is None for value in custom):
+            parser.error("a custom scenario needs --neurons, --facies, --samples and --sheets")
+        scenarios = [(args.neurons, args.facies, int(args.samples), args.sheets)]
+    else:
+        scenarios = PRESETS[args.preset]
+
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    try:
+        for params in scenarios:
+            validate_parameters(*params)
+    except ValueError as e:
+        parser.error(str(e))
+
+    results = {
+        'environment': environment_info(),
+        'scenarios': [],
+    }
+    for params in scenarios:
+        print(f"Running {scenario_name(*params)} ...", flush=True)
+        results['scenarios'].append(run_scenario(params, args.repeat, args.chart_sheets, args.workbook_dir))
+
+    print_results(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.save_baseline:
+        with open(BASELINE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline written to {BASELINE_FILE}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_results(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} stage(s) slower than x{args.threshold} the baseline")
+            return 1
+        print("No regressions against the baseline")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Start-up time benchmark - Geophysics Contingency Analysis Tool v1.0
+
+Copyright (C) 2025 TraceSeis, Inc. All rights reserved.
+
+Measures cold-start cost in fresh interpreters: the time to import the GUI
+module and the headless CLI, which heavy libraries each import pulls in, and
+(when a display is available) the time until the main window has been drawn.
+
+Usage:
+    python benchmarks/startup_time.py [--runs N]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Libraries that should only be loaded when they are first needed
+HEAVY_MODULES = (
+    'matplotlib',
+    'matplotlib.backends.backend_tkagg',
+    'seaborn',
+    'scipy.stats',
+    'scipy.ndimage',
+    'sentry_sdk',
+)
+
+IMPORT_PROBE = """
+import json, sys, time
+sys.path.insert(0, {repo_dir!r})
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'loaded': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+WINDOW_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+sys.path.insert(0, {repo_dir!r})
+import tkinter as tk
+try:
+    root = tk.Tk()
+except tk.TclError:
+    print(json.dumps({{'seconds': None, 'loaded': []}}))
+    sys.exit(0)
+import multisheetcontingencysquares3 as gui
+app = gui.GeophysicsAnalyzer(root)
+root.update()
+elapsed = time.perf_counter() - start
+loaded = [m for m in {heavy!r} if m in sys.modules]
+root.destroy()
+print(json.dumps({{'seconds': elapsed, 'loaded': loaded}}))
+"""
+
+
+def run_probe(code):
+    """Run a probe in a fresh interpreter and return its JSON result"""
+    completed = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True, text=True, cwd=REPO_DIR, check=True
+    )
+    # The GUI module prints cleanup messages at exit; the result is the JSON line
+    for line in completed.stdout.splitlines():
+        if line.startswith('{'):
+            return json.loads(line)
+    raise RuntimeError(f"Probe produced no result:\n{completed.stderr}")
+
+
+def measure(label, code, runs):
+    """Run a probe several times and print the median and spread"""
+    results = [run_probe(code) for _ in range(runs)]
+    times = [result['seconds'] for result in results if result['seconds'] is not None]
+    if not times:
+        print(f"{label:<28} skipped (no display available)")
+        return
+
+    loaded = ', '.join(results[-1]['loaded']) or 'none'
+    print(f"{label:<28} median {statistics.median(times):6.3f}s  "
+          f"min {min(times):6.3f}s  max {max(times):6.3f}s")
+    print(f"{'':<28} heavy modules loaded: {loaded}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure cold-start time of the GUI and the CLI.")
+    parser.add_argument('--runs', type=int, default=5, help="Fresh interpreters per measurement (default: 5)")
+    args = parser.parse_args(argv)
+
+    heavy = list(HEAVY_MODULES)
+    measure("import GUI module", IMPORT_PROBE.format(repo_dir=REPO_DIR, module='multisheetcontingencysquares3', heavy=heavy), args.runs)
+    measure("import CLI", IMPORT_PROBE.format(repo_dir=REPO_DIR, module='contingency_cli', heavy=heavy), args.runs)
+    measure("main window drawn", WINDOW_PROBE.format(repo_dir=REPO_DIR, heavy=heavy), args.runs)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""
+Synthetic SOM workbook generator - Geophysics Contingency Analysis Tool v1.0
+
+Copyright (C) 2025 TraceSeis, Inc. All rights reserved.
+
+Builds deterministic SOM-count workbooks for benchmarking. Each sheet has the
+layout the analyzer expects: neuron IDs in the first column followed by one
+count column per lithofacies. Neurons have a dominant lithofacies with a
+random purity, so the derived confusion matrices look like real SOM output
+rather than uniform noise. The same parameters and seed always produce the
+same workbook.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+# Parameter ranges supported by the generator
+MIN_NEURONS, MAX_NEURONS = 16, 10_000
+MIN_FACIES, MAX_FACIES = 3, 40
+MIN_SAMPLES, MAX_SAMPLES = 1_000, 100_000_000
+MIN_SHEETS, MAX_SHEETS = 1, 500
+
+
+def validate_parameters(n_neurons, n_facies, n_samples, n_sheets):
+    """
+    Check the generator parameters against the supported ranges.
+
+    Raises:
+        ValueError: If a parameter is outside its supported range
+    """
+    checks = (
+        ('neurons', n_neurons, MIN_NEURONS, MAX_NEURONS),
+        ('facies', n_facies, MIN_FACIES, MAX_FACIES),
+        ('samples', n_samples, MIN_SAMPLES, MAX_SAMPLES),
+        ('sheets', n_sheets, MIN_SHEETS, MAX_SHEETS),
+    )
+    for name, value, low, high in checks:
+        if not low <= value <= high:
+            raise ValueError(f"{name} must be between {low:,} and {high:,} (got {value:,})")
+
+
+def generate_som_counts(n_neurons, n_facies, n_samples, seed=0):
+    """
+    Generate one sheet of SOM hit counts.
+
+    Args:
+        n_neurons (int): Number of SOM neurons (rows)
+        n_facies (int): Number of lithofacies (count columns)
+        n_samples (int): Total number of samples spread over all cells
+        seed (int): Random seed
+
+    Returns:
+        pd.DataFrame: 'Neuron' column followed by one count column per lithofacies
+    """
+    rng = np.random.default_rng(seed)
+
+    # Samples per neuron: uneven, as SOM hit maps usually are
+    neuron_weights = rng.dirichlet(np.full(n_neurons, 0.8))
+    neuron_samples = rng.multinomial(n_samples, neuron_weights)
+
+    # Each neuron favours one lithofacies; the rest of its hits are spread out
+    dominant = rng.integers(0, n_facies, size=n_neurons)
+    purity = rng.uniform(0.4, 0.95, size=n_neurons)
+    background = rng.dirichlet(np.ones(n_facies), size=n_neurons)
+    facies_probs = background * (1.0 - purity)[:, None]
+    facies_probs[np.arange(n_neurons), dominant] += purity
+    facies_probs /= facies_probs.sum(axis=1, keepdims=True)
+
+    counts = rng.multinomial(neuron_samples, facies_probs)
+
+    df = pd.DataFrame(counts, columns=[f"Facies_{i + 1}" for i in range(n_facies)])
+    df.insert(0, 'Neuron', np.arange(1, n_neurons + 1))
+    return df
+
+
+def workbook_filename(n_neurons, n_facies, n_samples, n_sheets, seed=0):
+    """File name that identifies a generated workbook by its parameters"""
+    return f"som_n{n_neurons}_f{n_facies}_s{int(n_samples)}_k{n_sheets}_seed{seed}.xlsx"
+
+
+def write_workbook(path, n_neurons, n_facies, n_samples, n_sheets, seed=0):
+    """
+    Write a synthetic SOM workbook with n_sheets sheets.
+
+    Sheet i is generated with seed + i, so every sheet differs but the
+    workbook as a whole is reproducible.
+
+    Args:
+        path (str): Output .xlsx path
+        n_neurons, n_facies, n_samples, n_sheets (int): Workbook size
+        seed (int): Base random seed
+
+    Returns:
+        list: Sheet names in workbook order
+    """
+    validate_parameters(n_neurons, n_facies, n_samples, n_sheets)
+
+    sheet_names = [f"Sheet_{i + 1:03d}" for i in range(n_sheets)]
+    with pd.ExcelWriter(path, engine='openpyxl') as writer:
+        for i, sheet_name in enumerate(sheet_names):
+            df = generate_som_counts(n_neurons, n_facies, n_samples, seed + i)
+            df.to_excel(writer, sheet_name=sheet_name, index=False)
+    return sheet_names
+
+
+def ensure_workbook(directory, n_neurons, n_facies, n_samples, n_sheets, seed=0):
+    """
+    Return the path of a generated workbook, writing it only if it does not exist yet.
+
+    Returns:
+        tuple: (path, generated) where generated is True if the file was written now
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, workbook_filename(n_neurons, n_facies, n_samples, n_sheets, seed))
+    if os.path.exists(path):
+        return path, False
+
+    # Write to a temporary name so an interrupted run does not leave a partial workbook behind
+    partial_path = path + '.partial.xlsx'
+    write_workbook(partial_path, n_neurons, n_facies, n_samples, n_sheets, seed)
+    os.replace(partial_path, path)
+    return path, True
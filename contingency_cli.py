@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Contingency Analysis CLI - Geophysics Contingency Analysis Tool v1.0
+
+Copyright (C) 2025 TraceSeis, Inc. All rights reserved.
+
+Headless batch mode for nightly jobs and compute nodes. Every sheet of each
+workbook goes through the same ingestion, sheet analysis, comparison summary
+and QC pipeline as the GUI, and the comparison table and QC report of each
+workbook are written to the output directory. With --charts the charts of
+every sheet are rendered off-screen and exported as well. Only NumPy, pandas
+and SciPy are imported; Tkinter is never loaded and matplotlib only when
+charts are exported.
+
+Usage:
+    python contingency_cli.py WORKBOOK_OR_DIRECTORY [...] [-o OUTPUT_DIR]
+                              [-r] [-j JOBS] [--sheets NAME ...] [--cache-dir DIR]
+                              [--charts] [--chart-dpi DPI] [--normalized-charts]
+                              [--trace TRACE_FILE] [--telemetry EVENTS_FILE]
+
+Exit status is 0 when every workbook produced results, 1 when at least one
+workbook failed or had no analyzable sheets, and 2 for usage errors.
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from contingency_core import (
+    STREAMING_MIN_CELLS,
+    AnalysisCache,
+    analyze_workbook,
+    build_comparison_summary,
+    format_qc_report,
+)
+from contingency_figures import FigureCache
+from contingency_memory import DEFAULT_MEMORY_BUDGET_MB, MemoryBudget, process_memory_mb
+from contingency_render import EXPORT_DPI, RENDER_WORKERS, export_charts
+from contingency_trace import TRACER, run_traced, span
+from contingency_telemetry import (
+    TELEMETRY,
+    load_config as load_telemetry_config,
+    configure as configure_telemetry,
+)
+
+WORKBOOK_SUFFIXES = ('.xlsx', '.xlsm', '.xls')
+
+
+def find_workbooks(inputs, recursive=False):
+    """
+    Expand workbook files and directories into a sorted list of workbook paths.
+
+    Args:
+        inputs (list): Workbook files and/or directories
+        recursive (bool): Whether to search directories recursively
+
+    Returns:
+        list: Workbook paths (Excel lock files are skipped)
+
+    Raises:
+        FileNotFoundError: If an input does not exist
+    """
+    workbooks = []
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            candidates = path.rglob('*') if recursive else path.iterdir()
+            workbooks.extend(
+                candidate for candidate in candidates
+                if candidate.is_file()
+                and candidate.suffix.lower() in WORKBOOK_SUFFIXES
+                and not candidate.name.startswith('~$')
+            )
+        elif path.is_file():
+            workbooks.append(path)
+        else:
+            raise FileNotFoundError(f"Input not found: {item}")
+
+    # Deduplicate while keeping a stable order
+    return sorted(set(workbooks))
+
+
+def output_stems(workbooks):
+    """Assign each workbook a unique output file stem"""
+    stems = {}
+    used = set()
+    for workbook in workbooks:
+        stem = workbook.stem
+        if stem in used:
+            stem = f"{workbook.parent.name}_{workbook.stem}"
+        base, counter = stem, 2
+        while stem in used:
+            stem = f"{base}_{counter}"
+            counter += 1
+        used.add(stem)
+        stems[workbook] = stem
+    return stems
+
+
+def process_workbook(workbook, output_dir, stem, sheet_names=None, cache_dir=None, memory_budget_mb=None,
+                     stream_min_cells=STREAMING_MIN_CELLS, charts=None):
+    """
+    Analyze one workbook and write its comparison table, QC report and (optionally) charts.
+
+    Args:
+        workbook (Path): Workbook path
+        output_dir (Path): Directory for the output files
+        stem (str): Output file stem
+        sheet_names (list, optional): Sheets to analyze; all sheets when omitted
+        cache_dir (str, optional): Analysis cache directory
+        memory_budget_mb (float, optional): Memory budget of the analysis; reported in the QC report
+        stream_min_cells (int, optional): Sheets with more cells are streamed in row chunks
+        charts (dict, optional): Chart export options (dpi, normalize, workers); charts
+            are written to <stem>_charts in the output directory
+
+    Returns:
+        dict: Workbook path, analyzed sheet count, output paths, elapsed seconds,
+            memory use of the analyzing process, spilled sheet count, exported and
+            failed chart counts and error message
+    """
+    start_time = time.perf_counter()
+    summary = {
+        'workbook': str(workbook),
+        'analyzed_sheets': 0,
+        'comparison_file': None,
+        'report_file': None,
+        'elapsed': 0.0,
+        'memory_mb': None,
+        'spilled_sheets': 0,
+        'charts_dir': None,
+        'charts_exported': 0,
+        'charts_failed': 0,
+        'charts_skipped': 0,
+        'error': None
+    }
+    memory_budget = MemoryBudget(memory_budget_mb) if memory_budget_mb else None
+
+    try:
+        with span('process_workbook', 'batch', workbook=workbook.name):
+            cache = AnalysisCache(cache_dir) if cache_dir else None
+            results = analyze_workbook(str(workbook), sheet_names, cache, memory_budget=memory_budget,
+                                       stream_min_cells=stream_min_cells)
+            summary['analyzed_sheets'] = len(results)
+
+            if not results:
+                summary['error'] = "No sheets contained valid data for analysis"
+                return summary
+
+            with span('write_outputs', 'io', workbook=workbook.name):
+                comparison_file = output_dir / f"{stem}_comparison.csv"
+                build_comparison_summary(results).to_csv(comparison_file, index=False)
+                summary['comparison_file'] = str(comparison_file)
+
+                report_file = output_dir / f"{stem}_qc_report.txt"
+                with open(report_file, 'w', encoding='utf-8') as f:
+                    memory_report = memory_budget.report() if memory_budget is not None else None
+                    f.write(format_qc_report(results, workbook.name, memory_report))
+                summary['report_file'] = str(report_file)
+
+            if charts:
+                with span('export_charts', 'render', workbook=workbook.name):
+                    figure_cache = FigureCache(directory=os.path.join(cache_dir, 'Figures')) if cache_dir else None
+                    exported = export_charts(results, output_dir / f"{stem}_charts", dpi=charts['dpi'],
+                                             normalize=charts['normalize'], max_workers=charts['workers'],
+                                             cache=figure_cache)
+                summary['charts_dir'] = exported['output_dir']
+                summary['charts_exported'] = exported['exported']
+                summary['charts_failed'] = len(exported['failed'])
+                summary['charts_skipped'] = len(exported['skipped'])
+
+    except Exception as e:
+        summary['error'] = str(e)
+
+    finally:
+        summary['elapsed'] = time.perf_counter() - start_time
+        summary['memory_mb'] = process_memory_mb()
+        if memory_budget is not None:
+            summary['spilled_sheets'] = len(memory_budget.spilled_sheets)
+            memory_budget.close()
+
+    return summary
+
+
+def report_summary(summary):
+    """Print and record the outcome of one workbook; returns 1 if it failed, else 0"""
+    TELEMETRY.record(
+        'workbook_analysis',
+        workbook=os.path.basename(summary['workbook']),
+        sheets_analyzed=summary['analyzed_sheets'],
+        seconds=round(summary['elapsed'], 4),
+        memory_mb=summary['memory_mb'],
+        spilled_sheets=summary['spilled_sheets'],
+        failed=bool(summary['error'])
+    )
+
+    if summary['error']:
+        print(f"FAILED {summary['workbook']}: {summary['error']}", file=sys.stderr)
+        return 1
+
+    print(f"OK     {summary['workbook']}: {summary['analyzed_sheets']} sheets analyzed "
+          f"in {summary['elapsed']:.2f}s -> {os.path.basename(summary['comparison_file'])}, "
+          f"{os.path.basename(summary['report_file'])}")
+    if summary['charts_dir']:
+        print(f"       {summary['charts_exported']} charts exported to {os.path.basename(summary['charts_dir'])}"
+              + (f", {summary['charts_failed']} failed" if summary['charts_failed'] else "")
+              + (f", {summary['charts_skipped']} sheets skipped" if summary['charts_skipped'] else ""))
+    return 0
+
+
+def build_parser():
+    """Create the command-line argument parser"""
+    parser = argparse.ArgumentParser(
+        description="Headless contingency analysis of SOM workbooks: writes a comparison "
+                    "table (CSV) and a QC report (text) for every workbook."
+    )
+    parser.add_argument('inputs', nargs='+', help="Workbook files or directories containing workbooks")
+    parser.add_argument('-o', '--output-dir', default='.', help="Directory for the output files (default: current directory)")
+    parser.add_argument('-r', '--recursive', action='store_true', help="Search input directories recursively")
+    parser.add_argument('-j', '--jobs', type=int, default=1, help="Number of workbooks analyzed in parallel (default: 1)")
+    parser.add_argument('--sheets', nargs='+', metavar='NAME', help="Only analyze these sheets of each workbook")
+    parser.add_argument('--cache-dir', help="Reuse and store sheet analyses in this cache directory")
+    parser.add_argument('--memory-budget', type=float, default=DEFAULT_MEMORY_BUDGET_MB, metavar='MB',
+                        help="Memory budget per workbook; sheets are analyzed in chunks and results spilled "
+                             f"to disk to stay within it, 0 disables (default: {DEFAULT_MEMORY_BUDGET_MB})")
+    parser.add_argument('--stream-cells', type=int, default=STREAMING_MIN_CELLS, metavar='CELLS',
+                        help="Sheets with more cells than this are read in row chunks instead of as a whole "
+                             f"(default: {STREAMING_MIN_CELLS:,})")
+    parser.add_argument('--charts', action='store_true',
+                        help="Also render the heatmap, distribution, radar and pie charts of every sheet "
+                             "and export them as PNG files")
+    parser.add_argument('--chart-dpi', type=int, default=EXPORT_DPI, metavar='DPI',
+                        help=f"Resolution of exported charts (default: {EXPORT_DPI})")
+    parser.add_argument('--normalized-charts', action='store_true',
+                        help="Export confusion matrix heatmaps as row percentages instead of counts")
+    parser.add_argument('--trace', metavar='TRACE_FILE',
+                        help="Record per-stage timings, write them as a Chrome trace JSON and print a summary table")
+    parser.add_argument('--telemetry', metavar='EVENTS_FILE',
+                        help="Append per-workbook timing, size and memory events to this local JSON-lines file "
+                             "(telemetry is off by default in batch runs)")
+    return parser
+
+
+def main(argv=None):
+    """Command-line entry point; returns the process exit status"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.memory_budget < 0:
+        parser.error("--memory-budget must not be negative")
+    if args.stream_cells < 0:
+        parser.error("--stream-cells must not be negative")
+    if args.chart_dpi < 1:
+        parser.error("--chart-dpi must be positive")
+
+    try:
+        workbooks = find_workbooks(args.inputs, args.recursive)
+    except FileNotFoundError as e:
+        parser.error(str(e))
+
+    if not workbooks:
+        print("No workbooks found.", file=sys.stderr)
+        return 1
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stems = output_stems(workbooks)
+
+    if args.trace:
+        TRACER.enable()
+
+    if args.telemetry:
+        configure_telemetry(load_telemetry_config(file=args.telemetry))
+    else:
+        configure_telemetry(load_telemetry_config(headless=True))
+
+    parallel = args.jobs > 1 and len(workbooks) > 1
+    charts = None
+    if args.charts:
+        # Workbooks analyzed in parallel render their charts in their own process
+        charts = {'dpi': args.chart_dpi, 'normalize': args.normalized_charts,
+                  'workers': 0 if parallel else RENDER_WORKERS}
+
+    tasks = [(workbook, output_dir, stems[workbook], args.sheets, args.cache_dir, args.memory_budget,
+              args.stream_cells, charts)
+             for workbook in workbooks]
+    failed = 0
+    if not parallel:
+        for task in tasks:
+            failed += report_summary(process_workbook(*task))
+    else:
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(workbooks)),
+                                 mp_context=multiprocessing.get_context('spawn')) as executor:
+            if args.trace:
+                futures = [executor.submit(run_traced, process_workbook, *task) for task in tasks]
+            else:
+                futures = [executor.submit(process_workbook, *task) for task in tasks]
+            for future in as_completed(futures):
+                summary = future.result()
+                if args.trace:
+                    summary, events = summary
+                    TRACER.add_events(events)
+                failed += report_summary(summary)
+
+    print(f"{len(workbooks) - failed}/{len(workbooks)} workbooks processed successfully")
+
+    TELEMETRY.shutdown()
+
+    if args.trace:
+        TRACER.export_chrome_trace(args.trace)
+        print(f"\nTrace written to {args.trace}")
+        print(TRACER.format_summary())
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
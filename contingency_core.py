@@ -0,0 +1,2376 @@
+"""
+Contingency Analysis Core - Geophysics Contingency Analysis Tool v1.0
+
+Copyright (C) 2025 TraceSeis, Inc. All rights reserved.
+
+Numeric routines shared by the analysis pipeline. This module only depends on
+NumPy, pandas and SciPy so it can be used without the Tkinter GUI.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import posixpath
+import sys
+import weakref
+import zipfile
+import zlib
+from collections.abc import Mapping
+from itertools import islice
+from xml.etree import ElementTree
+
+import numpy as np
+import pandas as pd
+from pandas.errors import EmptyDataError
+from pandas.io.parsers import TextParser
+
+from contingency_diskcache import CacheDirectory
+from contingency_memory import object_nbytes, unspill
+from contingency_trace import span, traced
+
+# Version of the analysis results; bump when cached results must be recomputed
+ANALYSIS_VERSION = "1"
+
+# Upper bound on the number of cells stacked into one batched kernel call
+BATCH_STACK_MAX_CELLS = 50_000_000
+
+# Workbook formats streamed directly with openpyxl; others go through pd.ExcelFile
+STREAMING_WORKBOOK_SUFFIXES = ('.xlsx', '.xlsm')
+
+# Data rows read per sheet by WorkbookReader.preview
+PREVIEW_ROWS = 5
+
+# Sheets declaring more cells than this are streamed in row chunks (see stream_som_counts)
+STREAMING_MIN_CELLS = 1_000_000
+
+# Worksheet rows parsed per chunk by the streaming path
+STREAM_CHUNK_ROWS = 10_000
+
+# Lower bound on the worksheet XML bytes per numeric cell, used to estimate
+# the size of sheets whose writer did not record their dimensions
+XML_BYTES_PER_CELL = 20
+
+# Count matrices with at least this many cells and at most this share of
+# non-zero cells are kept in CSR form (see sparse_counts)
+SPARSE_MIN_CELLS = 100_000
+SPARSE_MAX_DENSITY = 0.1
+
+# Cached formula errors, which pandas reads as NaN
+_CELL_ERROR_CODES = frozenset(('#NULL!', '#DIV/0!', '#VALUE!', '#REF!', '#NAME?', '#NUM!', '#N/A'))
+
+# Workbook kept open by a process pool worker: (path, modification time, reader)
+_worker_workbook = None
+
+
+class StreamingUnsupported(Exception):
+    """A sheet cannot be streamed in row chunks and has to be read as a whole"""
+
+
+# Errors of unreadable, malformed or unusable sheets, which are skipped with a
+# warning; anything else is a bug and propagates
+_SHEET_ERRORS = (ValueError, TypeError, KeyError, IndexError, OSError, zipfile.BadZipFile,
+                 ElementTree.ParseError, zlib.error, StreamingUnsupported)
+
+
+def is_sparse(counts):
+    """Whether counts is a SciPy sparse matrix; SciPy is not imported to find out"""
+    sparse = sys.modules.get('scipy.sparse')
+    return sparse is not None and sparse.issparse(counts)
+
+
+def prefers_sparse(counts):
+    """Whether a dense count array is large and mostly zeros (see sparse_counts)"""
+    return counts.size >= SPARSE_MIN_CELLS and np.count_nonzero(counts) <= SPARSE_MAX_DENSITY * counts.size
+
+
+def sparse_counts(counts):
+    """
+    Return a count matrix in CSR form when it is large and mostly zeros.
+
+    Args:
+        counts (np.ndarray or sparse matrix): Neuron x lithofacies counts
+
+    Returns:
+        Counts as a scipy.sparse CSR matrix when they have at least
+        SPARSE_MIN_CELLS cells and at most SPARSE_MAX_DENSITY non-zero
+        cells, otherwise unchanged
+    """
+    if is_sparse(counts):
+        return counts
+    counts = np.asarray(counts)
+    if not prefers_sparse(counts):
+        return counts
+
+    # scipy.sparse takes a noticeable time to import, so it is loaded on first use
+    from scipy import sparse
+    return sparse.csr_matrix(counts)
+
+
+def dense_counts(counts):
+    """Return a count matrix as a dense array (for displays and exports)"""
+    return counts.toarray() if is_sparse(counts) else np.asarray(counts)
+
+
+def _sparse_winners_and_confusion(counts):
+    """
+    som_to_confusion_matrix for a sparse count matrix.
+
+    Works on the stored entries only: the winner of each row is the first
+    stored entry holding the row maximum (found with one maximum.reduceat over
+    the CSR rows), and the confusion counts are accumulated from the stored
+    entries of the active rows.
+    """
+    counts = counts.tocsr()
+    if not counts.has_canonical_format:
+        counts = counts.copy()
+        counts.sum_duplicates()
+    n_neurons, n_facies = counts.shape
+
+    winner_idx = np.full(n_neurons, -1, dtype=np.intp)
+    confusion = np.zeros((n_facies, n_facies), dtype=np.int64)
+    row_lengths = np.diff(counts.indptr)
+    stored_rows = np.flatnonzero(row_lengths)
+    if stored_rows.size == 0:
+        return winner_idx, confusion
+
+    data = counts.data
+    row_max = np.maximum.reduceat(data, counts.indptr[stored_rows])
+
+    # First column holding the row maximum; indices are sorted within rows
+    entry_rows = np.repeat(np.arange(n_neurons), row_lengths)
+    max_positions = np.flatnonzero(data == np.repeat(row_max, row_lengths[stored_rows]))
+    max_rows = entry_rows[max_positions]
+    first = np.flatnonzero(np.r_[True, max_rows[1:] != max_rows[:-1]])
+    winner_idx[max_rows[first]] = counts.indices[max_positions[first]]
+
+    # Rows holding only explicit zeros have no samples
+    winner_idx[stored_rows[row_max <= 0]] = -1
+
+    entry_winners = winner_idx[entry_rows]
+    active = entry_winners >= 0
+    np.add.at(confusion, (entry_winners[active], counts.indices[active]), data[active])
+    return winner_idx, confusion
+
+
+@traced(name='winner_transform')
+def som_to_confusion_matrix(som_counts):
+    """
+    Transform a neuron x lithofacies count array into a confusion matrix.
+
+    Each neuron predicts the lithofacies with the highest count (the first one
+    on ties, matching ``Series.idxmax``). Every sample mapped to a neuron is
+    counted against its actual lithofacies, so row ``p`` of the result is the
+    sum of the count rows of all neurons whose winner is ``p``. The cost depends
+    only on the matrix shape, not on the number of samples.
+
+    Sparse count matrices (see sparse_counts) are evaluated on their stored
+    entries without being made dense.
+
+    Args:
+        som_counts (np.ndarray or sparse matrix): Non-negative integer counts (neurons x lithofacies)
+
+    Returns:
+        tuple: (winner_idx, confusion) where winner_idx holds the winning column
+            index of each neuron (-1 for neurons without samples) and confusion
+            is a lithofacies x lithofacies int64 array (rows = predicted)
+    """
+    if is_sparse(som_counts):
+        return _sparse_winners_and_confusion(som_counts)
+
+    counts = np.asarray(som_counts)
+    n_facies = counts.shape[1]
+
+    active = counts.sum(axis=1) > 0
+    winner_idx = np.where(active, counts.argmax(axis=1), -1)
+
+    # Grouped sum of neuron rows by their winning lithofacies
+    confusion = np.zeros((n_facies, n_facies), dtype=np.int64)
+    np.add.at(confusion, winner_idx[active], counts[active])
+
+    return winner_idx, confusion
+
+
+@traced(name='chi2_contingency')
+def contingency_statistics_stack(observed):
+    """
+    Fused statistics kernel for a stack of 2-D contingency tables.
+
+    Row and column marginals are computed once per table; expected counts,
+    the Pearson chi-square test, Cramer's V, the share of low expected
+    frequencies, density, balance and accuracy are all derived from them. The
+    chi-square test matches ``scipy.stats.chi2_contingency`` (with Yates'
+    correction for 1 degree of freedom); tables with a zero expected frequency,
+    which chi2_contingency rejects, are flagged in ``chi2_valid`` instead of
+    raising and report a chi-square of 0, a p-value of 1 and a Cramer's V of 0.
+
+    Args:
+        observed (np.ndarray): Non-negative counts with shape (tables x rows x cols)
+
+    Returns:
+        dict: Per-table arrays keyed by statistic name, plus the shared
+            degrees of freedom and the expected frequency stack
+    """
+    observed = np.asarray(observed)
+    n_tables, n_rows, n_cols = observed.shape
+    n_cells = n_rows * n_cols
+
+    # Marginals, computed once and reused by every statistic below
+    row_sums = observed.sum(axis=2)
+    col_sums = observed.sum(axis=1)
+    totals = row_sums.sum(axis=1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        expected = (row_sums[:, :, None].astype(np.float64) * col_sums[:, None, :].astype(np.float64)
+                    / totals[:, None, None])
+    chi2_valid = np.all(expected > 0, axis=(1, 2))
+
+    dof = n_cells - n_rows - n_cols + 1
+    chi2 = np.zeros(n_tables, dtype=np.float64)
+    p_value = np.ones(n_tables, dtype=np.float64)
+
+    if dof > 0 and chi2_valid.any():
+        # scipy.stats takes about a second to import, so it is loaded on first use
+        from scipy.stats import chi2 as chi2_distribution
+
+        obs = observed[chi2_valid].astype(np.float64)
+        exp = expected[chi2_valid]
+        if dof == 1:
+            # Yates' correction for continuity, as applied by chi2_contingency
+            diff = exp - obs
+            obs = obs + np.minimum(0.5, np.abs(diff)) * np.sign(diff)
+        terms = (obs - exp) ** 2 / exp
+        chi2[chi2_valid] = terms.reshape(len(terms), -1).sum(axis=1)
+        p_value[chi2_valid] = chi2_distribution.sf(chi2[chi2_valid], dof)
+
+    min_dim = min(n_rows, n_cols) - 1
+    cramers_v = np.zeros(n_tables, dtype=np.float64)
+    if min_dim > 0:
+        usable = chi2_valid & (totals > 0)
+        cramers_v[usable] = np.sqrt(chi2[usable] / (totals[usable] * min_dim))
+
+    low_expected_count = np.count_nonzero(expected < 5, axis=(1, 2))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        row_mean = row_sums.mean(axis=1)
+        col_mean = col_sums.mean(axis=1)
+        row_balance = np.where(row_mean > 0, row_sums.std(axis=1) / row_mean, 0.0)
+        col_balance = np.where(col_mean > 0, col_sums.std(axis=1) / col_mean, 0.0)
+        accuracy = np.diagonal(observed, axis1=1, axis2=2).sum(axis=1) / totals
+
+    return {
+        'total_observations': totals,
+        'row_sums': row_sums,
+        'col_sums': col_sums,
+        'expected': expected,
+        'chi2': chi2,
+        'dof': dof,
+        'p_value': p_value,
+        'chi2_valid': chi2_valid,
+        'cramers_v': cramers_v,
+        'low_expected_count': low_expected_count,
+        'low_expected_share': (low_expected_count / n_cells) * 100,
+        'density': np.count_nonzero(observed, axis=(1, 2)) / n_cells,
+        'row_balance': row_balance,
+        'col_balance': col_balance,
+        'accuracy': accuracy
+    }
+
+
+def statistics_for_table(stack_statistics, index):
+    """
+    Extract the statistics of one table from a contingency_statistics_stack result.
+
+    Args:
+        stack_statistics (dict): Output of contingency_statistics_stack
+        index (int): Position of the table in the stack
+
+    Returns:
+        dict: Scalar statistics as Python numbers, with the table's marginals
+            and expected frequencies as arrays
+    """
+    stats = {
+        'total_observations': int(stack_statistics['total_observations'][index]),
+        'row_sums': stack_statistics['row_sums'][index],
+        'col_sums': stack_statistics['col_sums'][index],
+        'expected': stack_statistics['expected'][index],
+        'dof': int(stack_statistics['dof']),
+        'chi2_valid': bool(stack_statistics['chi2_valid'][index]),
+        'low_expected_count': int(stack_statistics['low_expected_count'][index])
+    }
+    for key in ('chi2', 'p_value', 'cramers_v', 'low_expected_share', 'density',
+                'row_balance', 'col_balance', 'accuracy'):
+        stats[key] = float(stack_statistics[key][index])
+    return stats
+
+
+def contingency_statistics(matrix):
+    """
+    Fused statistics kernel for a single contingency table.
+
+    Args:
+        matrix (np.ndarray): 2-D non-negative counts
+
+    Returns:
+        dict: See statistics_for_table
+    """
+    return statistics_for_table(contingency_statistics_stack(np.asarray(matrix)[None]), 0)
+
+
+@traced()
+def batch_contingency_metrics(som_stack):
+    """
+    Evaluate a stack of SOM configurations sharing the same shape at once.
+
+    Computes neuron winners, confusion matrices, global fit, chi-square,
+    p-values, Cramer's V and percent undefined neurons for every sheet of the
+    stack in a handful of vectorized passes. Results match the per-sheet
+    pipeline: sheets whose chi-square test cannot be computed get a Cramer's V
+    of 0 and a p-value of 1.
+
+    Args:
+        som_stack (np.ndarray): Non-negative integer counts (sheets x neurons x lithofacies)
+
+    Returns:
+        dict: Per-sheet arrays keyed by metric name; 'statistics' holds the full
+            contingency_statistics_stack output for the confusion matrices
+    """
+    stack = np.asarray(som_stack)
+    n_sheets, n_neurons, n_facies = stack.shape
+
+    active = stack.sum(axis=2) > 0
+    winner_idx = np.where(active, stack.argmax(axis=2), -1)
+
+    # Grouped sum of neuron rows by (sheet, winning lithofacies)
+    confusion = np.zeros((n_sheets * n_facies, n_facies), dtype=np.int64)
+    group_idx = np.arange(n_sheets)[:, None] * n_facies + winner_idx
+    np.add.at(confusion, group_idx[active], stack[active])
+    confusion = confusion.reshape(n_sheets, n_facies, n_facies)
+
+    statistics = contingency_statistics_stack(confusion)
+
+    active_neurons = active.sum(axis=1)
+    percent_undefined = ((n_neurons - active_neurons) / n_neurons) * 100
+
+    return {
+        'winner_idx': winner_idx,
+        'confusion': confusion,
+        'total_observations': statistics['total_observations'],
+        'global_fit': statistics['accuracy'] * 100,
+        'chi2': statistics['chi2'],
+        'chi2_p_value': statistics['p_value'],
+        'chi2_valid': statistics['chi2_valid'],
+        'cramers_v': statistics['cramers_v'],
+        'active_neurons': active_neurons,
+        'percent_undefined': percent_undefined,
+        'statistics': statistics
+    }
+
+
+def group_compatible_matrices(matrices):
+    """
+    Group SOM matrices that can be stacked into one batched kernel call.
+
+    Matrices are compatible when they share the same neuron count and the
+    same lithofacies columns in the same order. Groups are split so that no
+    stack exceeds BATCH_STACK_MAX_CELLS cells. Large, mostly empty matrices
+    (see sparse_counts) are never stacked; they are analyzed in sparse form
+    on their own.
+
+    Args:
+        matrices (dict): Sheet name -> pd.DataFrame of SOM counts
+
+    Returns:
+        list: Lists of sheet names, in first-seen order
+    """
+    groups = {}
+    for sheet_name, som_matrix in matrices.items():
+        if prefers_sparse(som_matrix.values):
+            key = ('sparse', sheet_name)
+        else:
+            key = (som_matrix.shape[0], tuple(som_matrix.columns))
+        groups.setdefault(key, []).append(sheet_name)
+
+    batches = []
+    for key, names in groups.items():
+        if key[0] == 'sparse':
+            batches.append(names)
+            continue
+        n_neurons, columns = key
+        per_sheet = max(1, n_neurons * len(columns))
+        chunk = max(1, BATCH_STACK_MAX_CELLS // per_sheet)
+        for start in range(0, len(names), chunk):
+            batches.append(names[start:start + chunk])
+    return batches
+
+
+def _convert_cell_value(value):
+    """Convert an openpyxl cell value the way pandas' openpyxl reader does"""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return np.nan if value in _CELL_ERROR_CODES else value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        as_int = int(value)
+        return as_int if as_int == value else float(value)
+    return value
+
+
+def _frame_from_rows(rows):
+    """
+    Build a sheet DataFrame from streamed cell values.
+
+    Matches ``pd.read_excel(..., sheet_name=name)``: trailing empty cells and
+    rows are trimmed, the first row is the header and the remaining rows go
+    through the same TextParser, so NA strings, column naming and type
+    inference are identical.
+
+    Args:
+        rows (iterable): Tuples of raw cell values, one per worksheet row
+
+    Returns:
+        pd.DataFrame: Sheet data (empty if the sheet has no data)
+    """
+    data = []
+    last_row_with_data = -1
+    for row_number, row in enumerate(rows):
+        converted_row = [_convert_cell_value(value) for value in row]
+        while converted_row and converted_row[-1] == "":
+            converted_row.pop()
+        if converted_row:
+            last_row_with_data = row_number
+        data.append(converted_row)
+    data = data[:last_row_with_data + 1]
+
+    if not data:
+        return pd.DataFrame()
+
+    max_width = max(len(data_row) for data_row in data)
+    data = [data_row + [""] * (max_width - len(data_row)) for data_row in data]
+
+    try:
+        return TextParser(data, header=0, skip_blank_lines=False).read()
+    except EmptyDataError:
+        return pd.DataFrame()
+
+
+class WorkbookReader:
+    """
+    Single-open workbook reader for streaming selected sheets.
+
+    The workbook directory and shared strings are loaded once when the reader
+    is created; each worksheet is parsed only when it is requested, so a single
+    raw sheet is in memory at a time. .xlsx/.xlsm files are streamed with
+    openpyxl in read-only mode and other formats go through pd.ExcelFile.
+    """
+    def __init__(self, source):
+        """
+        Args:
+            source (str or pd.ExcelFile): Workbook path or an already opened ExcelFile,
+                which is reused and left open by close()
+        """
+        self._dimensions = {}
+        self._part_sizes = None
+        self._owned = not isinstance(source, pd.ExcelFile)
+        self._path = str(source) if self._owned else None
+        if not self._owned:
+            self._book = source.book if source.engine == 'openpyxl' else source
+        elif str(source).lower().endswith(STREAMING_WORKBOOK_SUFFIXES):
+            from openpyxl import load_workbook
+            self._book = load_workbook(source, read_only=True, data_only=True, keep_links=False)
+        else:
+            self._book = pd.ExcelFile(source)
+
+    @property
+    def sheet_names(self):
+        """Names of the worksheets, in workbook order"""
+        if isinstance(self._book, pd.ExcelFile):
+            return self._book.sheet_names
+        return self._book.sheetnames
+
+    def read(self, sheet_name):
+        """
+        Read one sheet the way ``pd.read_excel(path, sheet_name=sheet_name)`` does.
+
+        Raises:
+            KeyError: If the workbook has no such sheet (streamed workbooks)
+            ValueError: If the workbook has no such sheet (pd.ExcelFile fallback)
+        """
+        with span('read_sheet', 'io', sheet=sheet_name):
+            if isinstance(self._book, pd.ExcelFile):
+                return self._book.parse(sheet_name)
+
+            return _frame_from_rows(self._worksheet(sheet_name).iter_rows(values_only=True))
+
+    def _worksheet(self, sheet_name):
+        """
+        Return a streamed worksheet ready to iterate from its first row.
+
+        The extent declared by the worksheet is recorded the first time the
+        sheet is opened; it is then reset, since writers do not always record
+        it correctly and iteration would stop at the declared last row.
+        """
+        worksheet = self._book[sheet_name]
+        if sheet_name not in self._dimensions:
+            dimensions = None
+            if worksheet.max_row is not None and worksheet.max_column is not None:
+                dimensions = (worksheet.max_row, worksheet.max_column)
+            self._dimensions[sheet_name] = dimensions
+        worksheet.reset_dimensions()
+        return worksheet
+
+    def dimensions(self, sheet_name):
+        """
+        Declared (rows, columns) extent of a sheet including the header row.
+
+        Returns:
+            tuple: Extent read from the worksheet header, or None when the
+                workbook does not record it or is not streamed
+        """
+        if isinstance(self._book, pd.ExcelFile):
+            return None
+        if sheet_name not in self._dimensions:
+            self._worksheet(sheet_name)
+        return self._dimensions[sheet_name]
+
+    def should_stream(self, sheet_name, min_cells=STREAMING_MIN_CELLS):
+        """
+        Whether a sheet has more than min_cells cells and should be read in row chunks.
+
+        The declared extent is used when the workbook records it; otherwise the
+        cell count is estimated from the uncompressed worksheet size.
+        """
+        if isinstance(self._book, pd.ExcelFile):
+            return False
+        dimensions = self.dimensions(sheet_name)
+        if dimensions is not None:
+            return dimensions[0] * dimensions[1] > min_cells
+
+        if self._part_sizes is None:
+            self._part_sizes = worksheet_sizes(self._path) if self._path else {}
+        return self._part_sizes.get(sheet_name, 0) // XML_BYTES_PER_CELL > min_cells
+
+    def iter_rows(self, sheet_name):
+        """
+        Iterate over the raw cell values of a streamed sheet, one tuple per row.
+
+        Raises:
+            StreamingUnsupported: If the workbook is not streamed (pd.ExcelFile fallback)
+        """
+        if isinstance(self._book, pd.ExcelFile):
+            raise StreamingUnsupported("Workbook format cannot be streamed")
+        return self._worksheet(sheet_name).iter_rows(values_only=True)
+
+    def preview(self, sheet_name, nrows=PREVIEW_ROWS):
+        """
+        Read the first rows of a sheet and its declared dimensions.
+
+        Only the start of the worksheet is parsed, so the cost does not depend
+        on the sheet size. The rows match ``pd.read_excel(..., nrows=nrows)``.
+
+        Args:
+            sheet_name (str): Sheet to preview
+            nrows (int): Number of data rows to read after the header
+
+        Returns:
+            tuple: (pd.DataFrame, dimensions) where dimensions is the declared
+                (rows, columns) extent of the sheet including the header row,
+                or None when the workbook does not record it
+        """
+        if isinstance(self._book, pd.ExcelFile):
+            return self._book.parse(sheet_name, nrows=nrows), None
+
+        worksheet = self._worksheet(sheet_name)
+        dimensions = self._dimensions[sheet_name]
+        rows = worksheet.iter_rows(values_only=True)
+        try:
+            return _frame_from_rows(islice(rows, nrows + 1)), dimensions
+        finally:
+            # Stop parsing the rest of the worksheet
+            rows.close()
+
+    def close(self):
+        """Release the workbook file handle if this reader opened it"""
+        if self._owned and self._book is not None:
+            try:
+                self._book.close()
+            except Exception:
+                pass
+        self._book = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _workbook_parts(archive):
+    """
+    Map sheet names to their worksheet parts using workbook.xml and its relationships.
+
+    Args:
+        archive (zipfile.ZipFile): Open .xlsx archive
+
+    Returns:
+        tuple: (dict of sheet name -> worksheet part name, shared strings part name or None)
+    """
+    relationships = {}
+    shared_strings = None
+    rels = ElementTree.fromstring(archive.read('xl/_rels/workbook.xml.rels'))
+    for rel in rels:
+        target = rel.get('Target', '')
+        # Targets are relative to xl/ unless they start at the package root
+        part = target.lstrip('/') if target.startswith('/') else posixpath.normpath(posixpath.join('xl', target))
+        relationships[rel.get('Id')] = part
+        if rel.get('Type', '').endswith('/sharedStrings'):
+            shared_strings = part
+
+    sheets = {}
+    workbook = ElementTree.fromstring(archive.read('xl/workbook.xml'))
+    for element in workbook.iter():
+        if not element.tag.endswith('}sheet'):
+            continue
+        rel_id = next((value for key, value in element.attrib.items() if key.endswith('}id')), None)
+        if rel_id in relationships:
+            sheets[element.get('name')] = relationships[rel_id]
+    return sheets, shared_strings
+
+
+def _references_shared_strings(archive, part):
+    """Scan the raw bytes of a worksheet part for shared-string cells without parsing the XML"""
+    tail = b''
+    with archive.open(part) as stream:
+        while True:
+            chunk = stream.read(1 << 20)
+            if not chunk:
+                return False
+            if b't="s"' in tail + chunk:
+                return True
+            tail = chunk[-4:]
+
+
+@traced('io')
+def worksheet_fingerprints(file_path):
+    """
+    Fingerprint every worksheet of an .xlsx/.xlsm workbook without parsing it.
+
+    A worksheet fingerprint combines the CRC-32 and size recorded in the ZIP
+    directory for its ``xl/worksheets/sheetN.xml`` part with those of the
+    shared strings table when the sheet references it, plus ANALYSIS_VERSION.
+    Re-exporting a workbook leaves the fingerprints of untouched sheets
+    unchanged, so they can be matched against earlier results.
+
+    Args:
+        file_path (str): Workbook path
+
+    Returns:
+        dict: Sheet name -> hex fingerprint (empty for other formats or unreadable files)
+    """
+    if not str(file_path).lower().endswith(STREAMING_WORKBOOK_SUFFIXES):
+        return {}
+
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            sheets, shared_strings = _workbook_parts(archive)
+            shared_info = None
+            if shared_strings and shared_strings in archive.NameToInfo:
+                info = archive.getinfo(shared_strings)
+                shared_info = (info.CRC, info.file_size)
+
+            fingerprints = {}
+            for sheet_name, part in sheets.items():
+                if part not in archive.NameToInfo:
+                    continue
+                info = archive.getinfo(part)
+                components = [ANALYSIS_VERSION, info.CRC, info.file_size]
+                if shared_info and _references_shared_strings(archive, part):
+                    components.extend(shared_info)
+                digest = hashlib.sha256(repr(components).encode()).hexdigest()
+                fingerprints[sheet_name] = f"ws-{digest}"
+            return fingerprints
+    except (zipfile.BadZipFile, KeyError, ElementTree.ParseError, OSError, zlib.error) as e:
+        print(f"Warning: Could not fingerprint worksheets: {e}")
+        return {}
+
+
+def worksheet_sizes(file_path):
+    """
+    Uncompressed size of every worksheet of an .xlsx/.xlsm workbook.
+
+    Read from the ZIP directory without decompressing anything; used to
+    estimate how much memory analyzing each sheet will take.
+
+    Args:
+        file_path (str): Workbook path
+
+    Returns:
+        dict: Sheet name -> worksheet XML size in bytes (empty for other formats or unreadable files)
+    """
+    if not str(file_path).lower().endswith(STREAMING_WORKBOOK_SUFFIXES):
+        return {}
+
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            sheets, _ = _workbook_parts(archive)
+            return {
+                sheet_name: archive.getinfo(part).file_size
+                for sheet_name, part in sheets.items()
+                if part in archive.NameToInfo
+            }
+    except (zipfile.BadZipFile, KeyError, ElementTree.ParseError, OSError) as e:
+        print(f"Warning: Could not read worksheet sizes: {e}")
+        return {}
+
+
+@traced(name='validate_and_clean_data')
+def clean_sheet_frame(df):
+    """
+    Validate a raw sheet and drop its completely empty rows and columns.
+
+    Args:
+        df (pd.DataFrame): Raw sheet data (neuron IDs in the first column)
+
+    Returns:
+        pd.DataFrame: Cleaned dataframe
+
+    Raises:
+        ValueError: If data fails validation criteria
+    """
+    if df is None:
+        raise ValueError("Input dataframe is None - cannot process empty data.")
+
+    if df.empty:
+        raise ValueError("The selected sheet appears to be empty.")
+
+    original_shape = df.shape
+
+    # Remove completely empty rows and columns; one presence mask serves both
+    # axes (a column empty in the kept rows is empty in all rows)
+    present = df.notna().to_numpy()
+    rows_kept = present.any(axis=1)
+    columns_kept = present.any(axis=0)
+    if rows_kept.all() and columns_kept.all():
+        df_cleaned = df
+    else:
+        df_cleaned = df.iloc[rows_kept, columns_kept]
+
+    if df_cleaned.empty:
+        raise ValueError(
+            f"Sheet contains no valid data after removing empty rows/columns. "
+            f"Original shape: {original_shape}, cleaned shape: {df_cleaned.shape}"
+        )
+
+    # Check minimum structural requirements
+    if len(df_cleaned.columns) < 2:
+        raise ValueError(
+            f"Data must have at least 2 columns (neuron IDs + lithofacies data). "
+            f"Found: {len(df_cleaned.columns)} columns"
+        )
+
+    # Check for reasonable data dimensions
+    if df_cleaned.shape[0] < 5:
+        raise ValueError(
+            f"Insufficient data rows for meaningful analysis. "
+            f"Minimum required: 5 rows, found: {df_cleaned.shape[0]} rows"
+        )
+
+    # Column names should not be empty or purely numeric
+    invalid_cols = [col for col in df_cleaned.columns
+                    if pd.isna(col) or str(col).strip() == '' or str(col).isdigit()]
+    if invalid_cols:
+        df_cleaned = df_cleaned.set_axis(
+            [f"Column_{i}" if pd.isna(col) or str(col).strip() == '' or str(col).isdigit()
+             else col for i, col in enumerate(df_cleaned.columns)],
+            axis=1
+        )
+
+    return df_cleaned
+
+
+def smallest_count_dtype(max_value):
+    """
+    Smallest signed integer dtype that holds counts up to max_value.
+
+    Args:
+        max_value (float): Largest count (non-negative)
+
+    Returns:
+        np.dtype: int8, int16, int32 or int64
+    """
+    for dtype in (np.int8, np.int16, np.int32):
+        if max_value <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+def numeric_block(frame):
+    """
+    Convert a block of sheet columns into one float64 array.
+
+    Numeric columns are copied straight into the array; other columns go
+    through ``pd.to_numeric(errors='coerce')``, so non-numeric cells become NaN.
+
+    Args:
+        frame (pd.DataFrame): Sheet columns
+
+    Returns:
+        np.ndarray: Values (rows x columns)
+    """
+    values = np.empty(frame.shape, dtype=np.float64)
+    for j in range(frame.shape[1]):
+        column = frame.iloc[:, j]
+        if not pd.api.types.is_numeric_dtype(column.dtype):
+            column = pd.to_numeric(column, errors='coerce')
+        values[:, j] = column.to_numpy(dtype=np.float64, na_value=np.nan)
+    return values
+
+
+def sanitize_count_values(values):
+    """
+    Turn a float block into non-negative counts in place and gather its statistics.
+
+    NaN cells become zero and negative values are made absolute, all in the
+    given buffer.
+
+    Args:
+        values (np.ndarray): Float values from numeric_block (modified)
+
+    Returns:
+        tuple: (nan_counts per column, max value)
+    """
+    nan_mask = np.isnan(values)
+    nan_counts = nan_mask.sum(axis=0)
+    values[nan_mask] = 0
+    np.abs(values, out=values)
+    max_value = values.max() if values.size else 0.0
+    return nan_counts, max_value
+
+
+@traced(name='convert_to_numeric_safe')
+def sanitize_count_matrix(matrix_data, quality_callback=None):
+    """
+    Convert lithofacies data to non-negative integer counts with safety checks.
+
+    Non-numeric cells become zero and negative values are made absolute. The
+    block is converted into one float buffer that is cleaned in place, and the
+    counts use the smallest integer dtype that holds the largest value.
+
+    Args:
+        matrix_data (pd.DataFrame): Lithofacies columns of a cleaned sheet
+        quality_callback (callable, optional): Called with the percentage of
+            non-numeric cells when there are any
+
+    Returns:
+        pd.DataFrame: Integer count matrix
+
+    Raises:
+        ValueError: If data fails safety criteria or is unsuitable for analysis
+    """
+    if matrix_data is None or matrix_data.empty:
+        raise ValueError("Matrix data is empty or None - cannot convert to numeric.")
+
+    values = numeric_block(matrix_data)
+    nan_counts, max_val = sanitize_count_values(values)
+    nan_count = int(nan_counts.sum())
+
+    if nan_count > 0 and quality_callback:
+        quality_callback((nan_count / values.size) * 100)
+
+    # Reject values that could cause overflow or computational issues
+    if max_val > 1e10:
+        raise ValueError(
+            f"Data contains extremely large values (max: {max_val:.2e}) that could cause "
+            f"computational overflow. Please review your data source."
+        )
+    elif max_val > 1e6:
+        print(f"Warning: Large values detected (max: {max_val:.2e}) - monitoring for potential issues")
+
+    try:
+        counts = values.astype(smallest_count_dtype(max_val))
+    except (ValueError, OverflowError) as e:
+        raise ValueError(
+            f"Failed to convert data to integers: {str(e)}. "
+            f"Data may contain values outside integer range."
+        )
+
+    if not counts.any():
+        raise ValueError(
+            "All lithofacies data values are zero - no samples available for analysis. "
+            "Please check your data source and selection criteria."
+        )
+
+    return pd.DataFrame(counts, index=matrix_data.index, columns=matrix_data.columns, copy=False)
+
+
+def build_som_matrix(df, quality_callback=None):
+    """
+    Turn a raw sheet into its neuron x lithofacies count matrix.
+
+    Args:
+        df (pd.DataFrame): Raw sheet data (neuron IDs in the first column)
+        quality_callback (callable, optional): See sanitize_count_matrix
+
+    Returns:
+        pd.DataFrame: Integer counts indexed by neuron ID, or None if the sheet
+            does not have the expected structure
+
+    Raises:
+        ValueError: If the count data fails sanitize_count_matrix
+    """
+    if df.empty or len(df.columns) < 2 or len(df) < 1:
+        return None
+
+    try:
+        df = clean_sheet_frame(df)
+    except ValueError:
+        return None
+
+    row_labels = df.iloc[:, 0].astype(str)
+    col_labels = df.columns[1:].astype(str)
+    numeric_matrix = sanitize_count_matrix(df.iloc[:, 1:], quality_callback)
+
+    return pd.DataFrame(numeric_matrix.values, index=row_labels, columns=col_labels, copy=False)
+
+
+def _trimmed_row(row):
+    """Convert one row of raw cell values and drop its trailing empty cells"""
+    converted_row = [_convert_cell_value(value) for value in row]
+    while converted_row and converted_row[-1] == "":
+        converted_row.pop()
+    return converted_row
+
+
+class SomCountAccumulator:
+    """
+    Incremental count matrix, neuron winners and confusion counts of one sheet.
+
+    Chunks of the sheet are added one at a time and reduced to integer
+    counts straight away, so the raw sheet is never held as a whole. The
+    result matches build_som_matrix followed by som_to_confusion_matrix on
+    the complete sheet: columns that are empty in the whole sheet are dropped
+    at the end, and the neuron ID column is type-inferred over all its rows
+    as a full read would.
+    """
+
+    def __init__(self, header):
+        """
+        Args:
+            header (list): Converted header row of the sheet
+        """
+        self.header = header
+        self.columns = None
+        self.id_values = []
+        self.last_row_with_data = -1
+        self.kept_rows = []
+        self.counts = []
+        self.has_data = None
+        self.nan_counts = None
+        self.max_value = 0
+        self.confusion = None
+        self.winner_idx = []
+
+    def add_rows(self, rows):
+        """
+        Parse and accumulate one chunk of converted, trimmed rows.
+
+        Raises:
+            StreamingUnsupported: If a row is wider than the header, which a full
+                read would turn into extra unnamed columns
+        """
+        width = len(self.header)
+        padded = []
+        for row in rows:
+            if len(row) > width:
+                raise StreamingUnsupported("Sheet has data beyond its header columns")
+            if row:
+                self.last_row_with_data = len(self.id_values)
+            self.id_values.append(row[0] if row else "")
+            padded.append(row + [""] * (width - len(row)))
+        if not padded:
+            return
+
+        chunk = TextParser([self.header] + padded, header=0, skip_blank_lines=False).read()
+        if self.columns is None:
+            self.columns = chunk.columns
+            n_facies = len(chunk.columns) - 1
+            self.has_data = np.zeros(len(chunk.columns), dtype=bool)
+            self.nan_counts = np.zeros(n_facies, dtype=np.int64)
+            self.confusion = np.zeros((n_facies, n_facies), dtype=np.int64)
+
+        # Rows without any value are dropped, as clean_sheet_frame does
+        present = chunk.notna().values
+        kept = present.any(axis=1)
+        self.kept_rows.append(kept)
+        self.has_data |= present.any(axis=0)
+
+        values = numeric_block(chunk.iloc[kept, 1:])
+        nan_counts, max_value = sanitize_count_values(values)
+        self.nan_counts += nan_counts
+        self.max_value = max(self.max_value, max_value)
+        if self.max_value > 1e10:
+            # Reported by result(), after the structural checks, as sanitize_count_matrix would
+            return
+
+        # Chunks of different dtypes are widened to the largest when concatenated
+        counts = values.astype(smallest_count_dtype(max_value))
+        winner_idx, confusion = som_to_confusion_matrix(counts)
+        self.counts.append(counts)
+        self.winner_idx.append(winner_idx)
+        self.confusion += confusion
+
+    def result(self, quality_callback=None):
+        """
+        Finish the sheet.
+
+        Args:
+            quality_callback (callable, optional): See sanitize_count_matrix
+
+        Returns:
+            tuple: (som_matrix, winner_idx, confusion) as build_som_matrix and
+                som_to_confusion_matrix would return them, or None if the sheet
+                does not have the expected structure
+
+        Raises:
+            StreamingUnsupported: If the neuron ID column is empty
+            ValueError: If the count data fails the checks of sanitize_count_matrix
+        """
+        if self.columns is None or len(self.columns) < 2:
+            return None
+        if not self.has_data[0]:
+            # A full read would drop the column and take the next one as neuron IDs
+            raise StreamingUnsupported("Neuron ID column is empty")
+
+        kept_rows = np.concatenate(self.kept_rows)
+        n_rows = int(kept_rows.sum())
+        keep = self.has_data[1:]
+        n_facies = int(keep.sum())
+        if n_facies < 1 or n_rows < 5:
+            return None
+
+        # The ID column alone goes through the same type inference as in a full read
+        id_rows = [[value] for value in self.id_values[:self.last_row_with_data + 1]]
+        id_column = TextParser([[self.header[0]]] + id_rows, header=0, skip_blank_lines=False).read().iloc[:, 0]
+        kept_rows = kept_rows[:len(id_column)]
+
+        columns = [self.columns[0]] + [column for column, kept in zip(self.columns[1:], keep) if kept]
+        columns = [f"Column_{i}" if pd.isna(col) or str(col).strip() == '' or str(col).isdigit()
+                   else col for i, col in enumerate(columns)]
+
+        nan_count = int(self.nan_counts[keep].sum())
+        if nan_count > 0 and quality_callback:
+            quality_callback((nan_count / (n_rows * n_facies)) * 100)
+
+        if self.max_value > 1e10:
+            raise ValueError(
+                f"Data contains extremely large values (max: {self.max_value:.2e}) that could cause "
+                f"computational overflow. Please review your data source."
+            )
+        elif self.max_value > 1e6:
+            print(f"Warning: Large values detected (max: {self.max_value:.2e}) - monitoring for potential issues")
+
+        counts = np.concatenate([chunk[:, keep] for chunk in self.counts])
+        if counts.sum() == 0:
+            raise ValueError(
+                "All lithofacies data values are zero - no samples available for analysis. "
+                "Please check your data source and selection criteria."
+            )
+
+        # Columns empty in the whole sheet are all zero, so they never win a neuron
+        new_index = np.cumsum(keep) - 1
+        winner_idx = np.concatenate(self.winner_idx)
+        winner_idx = np.where(winner_idx >= 0, new_index[winner_idx], -1)
+        confusion = self.confusion[np.ix_(keep, keep)]
+
+        row_labels = id_column[kept_rows].astype(str)
+        row_labels.name = columns[0]
+        col_labels = pd.Index(columns[1:]).astype(str)
+        som_matrix = pd.DataFrame(counts, index=row_labels, columns=col_labels, copy=False)
+        return som_matrix, winner_idx, confusion
+
+
+@traced('io')
+def stream_som_counts(reader, sheet_name, chunk_rows=STREAM_CHUNK_ROWS, quality_callback=None):
+    """
+    Build the count matrix, neuron winners and confusion counts of a sheet from row chunks.
+
+    Only chunk_rows raw rows are parsed and held at a time; each chunk is
+    reduced to integer counts before the next one is read.
+
+    Args:
+        reader (WorkbookReader): Open workbook
+        sheet_name (str): Sheet to stream
+        chunk_rows (int): Worksheet rows per chunk
+        quality_callback (callable, optional): See sanitize_count_matrix
+
+    Returns:
+        tuple: See SomCountAccumulator.result
+
+    Raises:
+        StreamingUnsupported: If the sheet has to be read as a whole
+        ValueError: If the count data fails the checks of sanitize_count_matrix
+    """
+    rows = reader.iter_rows(sheet_name)
+    try:
+        header = None
+        for header_row in rows:
+            header = _trimmed_row(header_row)
+            break
+        if header is None:
+            return None
+        if not header:
+            # A full read would name the columns after the widest data row
+            raise StreamingUnsupported("Sheet has no header row")
+
+        accumulator = SomCountAccumulator(header)
+        while True:
+            with span('stream_chunk', 'io', sheet=sheet_name):
+                chunk = [_trimmed_row(row) for row in islice(rows, chunk_rows)]
+                accumulator.add_rows(chunk)
+            if len(chunk) < chunk_rows:
+                break
+    finally:
+        rows.close()
+
+    return accumulator.result(quality_callback)
+
+
+def analyze_streamed_sheet(reader, sheet_name, chunk_rows=STREAM_CHUNK_ROWS):
+    """
+    Analyze one sheet streamed in row chunks into a compact sheet result.
+
+    Returns:
+        dict: See compact_sheet_result, or None if the sheet is unusable
+
+    Raises:
+        StreamingUnsupported: If the sheet has to be read as a whole
+    """
+    percentages = []
+    streamed = stream_som_counts(reader, sheet_name, chunk_rows, percentages.append)
+    if streamed is None:
+        return None
+    som_matrix, winner_idx, confusion = streamed
+    return compact_sheet_result(som_matrix, winner_idx, confusion, contingency_statistics(confusion),
+                                percentages[0] if percentages else 0.0)
+
+
+def stream_if_large(reader, sheet_name, min_cells=STREAMING_MIN_CELLS):
+    """
+    Analyze a sheet in row chunks when it declares more than min_cells cells.
+
+    Args:
+        reader (WorkbookReader): Open workbook
+        sheet_name (str): Sheet to analyze
+        min_cells (int): Streaming threshold; None disables streaming
+
+    Returns:
+        tuple: (streamed, compact) where streamed is False when the sheet is
+            small or cannot be streamed and has to be read as a whole, and
+            compact is the compact sheet result (None if the sheet is unusable)
+    """
+    if min_cells is None or not reader.should_stream(sheet_name, min_cells):
+        return False, None
+    try:
+        return True, analyze_streamed_sheet(reader, sheet_name)
+    except StreamingUnsupported as e:
+        print(f"Warning: Reading sheet '{sheet_name}' as a whole: {e}")
+        return False, None
+
+
+def _worker_reader(file_path):
+    """Return the workbook reader held open by this worker process, reopening it if the file changed"""
+    global _worker_workbook
+    mtime = os.path.getmtime(file_path)
+    if _worker_workbook is not None:
+        path, opened_mtime, reader = _worker_workbook
+        if path == file_path and opened_mtime == mtime:
+            return reader
+        reader.close()
+        _worker_workbook = None
+
+    reader = WorkbookReader(file_path)
+    _worker_workbook = (file_path, mtime, reader)
+    return reader
+
+
+def compact_sheet_result(som_matrix, winner_idx, confusion, stats, non_numeric_percentage=0.0, counts=None):
+    """
+    Pack one analyzed sheet into plain arrays, label lists and statistics.
+
+    This is the form sent back by process pool workers and stored in the
+    analysis cache; the GUI rebuilds its DataFrames from it. Large, mostly
+    empty count matrices are stored in CSR form (see sparse_counts).
+
+    Args:
+        som_matrix (pd.DataFrame): Integer counts indexed by neuron ID
+        winner_idx (np.ndarray): Winning lithofacies index per neuron (-1 if inactive)
+        confusion (np.ndarray): Lithofacies x lithofacies counts
+        stats (dict): contingency_statistics result for the confusion matrix
+        non_numeric_percentage (float): Share of non-numeric cells in the sheet
+        counts (optional): The counts of som_matrix as returned by sparse_counts, if already converted
+
+    Returns:
+        dict: Compact sheet result
+    """
+    return {
+        'neuron_ids': som_matrix.index.tolist(),
+        'neuron_label': som_matrix.index.name,
+        'lithofacies': som_matrix.columns.tolist(),
+        'counts': sparse_counts(som_matrix.values) if counts is None else counts,
+        'winner_idx': np.asarray(winner_idx),
+        'confusion': np.asarray(confusion),
+        'stats': stats,
+        'non_numeric_percentage': non_numeric_percentage
+    }
+
+
+def analyze_som_counts(som_matrix, non_numeric_percentage=0.0):
+    """
+    Analyze one SOM count matrix into a compact sheet result.
+
+    Args:
+        som_matrix (pd.DataFrame): Integer counts indexed by neuron ID
+        non_numeric_percentage (float): Share of non-numeric cells in the sheet
+
+    Returns:
+        dict: See compact_sheet_result
+    """
+    counts = sparse_counts(som_matrix.values)
+    winner_idx, confusion = som_to_confusion_matrix(counts)
+    return compact_sheet_result(som_matrix, winner_idx, confusion,
+                                contingency_statistics(confusion), non_numeric_percentage, counts)
+
+
+class AnalysisCache:
+    """
+    Persistent content-addressed cache of compact sheet results.
+
+    Entries are keyed by a SHA-256 of the raw sheet content and
+    ANALYSIS_VERSION and stored as one .npz file each in a CacheDirectory
+    (see contingency_diskcache), which several application instances (and
+    process pool workers) can share. The least recently used entries are
+    evicted once the directory exceeds max_bytes.
+    """
+    _ARRAY_KEYS = ('counts', 'winner_idx', 'confusion')
+    _STATS_ARRAY_KEYS = ('row_sums', 'col_sums', 'expected')
+    _SPARSE_PARTS = ('data', 'indices', 'indptr')
+
+    def __init__(self, directory, max_bytes=256 * 1024 * 1024):
+        """
+        Args:
+            directory (str or Path): Cache directory, created on first write
+            max_bytes (int): Size cap of the cache directory
+        """
+        self._files = CacheDirectory(directory, '.npz', max_bytes)
+
+    @staticmethod
+    def sheet_key(df):
+        """
+        Hash the raw content of a sheet.
+
+        Args:
+            df (pd.DataFrame): Sheet data as read from the workbook
+
+        Returns:
+            str: Hex digest identifying the sheet content and analysis version
+        """
+        digest = hashlib.sha256()
+        digest.update(ANALYSIS_VERSION.encode())
+        digest.update(repr((list(df.columns), [str(dtype) for dtype in df.dtypes], df.shape)).encode())
+        digest.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+        return digest.hexdigest()
+
+    @traced('cache', name='cache_get')
+    def get(self, key):
+        """
+        Load a cached sheet result.
+
+        Args:
+            key (str): Key from sheet_key
+
+        Returns:
+            dict: Compact sheet result, or None on a miss
+        """
+        path = self._files.entry_path(key)
+        try:
+            with np.load(path, allow_pickle=False) as entry:
+                meta = json.loads(str(entry['meta']))
+                if meta.get('analysis_version') != ANALYSIS_VERSION:
+                    return None
+                if meta.get('sparse_counts'):
+                    from scipy import sparse
+                    parts = tuple(entry[f"counts_{part}"] for part in self._SPARSE_PARTS)
+                    compact = {'counts': sparse.csr_matrix(parts, shape=tuple(entry['counts_shape']))}
+                else:
+                    compact = {'counts': entry['counts']}
+                compact.update((name, entry[name]) for name in self._ARRAY_KEYS if name != 'counts')
+                stats = dict(meta['stats'])
+                for name in self._STATS_ARRAY_KEYS:
+                    stats[name] = entry[f"stats_{name}"]
+                compact['neuron_ids'] = entry['neuron_ids'].tolist()
+                compact['lithofacies'] = entry['lithofacies'].tolist()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # Unreadable entry (e.g. written by an incompatible version): drop it
+            print(f"Warning: Discarding unreadable cache entry {key[:12]}: {e}")
+            self._files.remove(path)
+            return None
+
+        compact['neuron_label'] = meta['neuron_label']
+        compact['stats'] = stats
+        compact['non_numeric_percentage'] = meta['non_numeric_percentage']
+        self._files.touch(path)
+        return compact
+
+    @traced('cache', name='cache_put')
+    def put(self, key, compact):
+        """
+        Store a compact sheet result. Failures are reported and otherwise ignored.
+
+        Args:
+            key (str): Key from sheet_key
+            compact (dict): Compact sheet result
+        """
+        stats = compact['stats']
+        meta = {
+            'analysis_version': ANALYSIS_VERSION,
+            'neuron_label': compact['neuron_label'],
+            'non_numeric_percentage': float(compact['non_numeric_percentage']),
+            'stats': {name: value for name, value in stats.items() if name not in self._STATS_ARRAY_KEYS},
+            'sparse_counts': is_sparse(compact['counts'])
+        }
+        arrays = {name: np.asarray(compact[name]) for name in self._ARRAY_KEYS if name != 'counts'}
+        if meta['sparse_counts']:
+            counts = compact['counts'].tocsr()
+            arrays.update({f"counts_{part}": getattr(counts, part) for part in self._SPARSE_PARTS})
+            arrays['counts_shape'] = np.array(counts.shape)
+        else:
+            arrays['counts'] = np.asarray(compact['counts'])
+        arrays.update({f"stats_{name}": np.asarray(stats[name]) for name in self._STATS_ARRAY_KEYS})
+        arrays['neuron_ids'] = np.array(compact['neuron_ids'], dtype=str)
+        arrays['lithofacies'] = np.array(compact['lithofacies'], dtype=str)
+        arrays['meta'] = np.array(json.dumps(meta))
+
+        try:
+            self._files.write(key, lambda f: np.savez(f, **arrays))
+        except Exception as e:
+            print(f"Warning: Could not write analysis cache entry: {e}")
+
+    def clear(self):
+        """Remove all cache entries"""
+        self._files.clear()
+
+
+def analyze_sheet_file(file_path, sheet_name, cache=None, fingerprint=None,
+                       stream_min_cells=STREAMING_MIN_CELLS):
+    """
+    Read and analyze one sheet of a workbook; process pool entry point.
+
+    Each worker process opens the workbook once and keeps it for the
+    following sheets. Sheets larger than stream_min_cells cells are streamed
+    in row chunks (see stream_if_large). The result only holds arrays, label
+    lists and the contingency statistics so it is cheap to send back to the
+    parent process.
+
+    Args:
+        file_path (str): Path of the Excel workbook
+        sheet_name (str): Sheet to analyze
+        cache (AnalysisCache, optional): Cache consulted before analyzing and
+            updated afterwards
+        fingerprint (str, optional): Worksheet fingerprint under which the
+            result is also cached
+        stream_min_cells (int, optional): Streaming threshold; None disables streaming
+
+    Returns:
+        dict: Compact sheet result, or None if the sheet is unusable
+    """
+    try:
+        with span('analyze_sheet', sheet=sheet_name):
+            reader = _worker_reader(file_path)
+            streamed, compact = stream_if_large(reader, sheet_name, stream_min_cells)
+            if streamed:
+                if compact is not None and cache is not None and fingerprint:
+                    cache.put(fingerprint, compact)
+                return compact
+
+            df = reader.read(sheet_name)
+
+            key = cache.sheet_key(df) if cache is not None else None
+            compact = cache.get(key) if key else None
+            if compact is None:
+                non_numeric = []
+                som_matrix = build_som_matrix(df, non_numeric.append)
+                if som_matrix is None:
+                    return None
+                compact = analyze_som_counts(som_matrix, non_numeric[0] if non_numeric else 0.0)
+                if key:
+                    cache.put(key, compact)
+
+            if key and fingerprint:
+                cache.put(fingerprint, compact)
+            return compact
+    except _SHEET_ERRORS as e:
+        print(f"Warning: Skipping sheet '{sheet_name}': {e}")
+        return None
+
+
+# Lithofacies label tuples shared by all results with the same columns
+_LABEL_TUPLES = {}
+
+_INT32_MAX = np.iinfo(np.int32).max
+
+
+def _intern_labels(labels, share=False):
+    """
+    Return the labels as a tuple of interned strings.
+
+    Args:
+        labels (iterable): Neuron IDs or lithofacies names
+        share (bool): Also share the tuple itself between results with the same labels
+
+    Returns:
+        tuple: Labels
+    """
+    labels = tuple(sys.intern(label) if type(label) is str else label for label in labels)
+    if not share:
+        return labels
+    return _LABEL_TUPLES.setdefault(labels, labels)
+
+
+def _compact_counts(counts):
+    """Return integer counts as int32 when every value fits, in CSR form when large and mostly zeros"""
+    if is_sparse(counts):
+        return counts
+    counts = np.asarray(counts)
+    if counts.dtype.kind in 'iu' and counts.dtype.itemsize > 4 and (counts.size == 0 or counts.max() <= _INT32_MAX):
+        counts = counts.astype(np.int32)
+    return sparse_counts(counts)
+
+
+class SheetResult(Mapping):
+    """
+    Analysis result of one sheet.
+
+    The neuron x lithofacies counts and the winning lithofacies per neuron are
+    kept as compact NumPy arrays (CSR for large, mostly empty count matrices)
+    and the labels as interned tuples. The
+    som_matrix DataFrame and the neuron_winners dictionary are built from
+    them on each access, so only displays and exports that ask for them pay
+    for them. The small confusion_matrix view is built once and kept, so its
+    normalized view (see cached_normalized_confusion_matrix) is kept too. The record also reads like the
+    result dictionaries used elsewhere: result['global_fit'],
+    result.get('confusion_matrix') and 'key' in result all work.
+
+    counts, winner_idx and neuron_ids may be replaced by SpilledValue
+    stand-ins when the memory budget spills the result to disk.
+    """
+    __slots__ = (
+        'sheet_name', 'neuron_ids', 'neuron_label', 'lithofacies', 'counts', 'winner_idx', 'confusion',
+        'total_observations', 'total_neurons', 'active_neurons', 'global_fit', 'cramers_v',
+        'percent_undefined', 'chi2_p_value', 'contingency_stats', '_qc_summary', '_confusion_view'
+    )
+
+    # Keys of the result dictionary interface
+    KEYS = (
+        'sheet_name', 'total_observations', 'total_neurons', 'active_neurons', 'global_fit', 'cramers_v',
+        'percent_undefined', 'chi2_p_value', 'matrix_shape', 'confusion_matrix', 'som_matrix',
+        'neuron_winners', 'contingency_stats'
+    )
+
+    # Fields the memory budget may spill to disk; the rest are scalars and the
+    # lithofacies x lithofacies confusion matrix, which the views use constantly
+    SPILLABLE_FIELDS = ('counts', 'winner_idx', 'neuron_ids')
+
+    def __init__(self, sheet_name, neuron_ids, neuron_label, lithofacies, counts, winner_idx, confusion,
+                 total_observations, global_fit, cramers_v, p_value, stats):
+        self.sheet_name = sheet_name
+        self.neuron_ids = _intern_labels(neuron_ids)
+        self.neuron_label = neuron_label
+        self.lithofacies = _intern_labels(lithofacies, share=True)
+        self.counts = _compact_counts(counts)
+        self.winner_idx = np.asarray(winner_idx, dtype=np.int32)
+        self.confusion = np.asarray(confusion)
+        self.total_observations = total_observations
+        self.global_fit = global_fit
+        self.cramers_v = cramers_v
+        self.chi2_p_value = p_value
+        self.contingency_stats = stats
+        self._qc_summary = None
+        self._confusion_view = None
+
+        # Percent Zero Entries (inactive neurons)
+        self.total_neurons = len(self.neuron_ids)
+        self.active_neurons = int(np.count_nonzero(self.winner_idx >= 0))
+        inactive_neurons = self.total_neurons - self.active_neurons
+        self.percent_undefined = (inactive_neurons / self.total_neurons) * 100
+
+    @property
+    def matrix_shape(self):
+        """Shape of the confusion matrix"""
+        return self.confusion.shape
+
+    @property
+    def confusion_matrix(self):
+        """Lithofacies x lithofacies confusion matrix as a DataFrame (shared between calls; do not modify)"""
+        cached = self._confusion_view
+        if cached is None or cached[0] is not self.confusion:
+            view = pd.DataFrame(self.confusion, index=list(self.lithofacies), columns=list(self.lithofacies))
+            cached = self._confusion_view = (self.confusion, view)
+        return cached[1]
+
+    @property
+    def som_matrix(self):
+        """Neuron x lithofacies counts as a DataFrame indexed by neuron ID"""
+        return pd.DataFrame(
+            dense_counts(unspill(self.counts)),
+            index=pd.Index(unspill(self.neuron_ids), name=self.neuron_label),
+            columns=pd.Index(self.lithofacies)
+        )
+
+    @property
+    def neuron_winners(self):
+        """Neuron ID -> winning lithofacies (None for inactive neurons)"""
+        lithofacies = self.lithofacies
+        return {
+            neuron_id: lithofacies[winner] if winner >= 0 else None
+            for neuron_id, winner in zip(unspill(self.neuron_ids), unspill(self.winner_idx).tolist())
+        }
+
+    def qc_summary(self):
+        """
+        Chi-square QC summary of the result (see chi_square_qc_summary).
+
+        The summary is computed on first use and kept with the result; it is
+        recomputed only after the confusion counts have been replaced.
+        """
+        cached = self._qc_summary
+        if cached is None or cached[0] is not self.confusion:
+            cached = self._qc_summary = (self.confusion, _chi_square_qc_summary(self))
+        return cached[1]
+
+    def renamed(self, sheet_name):
+        """
+        The same result under another sheet name (e.g. an unchanged sheet that was renamed).
+
+        The copy shares the arrays, spilled stand-ins, confusion matrix view
+        and QC summary of this record; nothing is rebuilt or read back.
+
+        Args:
+            sheet_name (str): Sheet name of the copy
+
+        Returns:
+            SheetResult: This record if the name is unchanged, otherwise a shallow copy
+        """
+        if sheet_name == self.sheet_name:
+            return self
+        result = SheetResult.__new__(SheetResult)
+        for field in self.__slots__:
+            setattr(result, field, getattr(self, field))
+        result.sheet_name = sheet_name
+        return result
+
+    def __getitem__(self, key):
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self):
+        return len(self.KEYS)
+
+    def __contains__(self, key):
+        return key in self.KEYS
+
+    def __repr__(self):
+        return (f"SheetResult({self.sheet_name!r}, neurons={self.total_neurons}, "
+                f"lithofacies={len(self.lithofacies)}, global_fit={self.global_fit:.2f})")
+
+
+def sheet_results_from_arrays(sheet_name, neuron_ids, neuron_label, lithofacies, counts, winner_idx,
+                              confusion_counts, stats):
+    """
+    Derive the key metrics from one table's contingency statistics and build its result record.
+
+    Args:
+        sheet_name (str): Sheet name
+        neuron_ids (list): Neuron ID per count row
+        neuron_label (str): Name of the neuron ID column
+        lithofacies (list): Lithofacies name per count column
+        counts (np.ndarray): Neuron x lithofacies counts
+        winner_idx (np.ndarray): Winning lithofacies index per neuron (-1 if inactive)
+        confusion_counts (np.ndarray): Lithofacies x lithofacies counts
+        stats (dict): contingency_statistics result for the confusion matrix
+
+    Returns:
+        SheetResult: Sheet result, or None for a sheet without observations
+    """
+    total_observations = stats['total_observations']
+    if total_observations == 0:
+        return None
+
+    # Sheets whose chi-square test cannot be computed get V = 0 and p = 1
+    if stats['chi2_valid']:
+        cramers_v = stats['cramers_v']
+        p_value = stats['p_value']
+    else:
+        cramers_v = 0
+        p_value = 1
+
+    return SheetResult(
+        sheet_name, neuron_ids, neuron_label, lithofacies, counts, winner_idx, confusion_counts,
+        total_observations, stats['accuracy'] * 100, cramers_v, p_value, stats
+    )
+
+
+def sheet_results_from_statistics(sheet_name, som_matrix, winner_idx, confusion_counts, stats):
+    """
+    Build the result record of one analyzed SOM count matrix.
+
+    Returns:
+        SheetResult: See sheet_results_from_arrays
+    """
+    return sheet_results_from_arrays(
+        sheet_name, som_matrix.index.tolist(), som_matrix.index.name, som_matrix.columns.tolist(),
+        som_matrix.values, winner_idx, confusion_counts, stats
+    )
+
+
+def sheet_results_from_compact(sheet_name, compact):
+    """
+    Build the result record of a compact sheet result without creating DataFrames.
+
+    Returns:
+        SheetResult: See sheet_results_from_arrays
+    """
+    return sheet_results_from_arrays(
+        sheet_name, compact['neuron_ids'], compact['neuron_label'], compact['lithofacies'],
+        compact['counts'], compact['winner_idx'], compact['confusion'], compact['stats']
+    )
+
+
+def _analyze_pending_matrices(som_matrices, non_numeric, compact_results, cancel_event=None):
+    """
+    Analyze prepared count matrices into compact_results.
+
+    Sheets sharing the same neuron count and lithofacies columns are stacked
+    into a (sheets x neurons x facies) array and evaluated by the batched
+    metrics kernel; sheets without a compatible partner use the per-sheet path.
+
+    Returns:
+        bool: False if the operation was cancelled
+    """
+    for group in group_compatible_matrices(som_matrices):
+        if cancel_event is not None and cancel_event.is_set():
+            return False
+
+        if len(group) > 1:
+            try:
+                stack = np.stack([som_matrices[name].values for name in group])
+                metrics = batch_contingency_metrics(stack)
+
+                for k, sheet_name in enumerate(group):
+                    compact_results[sheet_name] = compact_sheet_result(
+                        som_matrices[sheet_name], metrics['winner_idx'][k], metrics['confusion'][k],
+                        statistics_for_table(metrics['statistics'], k), non_numeric[sheet_name]
+                    )
+                continue
+            except Exception as e:
+                print(f"Warning: Batched metrics failed, falling back to per-sheet analysis: {e}")
+
+        for sheet_name in group:
+            try:
+                with span('analyze_sheet', sheet=sheet_name):
+                    compact_results[sheet_name] = analyze_som_counts(som_matrices[sheet_name], non_numeric[sheet_name])
+            except _SHEET_ERRORS as e:
+                print(f"Warning: Skipping sheet '{sheet_name}': {e}")
+    return True
+
+
+def _charge_compact_results(memory_budget, compact_results, sheet_names):
+    """
+    Charge compact sheet results, which are held until they are returned, to a memory budget.
+
+    Returns:
+        int: Bytes charged (0 without a budget)
+    """
+    if memory_budget is None:
+        return 0
+    charged = 0
+    for sheet_name in sheet_names:
+        if sheet_name in compact_results:
+            nbytes = object_nbytes(compact_results[sheet_name])
+            memory_budget.charge('compact_results', nbytes, sheet_name)
+            charged += nbytes
+    return charged
+
+
+def analyze_workbook_sheets(source, sheet_names=None, cache=None, fingerprints=None,
+                            progress_callback=None, cancel_event=None, memory_budget=None,
+                            stream_min_cells=STREAMING_MIN_CELLS):
+    """
+    Analyze the sheets of a workbook in this process.
+
+    The workbook is opened once and the selected sheets are streamed from it.
+    Sheets whose content is already in the analysis cache are not re-analyzed.
+    Compatible sheets are analyzed together by the batched metrics kernel
+    (see _analyze_pending_matrices); sheets larger than stream_min_cells
+    cells are streamed in row chunks instead (see stream_if_large) and cached
+    under their worksheet fingerprint only. With a memory budget, the count matrices
+    waiting for the batched kernel are charged to it; once the budget is
+    exceeded they are analyzed and released in chunks instead of all at once.
+    The compact results, which keep the count arrays, stay charged until they
+    are returned, so chunking bounds the pending matrices, not the results.
+
+    Args:
+        source (str or pd.ExcelFile): Workbook path or an already opened ExcelFile
+        sheet_names (list, optional): Sheets to analyze; all sheets when omitted
+        cache (AnalysisCache, optional): Cache consulted and updated per sheet
+        fingerprints (dict, optional): Sheet name -> worksheet fingerprint to cache results under
+        progress_callback (callable, optional): Called with (index, sheet_name) before each sheet is read
+        cancel_event (threading.Event, optional): Stops the analysis when set
+        memory_budget (MemoryBudget, optional): Budget charged with the pending count matrices
+        stream_min_cells (int, optional): Streaming threshold; None disables streaming
+
+    Returns:
+        dict: Sheet name -> compact sheet result (unusable sheets are omitted),
+            or None if the operation was cancelled
+    """
+    fingerprints = fingerprints or {}
+    compact_results = {}
+    som_matrices = {}
+    non_numeric = {}
+    cache_keys = {}
+    pending_bytes = 0
+    held_bytes = 0
+
+    with WorkbookReader(source) as reader:
+        if sheet_names is None:
+            sheet_names = reader.sheet_names
+        for i, sheet_name in enumerate(sheet_names):
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            if progress_callback:
+                progress_callback(i, sheet_name)
+            sheet_bytes = 0
+            try:
+                with span('prepare_sheet', sheet=sheet_name):
+                    streamed, compact = stream_if_large(reader, sheet_name, stream_min_cells)
+                    if streamed:
+                        if compact is not None:
+                            compact_results[sheet_name] = compact
+                            held_bytes += _charge_compact_results(memory_budget, compact_results, [sheet_name])
+                        continue
+
+                    df = reader.read(sheet_name)
+                    if memory_budget is not None:
+                        sheet_bytes = object_nbytes(df)
+                        memory_budget.charge('sheets', sheet_bytes, sheet_name)
+
+                    # Unchanged sheets come straight from the analysis cache
+                    if cache is not None:
+                        key = cache.sheet_key(df)
+                        compact = cache.get(key)
+                        if compact is not None:
+                            compact_results[sheet_name] = compact
+                            held_bytes += _charge_compact_results(memory_budget, compact_results, [sheet_name])
+                            continue
+                        cache_keys[sheet_name] = key
+
+                    percentages = []
+                    som_matrix = build_som_matrix(df, percentages.append)
+                    if som_matrix is not None:
+                        som_matrices[sheet_name] = som_matrix
+                        non_numeric[sheet_name] = percentages[0] if percentages else 0.0
+                        if memory_budget is not None:
+                            nbytes = object_nbytes(som_matrix)
+                            memory_budget.charge('som_matrices', nbytes, sheet_name)
+                            pending_bytes += nbytes
+            except _SHEET_ERRORS as e:
+                print(f"Warning: Skipping sheet '{sheet_name}': {e}")
+                continue
+            finally:
+                # Only one raw sheet is held at a time
+                if memory_budget is not None:
+                    memory_budget.release('sheets', sheet_bytes)
+
+            # Over budget: analyze what is pending now rather than holding every matrix
+            if memory_budget is not None and memory_budget.over_budget() and som_matrices:
+                memory_budget.note("analyzing sheets in chunks to stay within the memory budget")
+                memory_budget.sample_process_memory()
+                if not _analyze_pending_matrices(som_matrices, non_numeric, compact_results, cancel_event):
+                    return None
+                memory_budget.release('som_matrices', pending_bytes)
+                held_bytes += _charge_compact_results(memory_budget, compact_results, som_matrices)
+                som_matrices, non_numeric, pending_bytes = {}, {}, 0
+
+    if not _analyze_pending_matrices(som_matrices, non_numeric, compact_results, cancel_event):
+        return None
+    if memory_budget is not None:
+        memory_budget.release('som_matrices', pending_bytes)
+        held_bytes += _charge_compact_results(memory_budget, compact_results, som_matrices)
+        memory_budget.sample_process_memory()
+        # The results are handed to the caller, which accounts for them from here on
+        memory_budget.release('compact_results', held_bytes)
+
+    if cache is not None:
+        for sheet_name, compact in compact_results.items():
+            if sheet_name in cache_keys:
+                cache.put(cache_keys[sheet_name], compact)
+            if sheet_name in fingerprints:
+                cache.put(fingerprints[sheet_name], compact)
+
+    # Preserve the selection order
+    return {name: compact_results[name] for name in sheet_names if name in compact_results}
+
+
+def analyze_workbook(file_path, sheet_names=None, cache=None, progress_callback=None, memory_budget=None,
+                     stream_min_cells=STREAMING_MIN_CELLS):
+    """
+    Headless sheet analysis of one workbook.
+
+    Sheets whose worksheet fingerprint is in the cache are reused without
+    being read; the others go through analyze_workbook_sheets. With a memory
+    budget, the finished results are charged to it and the largest ones are
+    spilled to disk while it is exceeded.
+
+    Args:
+        file_path (str): Workbook path
+        sheet_names (list, optional): Sheets to analyze; all sheets when omitted
+        cache (AnalysisCache, optional): Analysis cache
+        progress_callback (callable, optional): See analyze_workbook_sheets
+        memory_budget (MemoryBudget, optional): Budget to account and enforce
+        stream_min_cells (int, optional): See analyze_workbook_sheets
+
+    Returns:
+        dict: Sheet name -> result dictionary (unusable sheets are omitted), in workbook order
+    """
+    if sheet_names is None:
+        with WorkbookReader(file_path) as reader:
+            sheet_names = list(reader.sheet_names)
+
+    fingerprints = worksheet_fingerprints(file_path)
+    compact_results = {}
+    if cache is not None:
+        for sheet_name in sheet_names:
+            fingerprint = fingerprints.get(sheet_name)
+            compact = cache.get(fingerprint) if fingerprint else None
+            if compact is not None:
+                compact_results[sheet_name] = compact
+
+    pending = [name for name in sheet_names if name not in compact_results]
+    if pending:
+        compact_results.update(analyze_workbook_sheets(file_path, pending, cache, fingerprints, progress_callback,
+                                                       memory_budget=memory_budget,
+                                                       stream_min_cells=stream_min_cells))
+
+    results = {}
+    for sheet_name in sheet_names:
+        if sheet_name in compact_results:
+            sheet_results = sheet_results_from_compact(sheet_name, compact_results[sheet_name])
+            if sheet_results:
+                results[sheet_name] = sheet_results
+                if memory_budget is not None:
+                    memory_budget.charge('results', object_nbytes(sheet_results), sheet_name)
+                    memory_budget.enforce(results)
+    return results
+
+
+def build_comparison_summary(batch_results):
+    """
+    Create a summary table comparing all processed sheets, ranked by global fit.
+
+    Args:
+        batch_results (dict): Sheet name -> result dictionary
+
+    Returns:
+        pd.DataFrame: One row per sheet, or None if there are no results
+    """
+    if not batch_results:
+        return None
+
+    summary_data = []
+    for sheet_name, results in batch_results.items():
+        summary_data.append({
+            'SOM_Config': sheet_name,
+            'Global_Fit': results['global_fit'],
+            'Cramers_V': results['cramers_v'],
+            'Percent_Zero_Entries': results['percent_undefined'],
+            'Total_Samples': results['total_observations'],
+            'Active_Neurons': results['active_neurons'],
+            'Total_Neurons': results['total_neurons'],
+            'Utilization': (results['active_neurons'] / results['total_neurons']) * 100,
+            'P_Value': results['chi2_p_value']
+        })
+
+    # Sort by Global Fit (descending) and add ranking
+    comparison_summary = pd.DataFrame(summary_data)
+    comparison_summary = comparison_summary.sort_values('Global_Fit', ascending=False)
+    comparison_summary['Rank'] = range(1, len(comparison_summary) + 1)
+
+    column_order = ['Rank', 'SOM_Config', 'Global_Fit', 'Cramers_V',
+                    'Percent_Zero_Entries', 'Total_Samples', 'Active_Neurons',
+                    'Total_Neurons', 'Utilization', 'P_Value']
+    return comparison_summary[column_order]
+
+
+def normalize_confusion_matrix(confusion_matrix):
+    """
+    Normalize confusion matrix rows to percentages with one broadcast division.
+
+    Each row sums to 100; rows without observations stay at 0.
+
+    Args:
+        confusion_matrix (pd.DataFrame): Confusion matrix with counts
+
+    Returns:
+        pd.DataFrame: Row percentages with the same labels
+    """
+    counts = confusion_matrix.to_numpy(dtype=float)
+    row_sums = counts.sum(axis=1, keepdims=True)
+
+    has_observations = row_sums > 0
+    zero_rows = int(np.count_nonzero(~has_observations))
+    if zero_rows:
+        print(f"Warning: Found {zero_rows} rows with no observations - keeping as 0%")
+
+    normalized = np.divide(counts, row_sums, out=np.zeros_like(counts), where=has_observations)
+    normalized *= 100
+    return pd.DataFrame(normalized, index=confusion_matrix.index, columns=confusion_matrix.columns)
+
+
+# id(confusion matrix view) -> its normalized view; entries are dropped with the view
+_NORMALIZED_VIEWS = {}
+
+
+def cached_normalized_confusion_matrix(confusion_matrix):
+    """
+    Normalized view of a confusion matrix, computed once per matrix object.
+
+    Sheet results keep their confusion matrix view, so the normalized view of
+    each sheet is computed on first use and then looked up until the result
+    is discarded. Matrices must not be modified after they were normalized.
+
+    Args:
+        confusion_matrix (pd.DataFrame): Confusion matrix with counts
+
+    Returns:
+        pd.DataFrame: See normalize_confusion_matrix (shared between calls; do not modify)
+    """
+    key = id(confusion_matrix)
+    normalized = _NORMALIZED_VIEWS.get(key)
+    if normalized is None:
+        normalized = normalize_confusion_matrix(confusion_matrix)
+        _NORMALIZED_VIEWS[key] = normalized
+        weakref.finalize(confusion_matrix, _NORMALIZED_VIEWS.pop, key, None)
+    return normalized
+
+
+def sheet_contingency_statistics(sheet_data):
+    """Return the contingency statistics of a sheet result, computing them if the result has none"""
+    stats = sheet_data.get('contingency_stats')
+    if stats is None:
+        stats = contingency_statistics(np.asarray(sheet_data['confusion_matrix']))
+    return stats
+
+
+def qc_grade_summary(p_value, cramers_v, accuracy_score, expected_freq_ok):
+    """
+    Calculate comprehensive QC grade based on multiple statistical and quality criteria.
+
+    Args:
+        p_value (float): Statistical significance p-value
+        cramers_v (float): Cramer's V effect size measure
+        accuracy_score (float): Classification accuracy (0-1)
+        expected_freq_ok (bool): Whether expected frequencies meet chi-square assumptions
+
+    Returns:
+        dict: Letter grade (A, B, C, D, F) with its score, explanation and details
+    """
+    grade_points = 0
+    max_points = 15
+    grade_details = []
+
+    # P-value scoring (0-5 points) - Statistical significance
+    if p_value < 0.001:
+        grade_points += 5
+        grade_details.append("Excellent statistical significance (p < 0.001)")
+    elif p_value < 0.01:
+        grade_points += 4
+        grade_details.append("Very good statistical significance (p < 0.01)")
+    elif p_value < 0.05:
+        grade_points += 3
+        grade_details.append("Good statistical significance (p < 0.05)")
+    elif p_value < 0.1:
+        grade_points += 2
+        grade_details.append("Moderate statistical significance (p < 0.1)")
+    elif p_value < 0.2:
+        grade_points += 1
+        grade_details.append("Weak statistical significance (p < 0.2)")
+    else:
+        grade_details.append("No statistical significance (p >= 0.2)")
+
+    # Effect size scoring (0-5 points) - Practical significance
+    if cramers_v >= 0.7:
+        grade_points += 5
+        grade_details.append("Very large effect size (Cramer's V ≥ 0.7)")
+    elif cramers_v >= 0.5:
+        grade_points += 4
+        grade_details.append("Large effect size (Cramer's V ≥ 0.5)")
+    elif cramers_v >= 0.3:
+        grade_points += 3
+        grade_details.append("Medium effect size (Cramer's V ≥ 0.3)")
+    elif cramers_v >= 0.1:
+        grade_points += 2
+        grade_details.append("Small effect size (Cramer's V ≥ 0.1)")
+    elif cramers_v > 0:
+        grade_points += 1
+        grade_details.append("Minimal effect size (Cramer's V > 0)")
+    else:
+        grade_details.append("No effect size (Cramer's V = 0)")
+
+    # Accuracy scoring (0-3 points) - Classification performance
+    if accuracy_score >= 0.9:
+        grade_points += 3
+        grade_details.append("Excellent classification accuracy (≥ 90%)")
+    elif accuracy_score >= 0.8:
+        grade_points += 2.5
+        grade_details.append("Very good classification accuracy (≥ 80%)")
+    elif accuracy_score >= 0.7:
+        grade_points += 2
+        grade_details.append("Good classification accuracy (≥ 70%)")
+    elif accuracy_score >= 0.6:
+        grade_points += 1.5
+        grade_details.append("Fair classification accuracy (≥ 60%)")
+    elif accuracy_score >= 0.5:
+        grade_points += 1
+        grade_details.append("Poor classification accuracy (≥ 50%)")
+    else:
+        grade_details.append("Very poor classification accuracy (< 50%)")
+
+    # Expected frequency validity (0-2 points) - Statistical assumptions
+    if expected_freq_ok:
+        grade_points += 2
+        grade_details.append("Chi-square assumptions met (expected frequencies ≥ 5)")
+    else:
+        grade_details.append("Chi-square assumptions violated (some expected frequencies < 5)")
+
+    percentage_score = (grade_points / max_points) * 100
+
+    if percentage_score >= 90:
+        grade = 'A'
+        grade_explanation = "Excellent quality - Results are highly reliable and statistically robust"
+    elif percentage_score >= 80:
+        grade = 'B'
+        grade_explanation = "Very good quality - Results are reliable with minor limitations"
+    elif percentage_score >= 70:
+        grade = 'C'
+        grade_explanation = "Good quality - Results are acceptable but with some limitations"
+    elif percentage_score >= 60:
+        grade = 'D'
+        grade_explanation = "Fair quality - Results have significant limitations and should be interpreted with caution"
+    else:
+        grade = 'F'
+        grade_explanation = "Poor quality - Results are unreliable and should not be used for decision making"
+
+    return {
+        'letter_grade': grade,
+        'percentage_score': percentage_score,
+        'points_earned': grade_points,
+        'max_points': max_points,
+        'explanation': grade_explanation,
+        'details': grade_details
+    }
+
+
+def chi_square_qc_summary(sheet_data):
+    """
+    Chi-square test QC summary of a sheet result.
+
+    Reuses the contingency statistics computed during the analysis. Summaries
+    of SheetResult records are computed once and kept with the record, so
+    repeated panel refreshes, exports and reports only look them up.
+
+    Args:
+        sheet_data (SheetResult or dict): Sheet result
+
+    Returns:
+        dict: Test validity, chi-square statistic, p-value, effect size,
+            expected frequency check, QC status, QC grade and accuracy
+            (shared between calls for records; do not modify)
+    """
+    if isinstance(sheet_data, SheetResult):
+        return sheet_data.qc_summary()
+    return _chi_square_qc_summary(sheet_data)
+
+
+def _chi_square_qc_summary(sheet_data):
+    """Compute the chi-square test QC summary of a sheet result (see chi_square_qc_summary)"""
+    if not sheet_data or 'confusion_matrix' not in sheet_data:
+        return {
+            'test_valid': False,
+            'chi2_statistic': 0,
+            'p_value': 1.0,
+            'effect_size': 0.0,
+            'expected_freq_ok': False,
+            'qc_status': 'No data available',
+            'qc_grade': 'F',
+            'accuracy_score': 0.0
+        }
+
+    try:
+        stats = sheet_contingency_statistics(sheet_data)
+
+        if stats['total_observations'] == 0:
+            return {
+                'test_valid': False,
+                'chi2_statistic': 0,
+                'p_value': 1.0,
+                'effect_size': 0.0,
+                'expected_freq_ok': False,
+                'qc_status': 'No observations in confusion matrix',
+                'qc_grade': 'F',
+                'accuracy_score': 0.0
+            }
+
+        if not stats['chi2_valid']:
+            raise ValueError("Expected frequency table has a zero element")
+        chi2, p_value = stats['chi2'], stats['p_value']
+        cramers_v = stats['cramers_v']
+
+        # Expected frequencies should be >= 5 for chi-square validity
+        expected_freq_ok = stats['low_expected_count'] == 0
+        accuracy_score = stats['accuracy']
+
+        qc_grade = qc_grade_summary(p_value, cramers_v, accuracy_score, expected_freq_ok)['letter_grade']
+
+        if p_value < 0.001:
+            qc_status = "Highly significant association"
+        elif p_value < 0.01:
+            qc_status = "Very significant association"
+        elif p_value < 0.05:
+            qc_status = "Significant association"
+        else:
+            qc_status = "No significant association"
+
+        return {
+            'test_valid': True,
+            'chi2_statistic': chi2,
+            'p_value': p_value,
+            'effect_size': cramers_v,
+            'expected_freq_ok': expected_freq_ok,
+            'qc_status': qc_status,
+            'qc_grade': qc_grade,
+            'accuracy_score': accuracy_score
+        }
+
+    except Exception as e:
+        return {
+            'test_valid': False,
+            'chi2_statistic': 0,
+            'p_value': 1.0,
+            'effect_size': 0.0,
+            'expected_freq_ok': False,
+            'qc_status': f'Error in analysis: {str(e)[:50]}',
+            'qc_grade': 'F',
+            'accuracy_score': 0.0
+        }
+
+
+def overall_qc_grade(sheet_data, chi_square_qc):
+    """Calculate the overall QC letter grade of a sheet from its metrics and chi-square QC"""
+    try:
+        accuracy_score = min(sheet_data.get('global_fit', 0) / 100, 1.0)
+        effect_size_score = min(sheet_data.get('cramers_v', 0), 1.0)
+        sample_size_score = min(sheet_data.get('total_observations', 0) / 1000, 1.0)
+        validity_score = 1.0 if chi_square_qc.get('test_valid', False) else 0.5
+
+        overall_score = (
+            accuracy_score * 0.4 +     # Classification accuracy (40%)
+            effect_size_score * 0.3 +  # Effect size strength (30%)
+            sample_size_score * 0.2 +  # Sample adequacy (20%)
+            validity_score * 0.1       # Test validity (10%)
+        ) * 100
+
+        if overall_score >= 85:
+            return 'A'
+        elif overall_score >= 75:
+            return 'B'
+        elif overall_score >= 65:
+            return 'C'
+        elif overall_score >= 50:
+            return 'D'
+        else:
+            return 'F'
+
+    except Exception:
+        return 'F'
+
+
+def comparison_readiness_status(sheet_results_dict):
+    """Sheet comparison readiness analysis"""
+    if not sheet_results_dict:
+        return {
+            'total_sheets': 0,
+            'comparable_sheets': 0,
+            'readiness_score': 0.0,
+            'comparison_groups': {'high_quality': [], 'medium_quality': [], 'low_quality': []},
+            'readiness_warnings': ['No sheets available']
+        }
+
+    try:
+        total_sheets = len(sheet_results_dict)
+        comparable_sheets = 0
+        comparison_groups = {'high_quality': [], 'medium_quality': [], 'low_quality': []}
+        readiness_warnings = []
+
+        for sheet_name, sheet_data in sheet_results_dict.items():
+            if not sheet_data:
+                continue
+
+            global_fit = sheet_data.get('global_fit', 0)
+            cramers_v = sheet_data.get('cramers_v', 0)
+            total_observations = sheet_data.get('total_observations', 0)
+            percent_undefined = sheet_data.get('percent_undefined', 100)
+
+            quality_score = (
+                (global_fit / 100) * 0.4 +
+                cramers_v * 0.3 +
+                min(total_observations / 1000, 1.0) * 0.2 +
+                (100 - percent_undefined) / 100 * 0.1
+            ) * 100
+
+            if quality_score >= 75:
+                comparison_groups['high_quality'].append(sheet_name)
+                comparable_sheets += 1
+            elif quality_score >= 50:
+                comparison_groups['medium_quality'].append(sheet_name)
+                comparable_sheets += 1
+            else:
+                comparison_groups['low_quality'].append(sheet_name)
+
+            if total_observations < 100:
+                readiness_warnings.append(f'{sheet_name}: Small sample size')
+            if percent_undefined > 50:
+                readiness_warnings.append(f'{sheet_name}: High undefined neurons')
+            if global_fit < 50:
+                readiness_warnings.append(f'{sheet_name}: Low accuracy')
+
+        readiness_score = (comparable_sheets / total_sheets * 100) if total_sheets > 0 else 0
+
+        return {
+            'total_sheets': total_sheets,
+            'comparable_sheets': comparable_sheets,
+            'readiness_score': readiness_score,
+            'comparison_groups': comparison_groups,
+            'readiness_warnings': readiness_warnings
+        }
+
+    except Exception as e:
+        return {
+            'total_sheets': len(sheet_results_dict) if sheet_results_dict else 0,
+            'comparable_sheets': 0,
+            'readiness_score': 0.0,
+            'comparison_groups': {'high_quality': [], 'medium_quality': [], 'low_quality': []},
+            'readiness_warnings': [f'Analysis error: {str(e)[:50]}']
+        }
+
+
+def format_memory_report(memory_report):
+    """
+    Render a MemoryBudget.report() as the memory section of the QC report.
+
+    Args:
+        memory_report (dict): Memory accounting summary
+
+    Returns:
+        str: Report section
+    """
+    peak_process = memory_report.get('peak_process_mb')
+    section = f"""
+
+MEMORY USAGE:
+{'='*30}
+Memory Budget: {memory_report['limit_mb']:g} MB
+Peak Accounted Data: {memory_report['peak_accounted_mb']:.1f} MB
+Peak Process Memory: {f'{peak_process:.1f} MB' if peak_process is not None else 'Unknown'}
+Sheets Spilled to Disk: {len(memory_report['spilled_sheets'])}
+"""
+    if memory_report['stage_peak_mb']:
+        section += "Peak by Stage:\n"
+    for stage, peak in sorted(memory_report['stage_peak_mb'].items()):
+        section += f"  {stage}: {peak:.1f} MB\n"
+    if memory_report['largest_sheets_mb']:
+        section += "Largest Sheets:\n"
+        for sheet_name, size in memory_report['largest_sheets_mb']:
+            section += f"  {sheet_name}: {size:.1f} MB\n"
+    if memory_report['actions']:
+        section += "Budget Actions:\n"
+        for action in memory_report['actions']:
+            section += f"• {action}\n"
+    return section
+
+
+def format_qc_report(batch_results, file_label='Unknown', memory_report=None):
+    """
+    Render the comprehensive QC report of a batch as text.
+
+    Args:
+        batch_results (dict): Sheet name -> result dictionary
+        file_label (str): Workbook name shown in the report header
+        memory_report (dict, optional): MemoryBudget.report() appended as a memory section
+
+    Returns:
+        str: Report content
+    """
+    readiness_status = comparison_readiness_status(batch_results)
+
+    report_content = f"""GEOPHYSICS QC ANALYSIS REPORT
+{'='*60}
+Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+File: {file_label}
+
+EXECUTIVE SUMMARY:
+Total Sheets Analyzed: {readiness_status['total_sheets']}
+Sheets Ready for Comparison: {readiness_status['comparable_sheets']}
+Overall Readiness Score: {readiness_status['readiness_score']:.1f}%
+
+QUALITY DISTRIBUTION:
+High Quality (Grade A/B): {len(readiness_status['comparison_groups']['high_quality'])}
+Medium Quality (Grade C): {len(readiness_status['comparison_groups']['medium_quality'])}
+Low Quality (Grade D/F): {len(readiness_status['comparison_groups']['low_quality'])}
+
+DETAILED SHEET ANALYSIS:
+{'='*60}
+"""
+
+    for sheet_name, sheet_data in batch_results.items():
+        chi_square_qc = chi_square_qc_summary(sheet_data)
+        qc_grade = overall_qc_grade(sheet_data, chi_square_qc)
+
+        report_content += f"""
+Sheet: {sheet_name}
+QC Grade: {qc_grade}
+Observations: {sheet_data.get('total_observations', 0):,}
+Classification Accuracy: {sheet_data.get('global_fit', 0):.2f}%
+Effect Size (Cramer's V): {sheet_data.get('cramers_v', 0):.4f}
+Chi-square Valid: {'Yes' if chi_square_qc.get('test_valid') else 'No'}
+Statistical Significance: {chi_square_qc.get('qc_status', 'Unknown')}
+Matrix Dimensions: {sheet_data.get('matrix_shape', 'Unknown')}
+{'-'*40}"""
+
+    if readiness_status['readiness_warnings']:
+        report_content += f"""
+
+QUALITY WARNINGS:
+{'='*30}
+"""
+        for warning in readiness_status['readiness_warnings']:
+            report_content += f"• {warning}\n"
+
+    if memory_report:
+        report_content += format_memory_report(memory_report)
+
+    return report_content
@@ -0,0 +1,113 @@
+"""
+Contingency Analysis Cache Directory - Geophysics Contingency Analysis Tool v1.0
+
+Copyright (C) 2025 TraceSeis, Inc. All rights reserved.
+
+Size-capped directory of cache files shared by the analysis cache and the
+figure cache. Each entry is one file named after its key. Files are written
+to a temporary name and renamed into place, so several application
+instances (and process pool workers) can share the directory: readers see
+either a complete entry or none. Reading an entry marks it as used, and the
+least recently used entries are removed once the directory exceeds its size
+cap.
+"""
+
+import os
+import tempfile
+
+
+class CacheDirectory:
+    """
+    Directory of cache entries, one file per key, trimmed to max_bytes by last use.
+
+    The directory is created on the first write.
+    """
+
+    def __init__(self, path, suffix, max_bytes):
+        """
+        Args:
+            path (str or Path): Cache directory
+            suffix (str): File name suffix of the entries (e.g. '.npz')
+            max_bytes (int): Size cap of the directory
+        """
+        self.path = str(path)
+        self.suffix = suffix
+        self.max_bytes = max_bytes
+
+    def entry_path(self, key):
+        """Path of the file of an entry"""
+        return os.path.join(self.path, f"{key}{self.suffix}")
+
+    @staticmethod
+    def touch(path):
+        """Mark an entry as recently used for LRU eviction"""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def write(self, key, write_entry):
+        """
+        Atomically write an entry and trim the directory to its size cap.
+
+        Args:
+            key (str): Entry key
+            write_entry (callable): Called with the binary file object to write the entry to
+
+        Raises:
+            OSError: If the entry cannot be written; no partial entry is left behind
+        """
+        tmp_path = None
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                write_entry(f)
+            os.replace(tmp_path, self.entry_path(key))
+            tmp_path = None
+            self.evict()
+        finally:
+            if tmp_path:
+                self.remove(tmp_path)
+
+    def entries(self):
+        """List (path, size, last use) for every entry in the directory"""
+        entries = []
+        try:
+            with os.scandir(self.path) as it:
+                for item in it:
+                    if not item.name.endswith(self.suffix):
+                        continue
+                    try:
+                        stat = item.stat()
+                    except OSError:
+                        continue
+                    entries.append((item.path, stat.st_size, stat.st_mtime))
+        except OSError:
+            pass
+        return entries
+
+    def evict(self):
+        """Remove least recently used entries until the directory fits in max_bytes"""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+        for path, size, _ in sorted(entries, key=lambda entry: entry[2]):
+            if total <= self.max_bytes:
+                break
+            self.remove(path)
+            total -= size
+
+    def clear(self):
+        """Remove all entries"""
+        for path, _, _ in self.entries():
+            self.remove(path)
+
+    @staticmethod
+    def remove(path):
+        """Delete a file, ignoring errors"""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,234 @@
+"""
+Contingency Analysis Figure Cache - Geophysics Contingency Analysis Tool v1.0
+
+Copyright (C) 2025 TraceSeis, Inc. All rights reserved.
+
+Cache of rendered charts. A chart is rasterized to PNG once and stored under
+a key made of the hash of the data and options it shows (title, colormap,
+...), the chart type, its size, DPI and the normalization state, so redrawing the same
+view (e.g. toggling matrix normalization back and forth, or reopening the
+visualization window) reuses the image instead of running matplotlib
+again. Images are held in a memory-bounded LRU and, optionally, in a
+size-capped directory shared by application instances. matplotlib is not
+imported by this module.
+"""
+
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from contingency_diskcache import CacheDirectory
+from contingency_trace import traced
+
+# Version of the chart drawing code; bump when cached images must be redrawn
+FIGURE_VERSION = "2"
+
+_PNG_SUFFIX = '.png'
+
+
+def data_hash(data):
+    """
+    Hash the content of the data shown by a chart.
+
+    Args:
+        data: DataFrame, Series, array, scalar, or a tuple, list or dict of these
+
+    Returns:
+        str: Hex digest of the values, labels and dtypes
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    _update_digest(digest, data)
+    return digest.hexdigest()
+
+
+def _update_digest(digest, data):
+    if isinstance(data, pd.DataFrame):
+        digest.update(repr((list(data.index), list(data.columns), [str(dtype) for dtype in data.dtypes])).encode())
+        digest.update(np.ascontiguousarray(data.to_numpy()).tobytes()
+                      if all(dtype.kind in 'biuf' for dtype in data.dtypes)
+                      else pd.util.hash_pandas_object(data, index=False).values.tobytes())
+    elif isinstance(data, pd.Series):
+        digest.update(repr((list(data.index), str(data.dtype))).encode())
+        digest.update(pd.util.hash_pandas_object(data, index=False).values.tobytes())
+    elif isinstance(data, np.ndarray):
+        digest.update(repr((data.shape, str(data.dtype))).encode())
+        digest.update(np.ascontiguousarray(data).tobytes() if data.dtype != object else repr(data.tolist()).encode())
+    elif isinstance(data, dict):
+        digest.update(f"dict{len(data)}".encode())
+        for key in sorted(data, key=str):
+            _update_digest(digest, key)
+            _update_digest(digest, data[key])
+    elif isinstance(data, (list, tuple)):
+        digest.update(f"{type(data).__name__}{len(data)}".encode())
+        for item in data:
+            _update_digest(digest, item)
+    else:
+        digest.update(repr(data).encode())
+
+
+def figure_key(data_digest, chart, size, dpi, normalized=False):
+    """
+    Build the cache key of a rendered chart.
+
+    Args:
+        data_digest (str): Hash of the chart data and options (see data_hash)
+        chart (str): Chart type
+        size (tuple): Figure size in inches (width, height)
+        dpi (int): Rendering resolution
+        normalized (bool): Whether the chart shows normalized matrices
+
+    Returns:
+        str: Hex digest identifying the image
+    """
+    parts = (FIGURE_VERSION, data_digest, chart, tuple(size), int(dpi), bool(normalized))
+    return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+
+def rasterize(fig, dpi):
+    """
+    Render a matplotlib figure to PNG bytes.
+
+    Args:
+        fig (matplotlib.figure.Figure): Figure to render
+        dpi (int): Rendering resolution
+
+    Returns:
+        bytes: PNG image
+    """
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=dpi, facecolor=fig.get_facecolor())
+    return buffer.getvalue()
+
+
+class FigureCache:
+    """
+    Two-tier LRU cache of rendered charts (PNG bytes).
+
+    The memory tier holds at most max_bytes of images and evicts the least
+    recently used ones. When a directory is given, images are also written
+    there (see contingency_diskcache.CacheDirectory) and read back on a
+    memory miss; the directory is trimmed to max_disk_bytes by last use.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, directory=None, max_disk_bytes=128 * 1024 * 1024):
+        """
+        Args:
+            max_bytes (int): Size cap of the memory tier; 0 keeps images on disk only
+            directory (str or Path, optional): Directory of the disk tier, created on first write
+            max_disk_bytes (int): Size cap of the disk tier
+        """
+        self.max_bytes = max_bytes
+        self._disk = CacheDirectory(directory, _PNG_SUFFIX, max_disk_bytes) if directory else None
+        self._images = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._images)
+
+    def get(self, key):
+        """
+        Look up a rendered chart.
+
+        Args:
+            key (str): Key from figure_key
+
+        Returns:
+            bytes: PNG image, or None on a miss
+        """
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+                self.hits += 1
+                return image
+
+        image = self._read_disk(key)
+        with self._lock:
+            if image is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        self._remember(key, image)
+        return image
+
+    def put(self, key, image):
+        """
+        Store a rendered chart in both tiers.
+
+        Args:
+            key (str): Key from figure_key
+            image (bytes): PNG image
+
+        Returns:
+            bytes: The stored image
+        """
+        self._remember(key, image)
+        self._write_disk(key, image)
+        return image
+
+    @traced('render', name='figure_cache_render')
+    def render(self, key, draw, dpi):
+        """
+        Return the cached image of a chart, drawing and storing it on a miss.
+
+        Args:
+            key (str): Key from figure_key
+            draw (callable): Returns the matplotlib Figure of the chart
+            dpi (int): Rendering resolution
+
+        Returns:
+            bytes: PNG image
+        """
+        image = self.get(key)
+        if image is None:
+            image = self.put(key, rasterize(draw(), dpi))
+        return image
+
+    def clear(self):
+        """Empty the memory tier and remove the images of the disk tier"""
+        with self._lock:
+            self._images.clear()
+            self._bytes = 0
+        if self._disk is not None:
+            self._disk.clear()
+
+    def _remember(self, key, image):
+        with self._lock:
+            previous = self._images.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            if len(image) > self.max_bytes:
+                return
+            self._images[key] = image
+            self._bytes += len(image)
+            while self._bytes > self.max_bytes:
+                _, evicted = self._images.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def _read_disk(self, key):
+        if self._disk is None:
+            return None
+        path = self._disk.entry_path(key)
+        try:
+            with open(path, 'rb') as f:
+                image = f.read()
+        except OSError:
+            return None
+        self._disk.touch(path)
+        return image
+
+    def _write_disk(self, key, image):
+        """Write an image to the disk tier. Failures are reported and otherwise ignored."""
+        if self._disk is None:
+            return
+        try:
+            self._disk.write(key, lambda f: f.write(image))
+        except Exception as e:
+            print(f"Warning: Could not write figure cache entry: {e}")
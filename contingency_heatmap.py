@@ -0,0 +1,361 @@
+"""
+Contingency Analysis Heatmaps - Geophysics Contingency Analysis Tool v1.0
+
+Copyright (C) 2025 TraceSeis, Inc. All rights reserved.
+
+Heatmap drawing for large matrices. seaborn.heatmap draws one mesh cell and
+one Text artist per matrix cell, which takes seconds on 40x40 facies
+matrices and 100-neuron SOM matrices. fast_heatmap draws the same chart
+with a single image whose colours are mapped in one vectorized step, and
+annotates the cells through one artist that, at draw time, writes the
+labels of the cells in view when they fit inside their cells at the
+current size and zoom. Small matrices look the same as with seaborn: every
+label fits and is drawn in the same place, font and colour.
+
+This module imports matplotlib; import it from drawing code only.
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+from matplotlib import colormaps
+from matplotlib.artist import Artist
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import Colormap, ListedColormap, Normalize
+from matplotlib.text import Text
+
+# Relative luminance above which annotations are dark instead of white (as seaborn)
+DARK_TEXT_LUMINANCE = 0.408
+
+# Annotation colours on light and dark cells (as seaborn)
+DARK_TEXT_COLOR = '.15'
+LIGHT_TEXT_COLOR = 'w'
+
+
+def relative_luminance(rgba):
+    """
+    Relative luminance of colours (WCAG definition).
+
+    Args:
+        rgba (np.ndarray): RGB(A) colours in 0..1, colour channels on the last axis
+
+    Returns:
+        np.ndarray: Luminance of every colour
+    """
+    rgb = np.asarray(rgba, dtype=float)[..., :3]
+    rgb = np.where(rgb <= 0.03928, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    return rgb @ np.array([0.2126, 0.7152, 0.0722])
+
+
+def text_colors(rgba):
+    """
+    Annotation colours that stay readable on the given cell colours.
+
+    Args:
+        rgba (np.ndarray): Cell colours, channels on the last axis
+
+    Returns:
+        np.ndarray: DARK_TEXT_COLOR or LIGHT_TEXT_COLOR for every cell
+    """
+    return np.where(relative_luminance(rgba) > DARK_TEXT_LUMINANCE, DARK_TEXT_COLOR, LIGHT_TEXT_COLOR)
+
+
+def format_labels(values, fmt):
+    """
+    Format matrix values as annotation strings.
+
+    Args:
+        values (np.ndarray): 2-D values; masked entries get an empty label
+        fmt (str): Format specification (e.g. 'd', '.1f')
+
+    Returns:
+        np.ndarray: 2-D array of strings
+    """
+    values = np.ma.asarray(values)
+    shown = ~np.ma.getmaskarray(values)
+    labels = np.full(values.shape, '', dtype=object)
+    if shown.any():
+        unique, inverse = np.unique(np.ma.getdata(values)[shown], return_inverse=True)
+        spec = "{:" + fmt + "}"
+        labels[shown] = np.array([spec.format(value) for value in unique.tolist()], dtype=object)[inverse.ravel()]
+    return labels
+
+
+class CellAnnotations(Artist):
+    """
+    Labels of the cells of a heatmap, drawn as a single artist.
+
+    At draw time the cells inside the view limits are written, by moving one
+    Text through them, when their labels fit in the cells at the current
+    axes size, zoom and resolution. The artist is left out of layout
+    computations such as tight_layout.
+    """
+
+    zorder = 3
+
+    def __init__(self, labels, colors, offset=0.5, **text_kws):
+        """
+        Args:
+            labels (np.ndarray): 2-D array of label strings ('' for none)
+            colors: Text colour of every cell (2-D array) or one colour for all
+            offset (float): Data coordinate of the centre of the first cell
+            **text_kws: Text properties (fontsize, fontweight, ...)
+        """
+        super().__init__()
+        self.labels = np.asarray(labels, dtype=object)
+        self.colors = np.asarray(colors, dtype=object) if np.ndim(colors) == 2 else colors
+        self.offset = offset
+        self._text = Text(0, 0, '', ha='center', va='center', **text_kws)
+        self._widths = {}
+        self._widths_dpi = None
+        self.set_in_layout(False)
+
+    def _visible_range(self, limits, count):
+        low, high = sorted(limits)
+        first = max(0, math.ceil(low - self.offset))
+        last = min(count - 1, math.floor(high - self.offset))
+        return range(first, last + 1)
+
+    def _label_width(self, renderer, label):
+        width = self._widths.get(label)
+        if width is None:
+            width, _, _ = renderer.get_text_width_height_descent(label, self._text.get_fontproperties(), ismath=False)
+            self._widths[label] = width
+        return width
+
+    def legible_cells(self, renderer):
+        """
+        Cells whose label is drawn at the current size.
+
+        Labels are drawn when every label in view fits inside its cell, so a
+        crowded matrix is never partly labelled (small counts shown, large
+        ones hidden).
+
+        Args:
+            renderer: Renderer the figure is drawn with
+
+        Returns:
+            list: (row, column) of every labelled cell in view
+        """
+        axes = self.axes
+        (x0, y0), (x1, y1) = axes.transData.transform([(0, 0), (1, 1)])
+        cell_width, cell_height = abs(x1 - x0), abs(y1 - y0)
+
+        if renderer.dpi != self._widths_dpi:
+            self._widths = {}
+            self._widths_dpi = renderer.dpi
+        _, text_height, _ = renderer.get_text_width_height_descent('0', self._text.get_fontproperties(), ismath=False)
+        if cell_height < text_height:
+            return []
+
+        rows = self._visible_range(axes.get_ylim(), self.labels.shape[0])
+        columns = self._visible_range(axes.get_xlim(), self.labels.shape[1])
+        cells = [(i, j) for i in rows for j in columns if self.labels[i, j]]
+        in_view = set(self.labels[i, j] for i, j in cells)
+        if any(self._label_width(renderer, label) > cell_width for label in in_view):
+            return []
+        return cells
+
+    def draw(self, renderer):
+        if not self.get_visible() or self.axes is None:
+            return
+
+        text = self._text
+        text.set_figure(self.figure)
+        text.set_transform(self.axes.transData)
+        text.set_clip_box(self.axes.bbox)
+        single_color = not isinstance(self.colors, np.ndarray)
+        if single_color:
+            text.set_color(self.colors)
+
+        renderer.open_group('cell_annotations', gid=self.get_gid())
+        for i, j in self.legible_cells(renderer):
+            text.set_position((j + self.offset, i + self.offset))
+            text.set_text(self.labels[i, j])
+            if not single_color:
+                text.set_color(self.colors[i, j])
+            text.draw(renderer)
+        renderer.close_group('cell_annotations')
+        self.stale = False
+
+
+def annotate_cells(ax, labels, colors, offset=0.5, **text_kws):
+    """
+    Add adaptive cell labels to an axes (see CellAnnotations).
+
+    Args:
+        ax (matplotlib.axes.Axes): Axes showing the matrix
+        labels (np.ndarray): 2-D array of label strings
+        colors: Text colour of every cell (2-D array) or one colour for all
+        offset (float): Data coordinate of the centre of the first cell
+        **text_kws: Text properties
+
+    Returns:
+        CellAnnotations: The added artist
+    """
+    annotations = CellAnnotations(labels, colors, offset=offset, **text_kws)
+    ax.add_artist(annotations)
+    return annotations
+
+
+def _tick_labels(index, labels):
+    if labels is True:
+        if isinstance(index, pd.MultiIndex):
+            return ["-".join(map(str, values)) for values in index.values]
+        return list(index.values)
+    if labels is False or labels is None:
+        return []
+    return list(labels)
+
+
+def _axis_label(index):
+    if isinstance(index, pd.MultiIndex):
+        return "-".join(map(str, index.names))
+    return "" if index.name is None else str(index.name)
+
+
+def _renderer(fig):
+    """Renderer of the figure's canvas; a figure created without one (Figure()) gets an Agg canvas"""
+    canvas = fig.canvas
+    if not hasattr(canvas, 'get_renderer'):
+        canvas = FigureCanvasAgg(fig)
+    return canvas.get_renderer()
+
+
+def _overlap(extents, spacing):
+    return len(extents) > 1 and bool(np.any((extents[:-1] + extents[1:]) / 2 > spacing))
+
+
+def _set_tick_labels(ax, labels, axis):
+    """
+    Label the cells along one axis, as seaborn does: labels start horizontal
+    (x) or vertical (y) and are turned when neighbours overlap. Labels that
+    still overlap after turning are thinned to every n-th cell.
+    """
+    set_ticks, set_labels = (ax.set_xticks, ax.set_xticklabels) if axis == 'x' else (ax.set_yticks, ax.set_yticklabels)
+    if not labels:
+        set_ticks([])
+        return
+
+    count = len(labels)
+    bbox = ax.get_window_extent()
+    spacing = (bbox.width if axis == 'x' else bbox.height) / count
+    first, turned = ('horizontal', 'vertical') if axis == 'x' else ('vertical', 'horizontal')
+
+    set_ticks(np.arange(count) + 0.5)
+    texts = set_labels(labels, rotation=first)
+    if axis == 'y':
+        for text in texts:
+            text.set_va('center')
+
+    # Size of every label, measured once; turning a label by 90 degrees swaps its sides
+    renderer = _renderer(ax.figure)
+    sizes = np.array([(extent.width, extent.height) for extent in
+                      (text.get_window_extent(renderer) for text in texts)])
+    along, across = (sizes[:, 0], sizes[:, 1]) if axis == 'x' else (sizes[:, 1], sizes[:, 0])
+    if not _overlap(along, spacing):
+        return
+    for text in texts:
+        text.set_rotation(turned)
+    if not _overlap(across, spacing):
+        return
+
+    step = max(2, math.ceil(across.max() / max(spacing, 1e-9)))
+    set_ticks(np.arange(0, count, step) + 0.5)
+    texts = set_labels(labels[::step], rotation=turned)
+    if axis == 'y':
+        for text in texts:
+            text.set_va('center')
+
+
+def fast_heatmap(data, ax, annot=True, fmt='.2g', cmap=None, vmin=None, vmax=None, cbar=True, cbar_kws=None,
+                 linewidths=0, linecolor='white', square=False, xticklabels=True, yticklabels=True,
+                 annot_kws=None):
+    """
+    Draw a heatmap the way seaborn.heatmap does, for matrices of any size.
+
+    Cells are one image (colours mapped in a single vectorized step), grid
+    lines are two line collections, and annotations are one artist that
+    writes only the labels that are legible at the current size.
+
+    Args:
+        data (pd.DataFrame or array-like): 2-D matrix; NaN cells are left blank
+        ax (matplotlib.axes.Axes): Axes to draw in
+        annot (bool or array-like): Annotate cells with their values, or with these values
+        fmt (str): Annotation format specification
+        cmap (str or Colormap): Colormap (default: viridis)
+        vmin, vmax (float): Colour range (default: range of the data)
+        cbar (bool): Draw a colorbar
+        cbar_kws (dict): Keyword arguments of Figure.colorbar
+        linewidths (float): Width of the lines between cells
+        linecolor: Colour of the lines between cells
+        square (bool): Make cells square
+        xticklabels, yticklabels: True for the column/index labels, False for none, or a list
+        annot_kws (dict): Text properties of the annotations (a 'color' overrides the automatic one)
+
+    Returns:
+        matplotlib.axes.Axes: The axes
+
+    Raises:
+        ValueError: If the data is not 2-D or annot does not have its shape
+    """
+    if not isinstance(data, pd.DataFrame):
+        data = pd.DataFrame(np.asarray(data))
+    values = np.ma.masked_invalid(data.to_numpy(dtype=float))
+    if values.ndim != 2:
+        raise ValueError("Heatmap data must be 2-D")
+    n_rows, n_columns = values.shape
+
+    if vmin is None:
+        vmin = np.nanmin(values.filled(np.nan)) if values.count() else 0.0
+    if vmax is None:
+        vmax = np.nanmax(values.filled(np.nan)) if values.count() else 1.0
+    if cmap is None:
+        cmap = colormaps['viridis']
+    elif isinstance(cmap, str):
+        cmap = colormaps[cmap]
+    elif not isinstance(cmap, Colormap):
+        cmap = ListedColormap(cmap)
+    norm = Normalize(vmin, vmax)
+
+    # Rounded to bytes the way Agg converts the colours of a mesh
+    rgba = np.floor(cmap(norm(values)) * 255 + 0.5).astype(np.uint8)
+    ax.imshow(rgba, interpolation='nearest', aspect='equal' if square else 'auto',
+              extent=(0, n_columns, n_rows, 0))
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+
+    if linewidths:
+        # Aliased like the cell edges of a mesh
+        ax.hlines(np.arange(n_rows + 1), 0, n_columns, colors=linecolor, linewidths=linewidths, antialiased=False)
+        ax.vlines(np.arange(n_columns + 1), 0, n_rows, colors=linecolor, linewidths=linewidths, antialiased=False)
+    ax.set_xlim(0, n_columns)
+    ax.set_ylim(n_rows, 0)
+
+    if cbar:
+        mappable = ScalarMappable(norm=norm, cmap=cmap)
+        colorbar = ax.figure.colorbar(mappable, ax=ax, **(cbar_kws or {}))
+        colorbar.outline.set_linewidth(0)
+
+    _set_tick_labels(ax, _tick_labels(data.columns, xticklabels), 'x')
+    _set_tick_labels(ax, _tick_labels(data.index, yticklabels), 'y')
+    ax.set_xlabel(_axis_label(data.columns))
+    ax.set_ylabel(_axis_label(data.index))
+
+    if annot is not None and annot is not False:
+        if isinstance(annot, bool):
+            annot_values = np.ma.array(np.ma.getdata(data.to_numpy()), mask=np.ma.getmaskarray(values))
+        else:
+            annot_values = np.asarray(annot)
+            if annot_values.shape != values.shape:
+                raise ValueError("`data` and `annot` must have same shape.")
+            annot_values = np.ma.array(annot_values, mask=np.ma.getmaskarray(values))
+        text_kws = dict(annot_kws or {})
+        colors = text_kws.pop('color', None)
+        if colors is None:
+            colors = text_colors(rgba / 255)
+        annotate_cells(ax, format_labels(annot_values, fmt), colors, **text_kws)
+
+    return ax
@@ -0,0 +1,318 @@
+"""
+Contingency Analysis Memory Budget - Geophysics Contingency Analysis Tool v1.0
+
+Copyright (C) 2025 TraceSeis, Inc. All rights reserved.
+
+Memory accounting for the analysis pipeline. The pipeline charges the size
+of the data it holds (raw sheets, count matrices, results) to a MemoryBudget
+per stage and per sheet. When the accounted total exceeds the budget the
+pipeline degrades instead of growing: pending count matrices are analyzed in
+smaller chunks, fewer sheets are analyzed concurrently, and the large
+arrays of finished sheet results are spilled to disk and read back on
+access. Peak usage and the actions taken are reported in the QC report.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_MEMORY_BUDGET_MB = 512
+
+_MB = 1024 * 1024
+
+
+def process_memory_mb():
+    """
+    Resident memory of this process in MB, or None if it cannot be determined.
+
+    Uses the current RSS from psutil when it is installed, otherwise the peak
+    RSS reported by the resource module on POSIX systems.
+    """
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / _MB
+    except ImportError:
+        pass
+
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+        return peak / _MB if sys.platform == 'darwin' else peak / 1024
+    except (ImportError, OSError):
+        return None
+
+
+def object_nbytes(obj):
+    """
+    Approximate memory held by a pipeline object.
+
+    DataFrames and Series include their index and string contents and sparse
+    matrices their stored entries and index arrays; dicts, lists and tuples
+    count their own size plus that of their values, and slotted records the
+    values of their slots. Spilled entries count as zero.
+    """
+    if isinstance(obj, SpilledValue):
+        return 0
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(index=True, deep=True).sum())
+    if isinstance(obj, pd.Series):
+        return int(obj.memory_usage(index=True, deep=True))
+    if isinstance(obj, np.ndarray):
+        return int(obj.nbytes)
+    sparse = sys.modules.get('scipy.sparse')
+    if sparse is not None and sparse.issparse(obj):
+        return sum(int(getattr(obj, part).nbytes) for part in ('data', 'indices', 'indptr') if hasattr(obj, part))
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(object_nbytes(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return sys.getsizeof(obj) + sum(object_nbytes(value) for value in obj)
+    slots = getattr(type(obj), '__slots__', None)
+    if slots:
+        return sys.getsizeof(obj) + sum(object_nbytes(getattr(obj, name, None)) for name in slots)
+    return 0
+
+
+class SpilledValue:
+    """
+    Stand-in for a result field (array or label tuple) that was written to disk.
+
+    The shape is kept in memory; any other attribute access, indexing or
+    iteration reads the object back and delegates to it. The object is read
+    on every access and not kept, so a spilled field stays out of memory (and
+    out of the budget) once the caller drops it. Call load() (or unspill) to
+    get the object itself, once per use.
+    """
+    __slots__ = ('path', 'shape')
+
+    def __init__(self, path, shape):
+        self.path = path
+        self.shape = shape
+
+    def load(self):
+        """Read the spilled object back from disk"""
+        return pd.read_pickle(self.path)
+
+    def __getattr__(self, name):
+        # Special names and slots not set yet (e.g. while unpickling) are not delegated
+        if name.startswith('__') or name in SpilledValue.__slots__:
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+    def __getitem__(self, key):
+        return self.load()[key]
+
+    def __iter__(self):
+        return iter(self.load())
+
+    def __len__(self):
+        return len(self.load())
+
+    def __contains__(self, key):
+        return key in self.load()
+
+    def __repr__(self):
+        return f"SpilledValue({self.path!r})"
+
+
+def unspill(value):
+    """Return the object behind a SpilledValue, or the value itself"""
+    return value.load() if isinstance(value, SpilledValue) else value
+
+
+class MemoryBudget:
+    """
+    Accounting of the memory held by the analysis pipeline against a budget.
+
+    Allocations are charged and released per stage (e.g. 'sheets',
+    'som_matrices', 'results', 'workers') and per sheet. The budget keeps the
+    peak of the accounted total and of each stage, samples the process RSS,
+    and records every degradation it triggers.
+    """
+
+    def __init__(self, limit_mb=DEFAULT_MEMORY_BUDGET_MB, spill_dir=None):
+        self.limit_mb = limit_mb
+        self.limit_bytes = int(limit_mb * _MB)
+        self._spill_dir = spill_dir
+        self._owns_spill_dir = False
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Clear the accounting; spilled files are kept"""
+        with self._lock:
+            self.current_bytes = 0
+            self.peak_bytes = 0
+            self.stage_bytes = {}
+            self.stage_peak_bytes = {}
+            self.sheet_bytes = {}
+            self.peak_rss_mb = None
+            self.spilled_sheets = []
+            self.actions = []
+
+    def charge(self, stage, nbytes, sheet=None):
+        """Account nbytes held by a stage (and sheet)"""
+        with self._lock:
+            self.current_bytes += nbytes
+            self.peak_bytes = max(self.peak_bytes, self.current_bytes)
+            self.stage_bytes[stage] = self.stage_bytes.get(stage, 0) + nbytes
+            self.stage_peak_bytes[stage] = max(self.stage_peak_bytes.get(stage, 0), self.stage_bytes[stage])
+            if sheet is not None:
+                self.sheet_bytes[sheet] = max(self.sheet_bytes.get(sheet, 0), nbytes)
+
+    def release(self, stage, nbytes):
+        """Release nbytes previously charged to a stage"""
+        with self._lock:
+            self.current_bytes -= nbytes
+            self.stage_bytes[stage] = self.stage_bytes.get(stage, 0) - nbytes
+
+    def available_bytes(self):
+        """Bytes left before the budget is exceeded (never negative)"""
+        return max(0, self.limit_bytes - self.current_bytes)
+
+    def over_budget(self):
+        """Whether the accounted total exceeds the budget"""
+        return self.current_bytes > self.limit_bytes
+
+    def sample_process_memory(self):
+        """Record the process RSS if it is a new peak"""
+        rss = process_memory_mb()
+        if rss is not None:
+            with self._lock:
+                self.peak_rss_mb = rss if self.peak_rss_mb is None else max(self.peak_rss_mb, rss)
+        return rss
+
+    def note(self, action):
+        """Record a degradation taken because of the budget (each distinct action once)"""
+        with self._lock:
+            if action in self.actions:
+                return
+            self.actions.append(action)
+        print(f"Memory budget: {action}")
+
+    def max_concurrency(self, requested, per_task_bytes):
+        """
+        Number of tasks that may run at once without exceeding the budget.
+
+        Args:
+            requested (int): Desired concurrency
+            per_task_bytes (int): Estimated memory held by one task
+
+        Returns:
+            int: Between 1 and requested
+        """
+        if per_task_bytes <= 0:
+            return requested
+        allowed = max(1, min(requested, self.available_bytes() // per_task_bytes))
+        if allowed < requested:
+            self.note(f"concurrency reduced from {requested} to {allowed} "
+                      f"(~{per_task_bytes / _MB:.2f} MB per sheet)")
+        return allowed
+
+    def account_results(self, results):
+        """Set the 'results' stage to the sheet results currently held"""
+        self.release('results', self.stage_bytes.get('results', 0))
+        for sheet_name, result in results.items():
+            self.charge('results', object_nbytes(result), sheet_name)
+
+    def enforce(self, results):
+        """
+        Spill the large fields of sheet results to disk while over budget.
+
+        The largest results are spilled first. Spilled fields are replaced
+        by SpilledValue stand-ins in the result records.
+
+        Args:
+            results (dict): Sheet name -> result record (see contingency_core.SheetResult)
+
+        Returns:
+            int: Number of sheet results spilled
+        """
+        if not self.over_budget():
+            return 0
+
+        candidates = []
+        for sheet_name, result in results.items():
+            size = sum(object_nbytes(getattr(result, field, None)) for field in self._spillable_fields(result))
+            if size > 0:
+                candidates.append((size, sheet_name))
+        candidates.sort(reverse=True)
+
+        spilled = 0
+        for size, sheet_name in candidates:
+            if not self.over_budget():
+                break
+            try:
+                self._spill_result(sheet_name, results[sheet_name])
+            except Exception as e:
+                print(f"Warning: Could not spill results of sheet '{sheet_name}': {e}")
+                break
+            self.release('results', size)
+            with self._lock:
+                self.spilled_sheets.append(sheet_name)
+            spilled += 1
+
+        if spilled:
+            self.note("spilling the largest sheet results to disk")
+        return spilled
+
+    @staticmethod
+    def _spillable_fields(result):
+        """Fields of a result record that can be spilled; none for plain dictionaries"""
+        return getattr(result, 'SPILLABLE_FIELDS', ())
+
+    def _spill_result(self, sheet_name, result):
+        directory = self.spill_directory()
+        for field in self._spillable_fields(result):
+            value = getattr(result, field, None)
+            if value is None or isinstance(value, SpilledValue):
+                continue
+            fd, path = tempfile.mkstemp(prefix='sheet_', suffix=f'_{field}.pkl', dir=directory)
+            os.close(fd)
+            pd.to_pickle(value, path)
+            shape = value.shape if hasattr(value, 'shape') else (len(value),)
+            setattr(result, field, SpilledValue(path, shape))
+
+    def spill_directory(self):
+        """Directory for spilled results, created on first use"""
+        with self._lock:
+            if self._spill_dir is None:
+                self._spill_dir = tempfile.mkdtemp(prefix='contingency_spill_')
+                self._owns_spill_dir = True
+            else:
+                os.makedirs(self._spill_dir, exist_ok=True)
+            return self._spill_dir
+
+    def close(self):
+        """Delete the spill directory if this budget created it"""
+        with self._lock:
+            if self._owns_spill_dir and self._spill_dir:
+                shutil.rmtree(self._spill_dir, ignore_errors=True)
+                self._spill_dir = None
+                self._owns_spill_dir = False
+
+    def report(self):
+        """
+        Summary of the accounting for reports.
+
+        Returns:
+            dict: Budget, peak accounted and process memory (MB), per-stage
+                peaks, the largest sheets and the degradations taken
+        """
+        self.sample_process_memory()
+        with self._lock:
+            largest = sorted(self.sheet_bytes.items(), key=lambda item: item[1], reverse=True)[:5]
+            return {
+                'limit_mb': self.limit_mb,
+                'peak_accounted_mb': self.peak_bytes / _MB,
+                'peak_process_mb': self.peak_rss_mb,
+                'stage_peak_mb': {stage: peak / _MB for stage, peak in self.stage_peak_bytes.items()},
+                'largest_sheets_mb': [(sheet, size / _MB) for sheet, size in largest],
+                'spilled_sheets': list(self.spilled_sheets),
+                'actions': list(self.actions)
+            }
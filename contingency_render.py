@@ -0,0 +1,1131 @@
+"""
+Contingency Analysis Rendering - Geophysics Contingency Analysis Tool v1.0
+
+Copyright (C) 2025 TraceSeis, Inc. All rights reserved.
+
+Off-screen chart rendering. Charts are drawn by module-level functions from
+plain data (DataFrames, lists, strings), so they can run in worker
+processes with the Agg backend and hand back PNG images; the GUI displays
+the images and only draws a chart on an interactive canvas when the user
+asks to zoom or pan. Rendered images go through a FigureCache, so a chart
+that was drawn before is never drawn again. export_charts renders the
+charts of every sheet across the worker pool and streams the files to disk,
+for the GUI and for headless batch runs. Heatmaps are drawn with
+contingency_heatmap.fast_heatmap, which stays fast on large matrices.
+matplotlib is imported by the drawing functions, not by this module.
+"""
+
+import concurrent.futures
+import datetime
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+from math import pi
+
+import pandas as pd
+
+from contingency_core import build_comparison_summary, normalize_confusion_matrix
+from contingency_figures import data_hash, figure_key, rasterize
+from contingency_trace import traced
+
+# Worker processes for chart rendering (one core is left for the GUI)
+RENDER_WORKERS = max(1, (os.cpu_count() or 1) - 1)
+
+# Resolution of exported chart files
+EXPORT_DPI = 300
+
+# Renders kept in flight per worker by export_charts
+EXPORT_QUEUE_PER_WORKER = 4
+
+
+def draw_confusion_heatmap(matrix, title, fmt='d', title_size=12, figsize=(6, 4), dpi=100):
+    """
+    Annotated heatmap of a confusion matrix.
+
+    Args:
+        matrix (pd.DataFrame): Confusion matrix (counts or row percentages)
+        title (str): Chart title
+        fmt (str): Annotation format ('d' for counts, '.1f' for percentages)
+        title_size (int): Title font size
+        figsize (tuple): Figure size in inches
+        dpi (int): Figure resolution
+
+    Returns:
+        matplotlib.figure.Figure: The chart
+    """
+    from matplotlib.figure import Figure
+
+    from contingency_heatmap import fast_heatmap
+
+    fig = Figure(figsize=figsize, dpi=dpi, facecolor='white')
+    ax = fig.add_subplot(111)
+
+    fast_heatmap(matrix, ax=ax, annot=True, fmt=fmt, cmap='Blues', cbar_kws={'shrink': 0.8})
+
+    ax.set_title(title, fontsize=title_size, fontweight='bold')
+    ax.set_xlabel('Actual')
+    ax.set_ylabel('Predicted')
+
+    fig.tight_layout()
+    return fig
+
+
+def draw_matrix_grid(matrix, title, percent=False, figsize=(8, 6), dpi=100):
+    """
+    Compact heatmap of a confusion matrix with one label per cell.
+
+    Args:
+        matrix (pd.DataFrame): Confusion matrix (counts or row percentages)
+        title (str): Chart title
+        percent (bool): Label cells as percentages instead of counts
+        figsize (tuple): Figure size in inches
+        dpi (int): Figure resolution
+
+    Returns:
+        matplotlib.figure.Figure: The chart
+    """
+    from matplotlib.figure import Figure
+
+    from contingency_heatmap import annotate_cells, format_labels
+
+    fig = Figure(figsize=figsize, dpi=dpi, facecolor='white')
+    ax = fig.add_subplot(111)
+
+    im = ax.imshow(matrix.values, cmap='Blues', aspect='auto')
+
+    ax.set_xticks(range(len(matrix.columns)))
+    ax.set_yticks(range(len(matrix.index)))
+    ax.set_xticklabels(matrix.columns, rotation=45, ha='right')
+    ax.set_yticklabels(matrix.index)
+
+    # Cell centres are at integer positions in an imshow axes
+    if percent:
+        labels = format_labels(matrix.values, '.1f') + '%'
+    else:
+        labels = format_labels(matrix.values.astype(int), 'd')
+    annotate_cells(ax, labels, 'black', offset=0, fontweight='bold')
+
+    ax.set_title(title, fontsize=12, fontweight='bold')
+    ax.set_xlabel('Actual')
+    ax.set_ylabel('Predicted')
+
+    fig.colorbar(im, ax=ax, shrink=0.6)
+
+    fig.tight_layout()
+    return fig
+
+
+def draw_mini_matrix(matrix, title, percent=False, figsize=(4, 3), dpi=80):
+    """
+    Thumbnail heatmap of a confusion matrix for the side-by-side sheet view.
+
+    Class labels are shown for matrices of up to six columns and cell labels
+    for matrices of up to 5 x 5.
+
+    Args:
+        matrix (pd.DataFrame): Confusion matrix (counts or row percentages)
+        title (str): Chart title
+        percent (bool): Label cells as percentages instead of counts
+        figsize (tuple): Figure size in inches
+        dpi (int): Figure resolution
+
+    Returns:
+        matplotlib.figure.Figure: The chart
+    """
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize, dpi=dpi, facecolor='white')
+    ax = fig.add_subplot(111)
+
+    ax.imshow(matrix.values, cmap='Blues', aspect='auto')
+
+    # Simplified labels for mini view
+    if len(matrix.columns) <= 6:
+        ax.set_xticks(range(len(matrix.columns)))
+        ax.set_yticks(range(len(matrix.index)))
+        ax.set_xticklabels([str(c)[:8] for c in matrix.columns], rotation=45, ha='right', fontsize=8)
+        ax.set_yticklabels([str(i)[:8] for i in matrix.index], fontsize=8)
+    else:
+        ax.set_xticks([])
+        ax.set_yticks([])
+
+    # Text annotations for small matrices
+    if matrix.shape[0] <= 5 and matrix.shape[1] <= 5:
+        for i in range(len(matrix.index)):
+            for j in range(len(matrix.columns)):
+                value = matrix.iloc[i, j]
+                text = f"{value:.1f}%" if percent else f"{int(value)}"
+                ax.text(j, i, text, ha="center", va="center", color="black", fontsize=8, fontweight='bold')
+
+    ax.set_title(title, fontsize=10, fontweight='bold')
+
+    fig.tight_layout()
+    return fig
+
+
+def draw_performance_matrix(normalized, values, configs, metric_labels, figsize=(14, 10), dpi=100):
+    """
+    Heatmap of the key metrics of every sheet, colored by normalized performance.
+
+    Args:
+        normalized (pd.DataFrame): Metrics scaled to 0 (worst) .. 1 (best), one row per sheet
+        values (pd.DataFrame): Metric values shown as annotations
+        configs (list): Sheet (SOM configuration) names
+        metric_labels (list): Metric names
+        figsize (tuple): Figure size in inches
+        dpi (int): Figure resolution
+
+    Returns:
+        matplotlib.figure.Figure: The chart
+    """
+    from matplotlib.artist import setp
+    from matplotlib.figure import Figure
+
+    from contingency_heatmap import fast_heatmap
+
+    fig = Figure(figsize=figsize, dpi=dpi, facecolor='white')
+    ax = fig.add_subplot(111)
+
+    fast_heatmap(
+        normalized.T,  # Metrics as rows, configurations as columns
+        annot=values.T,
+        fmt='.1f',
+        cmap='RdYlGn',
+        ax=ax,
+        cbar_kws={
+            'label': 'Normalized Performance\n(0=Worst, 1=Best)',
+            'shrink': 0.8,
+            'aspect': 20
+        },
+        linewidths=0.5,
+        linecolor='white',
+        square=False,
+        xticklabels=list(configs),
+        yticklabels=list(metric_labels),
+        annot_kws={'size': 9}
+    )
+
+    ax.set_title('Performance Matrix - Performance Metrics\n(Color: Normalized Performance)',
+                 fontsize=14, fontweight='bold', pad=20)
+    ax.set_xlabel('SOM Configuration', fontsize=12, fontweight='bold', labelpad=10)
+    ax.set_ylabel('Performance Metrics', fontsize=12, fontweight='bold', labelpad=10)
+
+    try:
+        setp(ax.get_xticklabels(), rotation=45, ha='right')
+    except Exception as label_error:
+        print(f"Warning: Could not rotate x-axis labels: {label_error}")
+
+    try:
+        fig.tight_layout()
+    except Exception as layout_error:
+        print(f"Warning: Could not adjust layout: {layout_error}")
+    return fig
+
+
+def draw_performance_comparison(summary, figsize=(15, 10), dpi=100):
+    """
+    Bar charts of accuracy, association strength and utilization per sheet, and their overview scatter.
+
+    Args:
+        summary (pd.DataFrame): Comparison summary (see contingency_core.build_comparison_summary)
+        figsize (tuple): Figure size in inches
+        dpi (int): Figure resolution
+
+    Returns:
+        matplotlib.figure.Figure: The chart
+    """
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize, dpi=dpi, facecolor='white')
+    sheets = summary['SOM_Config']
+    accuracies = summary['Global_Fit']
+    cramers_v = summary['Cramers_V']
+    utilization = summary['Utilization']
+
+    # Accuracy comparison
+    ax1 = fig.add_subplot(2, 2, 1)
+    bars = ax1.bar(range(len(sheets)), accuracies, color='skyblue', edgecolor='navy')
+    ax1.set_title('Classification Accuracy by Sheet', fontsize=14, fontweight='bold')
+    ax1.set_ylabel('Classification Accuracy (%)')
+    ax1.set_xticks(range(len(sheets)))
+    ax1.set_xticklabels(sheets, rotation=45, ha='right')
+    ax1.grid(True, alpha=0.3)
+
+    for bar, acc in zip(bars, accuracies):
+        ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1,
+                 f'{acc:.1f}%', ha='center', va='bottom', fontweight='bold')
+
+    # Cramer's V comparison
+    ax2 = fig.add_subplot(2, 2, 2)
+    ax2.bar(range(len(sheets)), cramers_v, color='lightcoral', edgecolor='darkred')
+    ax2.set_title('Association Strength (Cramer\'s V)', fontsize=14, fontweight='bold')
+    ax2.set_ylabel('Cramer\'s V')
+    ax2.set_xticks(range(len(sheets)))
+    ax2.set_xticklabels(sheets, rotation=45, ha='right')
+    ax2.grid(True, alpha=0.3)
+
+    # Utilization comparison
+    ax3 = fig.add_subplot(2, 2, 3)
+    ax3.bar(range(len(sheets)), utilization, color='lightgreen', edgecolor='darkgreen')
+    ax3.set_title('Neuron Utilization', fontsize=14, fontweight='bold')
+    ax3.set_ylabel('Neuron Utilization (%)')
+    ax3.set_xticks(range(len(sheets)))
+    ax3.set_xticklabels(sheets, rotation=45, ha='right')
+    ax3.grid(True, alpha=0.3)
+
+    # Combined scatter plot
+    ax4 = fig.add_subplot(2, 2, 4)
+    scatter = ax4.scatter(cramers_v, accuracies, c=utilization,
+                          cmap='viridis', s=100, alpha=0.7, edgecolors='black')
+    ax4.set_xlabel('Cramer\'s V (Association Strength)')
+    ax4.set_ylabel('Classification Accuracy (%)')
+    ax4.set_title('Performance Overview', fontsize=14, fontweight='bold')
+    ax4.grid(True, alpha=0.3)
+
+    cbar = fig.colorbar(scatter, ax=ax4)
+    cbar.set_label('Neuron Utilization (%)')
+
+    for i, sheet in enumerate(sheets):
+        ax4.annotate(sheet, (cramers_v.iloc[i], accuracies.iloc[i]),
+                     xytext=(5, 5), textcoords='offset points',
+                     fontsize=8, alpha=0.8)
+
+    fig.tight_layout()
+    return fig
+
+
+def draw_radar_comparison(summary, figsize=(15, 10), dpi=100):
+    """
+    Radar charts of accuracy, association strength, utilization and composite score of the first six sheets.
+
+    Args:
+        summary (pd.DataFrame): Comparison summary, or None when there is nothing to compare
+        figsize (tuple): Figure size in inches
+        dpi (int): Figure resolution
+
+    Returns:
+        matplotlib.figure.Figure: The chart
+    """
+    from matplotlib.figure import Figure
+
+    if summary is None:
+        return draw_message('Multi-Sheet Radar Analysis',
+                            'No multi-sheet comparison data available for radar analysis', figsize, dpi)
+
+    fig = Figure(figsize=figsize, dpi=dpi, facecolor='white')
+
+    top = summary.head(6)
+    top_sheets = top['SOM_Config']
+    top_accuracies = top['Global_Fit'] / 100  # Normalize to 0-1
+    top_cramers = top['Cramers_V']
+    top_utilization = top['Utilization'] / 100  # Normalize to 0-1
+
+    angles = [n / float(len(top_sheets)) * 2 * pi for n in range(len(top_sheets))]
+    angles += angles[:1]
+    labels = [str(name)[:8] for name in top_sheets]
+
+    # Composite score: accuracy 40%, association strength 30%, utilization 30%
+    composite_scores = [top_accuracies.iloc[i] * 0.4 + top_cramers.iloc[i] * 0.3 + top_utilization.iloc[i] * 0.3
+                        for i in range(len(top_sheets))]
+
+    panels = [
+        (list(top_accuracies.values), 'Classification Accuracy', 'blue', 'Sheet Classification Accuracy Comparison'),
+        (list(top_cramers.values), 'Association Strength (Cramer\'s V)', 'red',
+         'Association Strength (Cramer\'s V) Comparison'),
+        (list(top_utilization.values), 'Neuron Utilization', 'green', 'Neuron Utilization Comparison'),
+        (composite_scores, 'Composite Score', 'purple', 'Overall Performance Score'),
+    ]
+    for position, (values, label, color, title) in enumerate(panels, start=1):
+        ax = fig.add_subplot(2, 2, position, projection='polar')
+        values = values + [values[0]]
+        ax.plot(angles, values, 'o-', linewidth=2, label=label, color=color)
+        ax.fill(angles, values, alpha=0.15, color=color)
+
+        ax.set_xticks(angles[:-1])
+        ax.set_xticklabels(labels, fontsize=8)
+        ax.set_ylim(0, 1)
+        ax.set_title(title, fontsize=12, fontweight='bold', pad=20)
+        ax.legend(loc='upper right', bbox_to_anchor=(1.3, 1.0), fontsize=8)
+        ax.grid(True)
+
+    fig.tight_layout()
+    return fig
+
+
+def _draw_category_pie(ax, data, labels, colors, title):
+    """Pie of category counts that labels only the non-empty categories"""
+    # Only show labels for slices with data > 0
+    labels_to_show = [label if count > 0 else '' for label, count in zip(labels, data)]
+
+    _, texts, autotexts = ax.pie(data, labels=labels_to_show, autopct='%1.1f%%', colors=colors, startangle=90,
+                                 labeldistance=1.1, pctdistance=0.85)
+
+    for count, text, autotext in zip(data, texts, autotexts):
+        if count > 0:
+            autotext.set_color('white')
+            autotext.set_fontweight('bold')
+            autotext.set_fontsize(9)
+            # Position text better for small slices
+            if count == 1:  # Single item
+                text.set_position((1.2, 0))
+            text.set_fontsize(9)
+        else:
+            # Hide text for empty slices
+            text.set_visible(False)
+            autotext.set_visible(False)
+
+    ax.set_title(title, fontsize=12, fontweight='bold')
+
+
+def draw_summary_pies(summary, figsize=(15, 10), dpi=100):
+    """
+    Pie charts of how the sheets spread over accuracy, association strength, utilization and sample size levels.
+
+    Args:
+        summary (pd.DataFrame): Comparison summary, or None when there is nothing to compare
+        figsize (tuple): Figure size in inches
+        dpi (int): Figure resolution
+
+    Returns:
+        matplotlib.figure.Figure: The chart
+    """
+    from matplotlib.figure import Figure
+
+    if summary is None:
+        return draw_message('Multi-Sheet Pie Chart Analysis',
+                            'No multi-sheet comparison data available for pie chart analysis', figsize, dpi)
+
+    fig = Figure(figsize=figsize, dpi=dpi, facecolor='white')
+
+    accuracies = summary['Global_Fit']
+    cramers_v = summary['Cramers_V']
+    utilization = summary['Utilization']
+    sample_sizes = summary['Total_Samples']
+
+    panels = [
+        ([len(accuracies[accuracies >= 80]),
+          len(accuracies[(accuracies >= 60) & (accuracies < 80)]),
+          len(accuracies[(accuracies >= 40) & (accuracies < 60)]),
+          len(accuracies[accuracies < 40])],
+         ['Excellent (≥80%)', 'Good (60-79%)', 'Fair (40-59%)', 'Poor (<40%)'],
+         ['#2E7D32', '#388E3C', '#F57C00', '#D32F2F'],
+         'Performance Distribution Across Sheets'),
+        ([len(cramers_v[cramers_v >= 0.7]),
+          len(cramers_v[(cramers_v >= 0.5) & (cramers_v < 0.7)]),
+          len(cramers_v[(cramers_v >= 0.3) & (cramers_v < 0.5)]),
+          len(cramers_v[cramers_v < 0.3])],
+         ['Strong (≥0.7)', 'Moderate (0.5-0.7)', 'Weak (0.3-0.5)', 'Negligible (<0.3)'],
+         ['#1976D2', '#42A5F5', '#90CAF9', '#E3F2FD'],
+         'Association Strength Distribution'),
+        ([len(utilization[utilization >= 80]),
+          len(utilization[(utilization >= 50) & (utilization < 80)]),
+          len(utilization[utilization < 50])],
+         ['High (≥80%)', 'Medium (50-79%)', 'Low (<50%)'],
+         ['#4CAF50', '#8BC34A', '#CDDC39'],
+         'Neuron Utilization Distribution'),
+        ([len(sample_sizes[sample_sizes >= 1000]),
+          len(sample_sizes[(sample_sizes >= 100) & (sample_sizes < 1000)]),
+          len(sample_sizes[sample_sizes < 100])],
+         ['Large (≥1000)', 'Medium (100-999)', 'Small (<100)'],
+         ['#FF9800', '#FFB74D', '#FFCC02'],
+         'Sample Size Distribution'),
+    ]
+    for position, (data, labels, colors, title) in enumerate(panels, start=1):
+        _draw_category_pie(fig.add_subplot(2, 2, position), data, labels, colors, title)
+
+    fig.tight_layout()
+    return fig
+
+
+def draw_distributions(matrix, figsize=(15, 8), dpi=100):
+    """
+    Bar charts of the actual and predicted type distributions of a confusion matrix.
+
+    Args:
+        matrix (pd.DataFrame): Confusion matrix with counts (predicted rows, actual columns)
+        figsize (tuple): Figure size in inches
+        dpi (int): Figure resolution
+
+    Returns:
+        matplotlib.figure.Figure: The chart
+    """
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize, dpi=dpi, facecolor='white')
+
+    panels = [
+        (matrix.sum(axis=0), 'Actual Type Distribution', 'skyblue', 'navy'),
+        (matrix.sum(axis=1), 'Predicted Type Distribution', 'lightcoral', 'darkred'),
+    ]
+    for position, (counts, title, color, edgecolor) in enumerate(panels, start=1):
+        ax = fig.add_subplot(1, 2, position)
+        ax.bar(range(len(counts)), counts.values, color=color, edgecolor=edgecolor)
+        ax.set_title(title, fontsize=14, fontweight='bold')
+        ax.set_ylabel('Count')
+        ax.set_xticks(range(len(counts)))
+        ax.set_xticklabels(counts.index, rotation=45, ha='right')
+        ax.grid(True, alpha=0.3)
+
+    fig.tight_layout()
+    return fig
+
+
+def draw_class_metrics(class_metrics, figsize=(12, 8), dpi=100):
+    """
+    Grouped bar chart of the precision, recall and F1 score of each class.
+
+    Args:
+        class_metrics (dict): Class -> dict with precision, recall and f1_score
+        figsize (tuple): Figure size in inches
+        dpi (int): Figure resolution
+
+    Returns:
+        matplotlib.figure.Figure: The chart
+    """
+    import numpy as np
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize, dpi=dpi, facecolor='white')
+    ax = fig.add_subplot(111)
+
+    classes = list(class_metrics.keys())
+    x = np.arange(len(classes))
+    width = 0.25
+
+    bars = [
+        ('precision', -width, 'Precision', 'skyblue', 'navy'),
+        ('recall', 0, 'Recall', 'lightgreen', 'darkgreen'),
+        ('f1_score', width, 'F1-Score', 'lightcoral', 'darkred'),
+    ]
+    for metric, offset, label, color, edgecolor in bars:
+        values = [class_metrics[c][metric] for c in classes]
+        ax.bar(x + offset, values, width, label=label, color=color, edgecolor=edgecolor)
+
+    ax.set_title('Performance Metrics by Class', fontsize=14, fontweight='bold')
+    ax.set_ylabel('Score')
+    ax.set_xlabel('Classes')
+    ax.set_xticks(x)
+    ax.set_xticklabels(classes, rotation=45, ha='right')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    ax.set_ylim(0, 1.1)
+
+    fig.tight_layout()
+    return fig
+
+
+def _draw_pie(ax, data, labels, colors, title):
+    """Pie with bold white percentages"""
+    _, _, autotexts = ax.pie(data, labels=labels, autopct='%1.1f%%', colors=colors, startangle=90)
+    for autotext in autotexts:
+        autotext.set_color('white')
+        autotext.set_fontweight('bold')
+
+    ax.set_title(title, fontsize=12, fontweight='bold')
+
+
+def draw_class_pies(matrix, class_metrics=None, metrics=None, figsize=(15, 7), dpi=100):
+    """
+    Pie charts of the actual and predicted class distributions (top 8 classes, the rest as 'Others').
+
+    With class metrics or sheet metrics a second row shows the average
+    precision, recall and F1 score and the shares of accuracy, association,
+    utilization and completeness of the sheet.
+
+    Args:
+        matrix (pd.DataFrame): Confusion matrix with counts (predicted rows, actual columns)
+        class_metrics (dict): Class -> dict with precision, recall and f1_score, or None
+        metrics (dict): Sheet metrics: global_fit, cramers_v, active_neurons, total_neurons and
+            optionally data_completeness, or None
+        figsize (tuple): Figure size in inches
+        dpi (int): Figure resolution
+
+    Returns:
+        matplotlib.figure.Figure: The chart
+    """
+    import numpy as np
+    from matplotlib import colormaps
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize, dpi=dpi, facecolor='white')
+    rows = 2 if class_metrics is not None or metrics is not None else 1
+
+    panels = [
+        (matrix.sum(axis=0), 'tab10', 'Actual Class Distribution'),
+        (matrix.sum(axis=1), 'tab20', 'Predicted Class Distribution'),
+    ]
+    for position, (counts, colormap, title) in enumerate(panels, start=1):
+        # Limit to top 8 classes for readability
+        top_classes = counts.nlargest(8)
+        other_count = counts.sum() - top_classes.sum()
+        pie_data = list(top_classes.values)
+        pie_labels = list(top_classes.index)
+        if other_count > 0:
+            pie_data.append(other_count)
+            pie_labels.append('Others')
+
+        colors = colormaps[colormap](np.linspace(0, 1, len(pie_data)))
+        _draw_pie(fig.add_subplot(rows, 2, position), pie_data, pie_labels, colors, title)
+
+    if class_metrics is not None:
+        classes = list(class_metrics.keys())
+        averages = [np.mean([class_metrics[c][metric] for c in classes])
+                    for metric in ('precision', 'recall', 'f1_score')]
+        # The rest of the maximum of 3 as "Other Metrics"
+        _draw_pie(fig.add_subplot(2, 2, 3), averages + [3 - sum(averages)],
+                  ['Avg Precision', 'Avg Recall', 'Avg F1-Score', 'Other Metrics'],
+                  ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4'], 'Average Performance Metrics')
+
+    if metrics is not None:
+        quality = [
+            metrics.get('global_fit', 0),
+            metrics.get('cramers_v', 0) * 100,  # Convert to percentage
+            metrics.get('active_neurons', 0) / (metrics.get('total_neurons') or 1) * 100,
+            metrics.get('data_completeness') or 0,
+        ]
+        # Normalize to percentages that sum to 100
+        total = sum(quality)
+        quality = [value / total * 100 for value in quality] if total > 0 else [25] * 4
+        _draw_pie(fig.add_subplot(2, 2, 4), quality, ['Accuracy', 'Association', 'Utilization', 'Completeness'],
+                  ['#FFD93D', '#6BCF7F', '#4D96FF', '#FF6B9D'], 'Data Quality Metrics')
+
+    fig.tight_layout()
+    return fig
+
+
+def _draw_radar(ax, angles, series, labels, title, fontsize=None):
+    """Radar axes of one or more (values, label, color) series closed over the given angles"""
+    for values, label, color in series:
+        values = list(values) + list(values[:1])
+        ax.plot(angles, values, 'o-', linewidth=2, label=label, color=color)
+        ax.fill(angles, values, alpha=0.15, color=color)
+
+    ax.set_xticks(angles[:-1])
+    if fontsize is None:
+        ax.set_xticklabels(labels)
+    else:
+        ax.set_xticklabels(labels, fontsize=fontsize)
+    ax.set_ylim(0, 1)
+    ax.set_title(title, fontsize=12, fontweight='bold', pad=20)
+    ax.legend(loc='upper right', bbox_to_anchor=(1.3, 1.0), fontsize=8)
+    ax.grid(True)
+
+
+def _radar_angles(count):
+    """Evenly spaced radar angles, closed with the first angle"""
+    angles = [n / float(count) * 2 * pi for n in range(count)]
+    return angles + angles[:1]
+
+
+def draw_sheet_radar(matrix, metrics=None, class_metrics=None, figsize=(15, 7), dpi=100):
+    """
+    Radar charts of the actual vs. predicted distribution (first six classes) and the overall performance of a sheet.
+
+    With class metrics the charts are laid out 2 x 2 together with the
+    precision, recall and F1 score of the first six classes and the quality
+    metrics of the first class, and the overall performance includes data
+    completeness.
+
+    Args:
+        matrix (pd.DataFrame): Confusion matrix with counts (predicted rows, actual columns), or None
+        metrics (dict): Sheet metrics: global_fit, cramers_v, active_neurons, total_neurons and
+            optionally data_completeness; None draws 0.5 for every metric
+        class_metrics (dict): Class -> dict with precision, recall, f1_score and optionally
+            accuracy and support, or None
+        figsize (tuple): Figure size in inches
+        dpi (int): Figure resolution
+
+    Returns:
+        matplotlib.figure.Figure: The chart
+    """
+    from matplotlib import colormaps
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize, dpi=dpi, facecolor='white')
+    detailed = class_metrics is not None
+    rows = 2 if detailed else 1
+
+    if detailed:
+        import numpy as np
+
+        classes = list(class_metrics.keys())[:6]
+        colors = colormaps['tab10'](np.linspace(0, 1, len(classes)))
+        series = [([class_metrics[name]['precision'], class_metrics[name]['recall'], class_metrics[name]['f1_score']],
+                   str(name), color) for name, color in zip(classes, colors)]
+        _draw_radar(fig.add_subplot(2, 2, 1, projection='polar'), _radar_angles(3), series,
+                    ['Precision', 'Recall', 'F1-Score'], 'Performance Metrics Radar')
+
+    # Distribution comparison, normalized to the largest count
+    ax = fig.add_subplot(rows, 2, 2 if detailed else 1, projection='polar')
+    if matrix is not None:
+        actual_counts = matrix.sum(axis=0)
+        predicted_counts = matrix.sum(axis=1)
+        max_count = max(actual_counts.max(), predicted_counts.max()) or 1
+        class_names = list(actual_counts.index)[:6]
+        series = [([counts.get(name, 0) / max_count for name in class_names], label, color)
+                  for counts, label, color in [(actual_counts, 'Actual Distribution', 'blue'),
+                                               (predicted_counts, 'Predicted Distribution', 'red')]]
+        _draw_radar(ax, _radar_angles(len(class_names)), series, [str(name)[:8] for name in class_names],
+                    'Distribution Comparison Radar', fontsize=8)
+
+    if detailed:
+        ax = fig.add_subplot(2, 2, 3, projection='polar')
+        if matrix is not None:
+            # First class as representative
+            first_class = list(class_metrics.keys())[0]
+            class_data = class_metrics[first_class]
+            values = [
+                class_data.get('accuracy', 0),
+                class_data.get('precision', 0),
+                class_data.get('recall', 0),
+                class_data.get('f1_score', 0),
+                min(class_data.get('support', 0) / 100, 1.0)  # Normalize support
+            ]
+            _draw_radar(ax, _radar_angles(5), [(values, first_class, 'green')],
+                        ['Accuracy', 'Precision', 'Recall', 'F1-Score', 'Support'], 'Quality Metrics Radar')
+
+    # Overall performance
+    overall_metrics = ['Global Accuracy', 'Association Strength', 'Neuron Utilization']
+    if detailed:
+        overall_metrics.append('Data Quality')
+    if metrics is None:
+        values = [0.5] * len(overall_metrics)
+    else:
+        values = [
+            min(metrics.get('global_fit', 0) / 100, 1.0),   # Normalize accuracy
+            min(metrics.get('cramers_v', 0) * 2, 1.0),      # Scale Cramer's V
+            min(metrics.get('active_neurons', 0) / (metrics.get('total_neurons') or 1), 1.0),
+            min((metrics.get('data_completeness') or 0) / 100, 1.0),  # Normalize completeness
+        ][:len(overall_metrics)]
+    _draw_radar(fig.add_subplot(rows, 2, 4 if detailed else 2, projection='polar'),
+                _radar_angles(len(overall_metrics)), [(values, 'Overall Performance', 'purple')],
+                overall_metrics, 'Overall Performance Radar')
+
+    fig.tight_layout()
+    return fig
+
+
+def draw_message(title, message, figsize=(12, 8), dpi=100):
+    """
+    Placeholder chart with a centred message, for views without data.
+
+    Args:
+        title (str): Chart title
+        message (str): Message text
+        figsize (tuple): Figure size in inches
+        dpi (int): Figure resolution
+
+    Returns:
+        matplotlib.figure.Figure: The chart
+    """
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize, dpi=dpi, facecolor='white')
+    ax = fig.add_subplot(111)
+    ax.text(0.5, 0.5, message, ha='center', va='center', fontsize=14, transform=ax.transAxes)
+    ax.set_title(title, fontsize=14, fontweight='bold')
+    fig.tight_layout()
+    return fig
+
+
+# Chart type -> drawing function; every function takes figsize and dpi
+CHARTS = {
+    'confusion_heatmap': draw_confusion_heatmap,
+    'matrix_grid': draw_matrix_grid,
+    'mini_matrix': draw_mini_matrix,
+    'performance_matrix': draw_performance_matrix,
+    'performance_comparison': draw_performance_comparison,
+    'radar_comparison': draw_radar_comparison,
+    'summary_pies': draw_summary_pies,
+    'distributions': draw_distributions,
+    'class_metrics': draw_class_metrics,
+    'class_pies': draw_class_pies,
+    'sheet_radar': draw_sheet_radar,
+    'message': draw_message,
+}
+
+
+def draw_chart(chart, params, figsize, dpi=100):
+    """
+    Draw a chart in this process.
+
+    Args:
+        chart (str): Chart type (key of CHARTS)
+        params (dict): Keyword arguments of the drawing function
+        figsize (tuple): Figure size in inches
+        dpi (int): Figure resolution
+
+    Returns:
+        matplotlib.figure.Figure: The chart
+
+    Raises:
+        KeyError: If the chart type is unknown
+    """
+    return CHARTS[chart](figsize=tuple(figsize), dpi=dpi, **params)
+
+
+def render_chart(chart, params, figsize, dpi=100):
+    """
+    Draw a chart and return it as a PNG image; worker process entry point.
+
+    Args:
+        chart (str): Chart type (key of CHARTS)
+        params (dict): Keyword arguments of the drawing function
+        figsize (tuple): Figure size in inches
+        dpi (int): Figure resolution
+
+    Returns:
+        bytes: PNG image
+    """
+    return rasterize(draw_chart(chart, params, figsize, dpi), dpi)
+
+
+def _init_render_worker():
+    """Select the off-screen Agg backend in a rendering worker"""
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+
+
+class RenderService:
+    """
+    Renders charts to PNG images in worker processes.
+
+    submit() returns a future of the image. Images found in the figure cache
+    are returned as completed futures; new images are stored in the cache as
+    they finish. Workers are started on first use. With max_workers=0 charts
+    are rendered in the calling thread.
+    """
+
+    def __init__(self, max_workers=RENDER_WORKERS, cache=None):
+        """
+        Args:
+            max_workers (int): Worker processes; 0 renders in the calling thread
+            cache (FigureCache, optional): Cache of rendered images
+        """
+        self.max_workers = max_workers
+        self.cache = cache
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def chart_key(chart, params, figsize, dpi=100, normalized=False):
+        """Cache key of a chart (see contingency_figures.figure_key)"""
+        return figure_key(data_hash(params), chart, figsize, dpi, normalized)
+
+    def get_executor(self):
+        """Thread-safe lazy initialization of the worker pool"""
+        with self._lock:
+            if self._executor is None:
+                # Forked workers would copy the caller's threads and held locks; spawned ones start clean
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers, initializer=_init_render_worker,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._executor
+
+    @traced('render', name='render_submit')
+    def submit(self, chart, params, figsize, dpi=100, normalized=False, cache=None):
+        """
+        Render a chart in the background.
+
+        Args:
+            chart (str): Chart type (key of CHARTS)
+            params (dict): Keyword arguments of the drawing function (must be picklable)
+            figsize (tuple): Figure size in inches
+            dpi (int): Rendering resolution
+            normalized (bool): Whether the chart shows normalized matrices (part of the cache key)
+            cache (FigureCache, optional): Cache for this chart instead of the service's cache
+
+        Returns:
+            concurrent.futures.Future: Future of the PNG image
+        """
+        cache = self.cache if cache is None else cache
+        key = self.chart_key(chart, params, figsize, dpi, normalized) if cache is not None else None
+        image = cache.get(key) if key is not None else None
+        if image is not None or self.max_workers == 0:
+            future = concurrent.futures.Future()
+            try:
+                if image is None:
+                    image = self._store(cache, key, render_chart(chart, params, figsize, dpi))
+                future.set_result(image)
+            except Exception as e:
+                future.set_exception(e)
+            return future
+
+        future = self.get_executor().submit(render_chart, chart, params, tuple(figsize), dpi)
+        if key is not None:
+            future.add_done_callback(lambda done: self._store_result(cache, key, done))
+        return future
+
+    @staticmethod
+    def _store(cache, key, image):
+        if key is not None:
+            cache.put(key, image)
+        return image
+
+    def _store_result(self, cache, key, future):
+        """Cache the image of a finished render; failed and cancelled renders are not cached"""
+        if not future.cancelled() and future.exception() is None:
+            self._store(cache, key, future.result())
+
+    def shutdown(self, wait=True):
+        """Stop the worker processes, cancelling queued renders"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is None:
+            return True
+        try:
+            executor.shutdown(wait=wait, cancel_futures=True)
+            return True
+        except Exception as e:
+            print(f"Error during render pool shutdown: {e}")
+            return False
+
+
+def safe_file_name(name):
+    """Turn a sheet name into a file name component"""
+    cleaned = ''.join(char if char.isalnum() or char in '-_.' else '_' for char in str(name)).strip('.')
+    return cleaned or 'sheet'
+
+
+# Result fields drawn in the per-sheet radar chart
+SHEET_CHART_METRICS = ('global_fit', 'cramers_v', 'active_neurons', 'total_neurons')
+
+
+def chart_skip_reason(result):
+    """
+    Why the charts of a sheet result cannot be exported.
+
+    Failed analyses, results without a labelled confusion matrix (such as
+    the plain dictionaries restored by loading a project) and results
+    missing the metrics of the charts are skipped.
+
+    Args:
+        result: Sheet result (see contingency_core.SheetResult) or result dictionary
+
+    Returns:
+        str: Reason, or None if the charts can be exported
+    """
+    if not hasattr(result, 'get'):
+        return "not a sheet result"
+    if result.get('status', 'success') != 'success':
+        return f"analysis failed ({result.get('error', result.get('status'))})"
+    matrix = result.get('confusion_matrix')
+    if matrix is None:
+        return "no confusion matrix"
+    if not isinstance(matrix, pd.DataFrame):
+        return "confusion matrix has no lithofacies labels"
+    if matrix.empty:
+        return "empty confusion matrix"
+    missing = [name for name in SHEET_CHART_METRICS if result.get(name) is None]
+    if missing:
+        return f"missing metrics: {', '.join(missing)}"
+    return None
+
+
+def export_chart_tasks(results, normalize=False):
+    """
+    List the chart files exported for a set of sheet results.
+
+    Every exportable sheet (see chart_skip_reason) gets its confusion matrix
+    heatmap, type distributions, radar and pie charts in its own directory;
+    with more than one exportable sheet the performance and radar
+    comparisons of those sheets are added at the top.
+
+    Args:
+        results (dict): Sheet name -> sheet result (see contingency_core.SheetResult)
+        normalize (bool): Export heatmaps of row percentages instead of counts
+
+    Returns:
+        tuple: (list of (relative file path, chart type, drawing parameters, figure size),
+            list of (sheet name, reason) for the skipped sheets)
+    """
+    tasks = []
+    skipped = []
+    exported = {}
+    used = set()
+    for sheet_name, result in results.items():
+        reason = chart_skip_reason(result)
+        if reason is not None:
+            skipped.append((sheet_name, reason))
+            continue
+        exported[sheet_name] = result
+        matrix = result['confusion_matrix']
+
+        stem = safe_file_name(sheet_name)
+        base, counter = stem, 2
+        while stem in used:
+            stem = f"{base}_{counter}"
+            counter += 1
+        used.add(stem)
+        directory = f"Sheet_{stem}"
+
+        if normalize:
+            heatmap = {'matrix': normalize_confusion_matrix(matrix), 'fmt': '.1f',
+                       'title': f"{sheet_name} - Normalized Confusion Matrix (Row %)"}
+        else:
+            heatmap = {'matrix': matrix, 'fmt': 'd', 'title': f"{sheet_name} - Confusion Matrix"}
+        heatmap['title_size'] = 14
+        metrics = {name: result[name] for name in SHEET_CHART_METRICS}
+
+        tasks.extend([
+            (os.path.join(directory, f"{stem}_confusion_matrix.png"), 'confusion_heatmap', heatmap, (12, 8)),
+            (os.path.join(directory, f"{stem}_distributions.png"), 'distributions', {'matrix': matrix}, (15, 8)),
+            (os.path.join(directory, f"{stem}_radar.png"), 'sheet_radar', {'matrix': matrix, 'metrics': metrics},
+             (15, 7)),
+            (os.path.join(directory, f"{stem}_pie_charts.png"), 'class_pies', {'matrix': matrix}, (15, 7)),
+        ])
+
+    if len(exported) > 1:
+        summary = build_comparison_summary(exported)
+        tasks.extend([
+            ("performance_comparison.png", 'performance_comparison', {'summary': summary}, (15, 10)),
+            ("radar_comparison.png", 'radar_comparison', {'summary': summary}, (15, 10)),
+        ])
+    return tasks, skipped
+
+
+def _write_file(path, data):
+    """Write a file under a temporary name and rename it into place"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+@traced('render', name='export_charts')
+def export_charts(results, output_dir, dpi=EXPORT_DPI, normalize=False, max_workers=RENDER_WORKERS,
+                  cache=None, progress=None, cancel_event=None, service=None):
+    """
+    Render the charts of all sheets in worker processes and write them as PNG files.
+
+    Renders are submitted a few per worker at a time and every file is
+    written as soon as its render finishes, so memory use does not grow with
+    the number of sheets. Images already in the figure cache are not drawn
+    again. An export_summary.txt listing the exported and failed charts is
+    written last. Sheets whose charts cannot be drawn (see
+    chart_skip_reason) are skipped and listed in the summary. Renders still
+    queued when cancel_event is set are cancelled.
+
+    Args:
+        results (dict): Sheet name -> sheet result (see contingency_core.SheetResult)
+        output_dir (str or Path): Directory for the chart files, created if needed
+        dpi (int): Resolution of the chart files
+        normalize (bool): Export heatmaps of row percentages instead of counts
+        max_workers (int): Worker processes of the export's own render service; 0 renders in the
+            calling thread. Not used when service is given.
+        cache (FigureCache, optional): Cache of rendered images (default: the service's cache)
+        progress (callable, optional): Called as progress(done, total, relative_path, error)
+            after every chart; error is None on success
+        cancel_event (threading.Event, optional): Stops the export once set
+        service (RenderService, optional): Render service to share; by default the export starts
+            and stops its own
+
+    Returns:
+        dict: Output directory, total and exported chart counts, written files,
+            failed charts (path, error message), skipped sheets (name, reason),
+            elapsed seconds and whether the export was cancelled
+    """
+    start_time = time.perf_counter()
+    output_dir = str(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    tasks, skipped = export_chart_tasks(results, normalize)
+    summary = {
+        'output_dir': output_dir,
+        'total': len(tasks),
+        'exported': 0,
+        'files': [],
+        'failed': [],
+        'skipped': skipped,
+        'elapsed': 0.0,
+        'cancelled': False
+    }
+
+    own_service = service is None
+    if own_service:
+        service = RenderService(max_workers=max_workers, cache=cache)
+    window = max(1, service.max_workers) * EXPORT_QUEUE_PER_WORKER
+    pending = {}
+    queue = iter(tasks)
+    done_count = 0
+    try:
+        while True:
+            cancelled = cancel_event is not None and cancel_event.is_set()
+            while len(pending) < window and not cancelled:
+                task = next(queue, None)
+                if task is None:
+                    break
+                relative_path, chart, params, figsize = task
+                pending[service.submit(chart, params, figsize, dpi, normalize, cache=cache)] = relative_path
+            if cancelled:
+                for future in pending:
+                    future.cancel()
+            if not pending:
+                break
+
+            finished, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in finished:
+                relative_path = pending.pop(future)
+                if future.cancelled():
+                    continue
+                error = None
+                try:
+                    path = os.path.join(output_dir, relative_path)
+                    _write_file(path, future.result())
+                    summary['files'].append(path)
+                    summary['exported'] += 1
+                except Exception as e:
+                    error = str(e)
+                    summary['failed'].append((relative_path, error))
+                done_count += 1
+                if progress is not None:
+                    progress(done_count, len(tasks), relative_path, error)
+    finally:
+        if own_service:
+            service.shutdown(wait=True)
+        else:
+            for future in pending:
+                future.cancel()
+
+    summary['cancelled'] = done_count < len(tasks)
+    summary['elapsed'] = time.perf_counter() - start_time
+    _write_export_summary(summary, results)
+    return summary
+
+
+def _write_export_summary(summary, results):
+    lines = [
+        "Geophysics Analysis Charts Export Summary",
+        "=" * 50,
+        f"Export Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        f"Total Sheets Analyzed: {len(results)}",
+        f"Total Charts Exported: {summary['exported']} of {summary['total']}",
+        f"Export Directory: {summary['output_dir']}",
+        f"Export Time: {summary['elapsed']:.2f}s",
+    ]
+    if summary['cancelled']:
+        lines.append("Export was cancelled before all charts were rendered")
+    lines += ["", "Exported Charts:", "-" * 30]
+    lines += [os.path.relpath(path, summary['output_dir']) for path in summary['files']]
+    if summary['failed']:
+        lines += ["", "Failed Charts:", "-" * 30]
+        lines += [f"{path}: {error}" for path, error in summary['failed']]
+    if summary['skipped']:
+        lines += ["", "Skipped Sheets:", "-" * 30]
+        lines += [f"{sheet_name}: {reason}" for sheet_name, reason in summary['skipped']]
+
+    try:
+        with open(os.path.join(summary['output_dir'], "export_summary.txt"), 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+    except OSError as e:
+        print(f"Warning: Could not write export summary: {e}")
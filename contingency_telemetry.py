@@ -0,0 +1,300 @@
+"""
+Contingency Analysis Telemetry - Geophysics Contingency Analysis Tool v1.0
+
+Copyright (C) 2025 TraceSeis, Inc. All rights reserved.
+
+Local-first usage and performance telemetry. Events (stage timings, sheet
+sizes, memory use, errors) are sampled, queued and written by a background
+thread in batches, so recording an event never blocks the UI thread. Events
+go to an in-memory ring buffer or a local JSON-lines file; forwarding errors
+to Sentry is optional and never enabled by default.
+
+Telemetry is off until configure() is called with an enabled configuration.
+load_config() disables it by default for headless and batch runs.
+"""
+
+import atexit
+import datetime
+import json
+import os
+import queue
+import random
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+
+SINKS = ('memory', 'file')
+
+DEFAULT_CONFIG = {
+    'enabled': True,
+    'sink': 'file',              # 'file' (JSON lines) or 'memory' (ring buffer only)
+    'file': None,                # Path of the JSON-lines file for the file sink
+    'max_file_mb': 5,            # The file is rotated to <file>.1 when it grows past this size
+    'buffer_size': 1000,         # Events kept in the in-memory ring buffer
+    'sample_rate': 1.0,          # Share of performance events kept; errors are always kept
+    'batch_size': 50,            # Events written per batch
+    'flush_interval': 2.0,       # Seconds between batch writes
+    'sentry_enabled': False,     # Forward errors to Sentry (needs network access)
+    'sentry_dsn': None,
+}
+
+# Environment overrides: CONTINGENCY_TELEMETRY=0/1, CONTINGENCY_TELEMETRY_SAMPLE_RATE=0.25
+ENV_ENABLED = 'CONTINGENCY_TELEMETRY'
+ENV_SAMPLE_RATE = 'CONTINGENCY_TELEMETRY_SAMPLE_RATE'
+
+
+def load_config(settings_file=None, headless=False, **defaults):
+    """
+    Build the telemetry configuration.
+
+    Values are taken from DEFAULT_CONFIG, the keyword defaults, the
+    'telemetry' section of the settings file and the environment, in that
+    order. Headless and batch runs are disabled unless the settings or the
+    environment turn telemetry on explicitly.
+
+    Args:
+        settings_file (str or Path, optional): JSON settings file
+        headless (bool): True for command-line and batch runs
+        **defaults: Overrides of DEFAULT_CONFIG (e.g. file=...)
+
+    Returns:
+        dict: Telemetry configuration
+    """
+    config = dict(DEFAULT_CONFIG)
+    config.update(defaults)
+    if headless:
+        config['enabled'] = False
+
+    if settings_file and os.path.exists(settings_file):
+        try:
+            with open(settings_file, 'r') as f:
+                settings = json.load(f).get('telemetry', {})
+            if isinstance(settings, dict):
+                config.update({key: value for key, value in settings.items() if key in DEFAULT_CONFIG})
+        except Exception as e:
+            print(f"Warning: Could not read telemetry settings: {e}")
+
+    env_enabled = os.environ.get(ENV_ENABLED)
+    if env_enabled is not None:
+        config['enabled'] = env_enabled.strip().lower() not in ('0', 'off', 'false', 'no', '')
+    env_rate = os.environ.get(ENV_SAMPLE_RATE)
+    if env_rate:
+        try:
+            config['sample_rate'] = float(env_rate)
+        except ValueError:
+            print(f"Warning: Ignoring invalid {ENV_SAMPLE_RATE}={env_rate!r}")
+
+    config['sample_rate'] = min(1.0, max(0.0, float(config['sample_rate'])))
+    if config['sink'] not in SINKS or (config['sink'] == 'file' and not config['file']):
+        config['sink'] = 'memory'
+    return config
+
+
+class Telemetry:
+    """
+    Sampled, batched telemetry client.
+
+    record() only samples the event and puts it on a queue; a daemon thread
+    writes queued events to the ring buffer and the configured sink in
+    batches. When disabled, record() returns immediately.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.config = dict(DEFAULT_CONFIG, enabled=False)
+        self._buffer = deque(maxlen=DEFAULT_CONFIG['buffer_size'])
+        self._queue = queue.Queue()
+        self._worker = None
+        self._lock = threading.Lock()
+        self._sentry = None
+        self._session = f"{os.getpid()}-{int(time.time())}"
+        self._previous_hooks = None
+
+    def configure(self, config):
+        """Apply a configuration from load_config and start or stop recording"""
+        with self._lock:
+            self.config = dict(config)
+            self._buffer = deque(self._buffer, maxlen=max(1, int(config['buffer_size'])))
+            self.enabled = bool(config['enabled'])
+            if self.enabled and (self._worker is None or not self._worker.is_alive()):
+                self._worker = threading.Thread(target=self._run, name="TelemetryWriter", daemon=True)
+                self._worker.start()
+
+    def record(self, name, category='performance', **fields):
+        """
+        Queue one event.
+
+        Args:
+            name (str): Event name
+            category (str): 'performance', 'usage' or 'error'; only non-error
+                events are subject to sampling
+            **fields: JSON-serializable event data
+        """
+        if not self.enabled:
+            return
+        if category != 'error' and random.random() >= self.config['sample_rate']:
+            return
+
+        self._queue.put({
+            'time': datetime.datetime.now().isoformat(timespec='milliseconds'),
+            'session': self._session,
+            'category': category,
+            'name': name,
+            **fields
+        })
+
+    def record_exception(self, exc_type, exc_value, exc_tb, where=None):
+        """
+        Queue an error event for an exception.
+
+        The exception itself travels with the queued event (it is not
+        written to the sinks) so Sentry receives it with its stack trace.
+        """
+        self.record(
+            'exception', 'error',
+            where=where,
+            exception=exc_type.__name__,
+            message=str(exc_value),
+            traceback=''.join(traceback.format_exception(exc_type, exc_value, exc_tb))[-4000:],
+            exc_info=(exc_type, exc_value, exc_tb)
+        )
+
+    def install_exception_hooks(self):
+        """Record unhandled exceptions of the main and worker threads, then defer to the previous hooks"""
+        if self._previous_hooks is not None:
+            return
+        self._previous_hooks = (sys.excepthook, threading.excepthook)
+
+        def excepthook(exc_type, exc_value, exc_tb):
+            self.record_exception(exc_type, exc_value, exc_tb, 'main')
+            self._previous_hooks[0](exc_type, exc_value, exc_tb)
+
+        def thread_excepthook(args):
+            thread_name = args.thread.name if args.thread else None
+            self.record_exception(args.exc_type, args.exc_value, args.exc_traceback, thread_name)
+            self._previous_hooks[1](args)
+
+        sys.excepthook = excepthook
+        threading.excepthook = thread_excepthook
+
+    def recent_events(self):
+        """Return the events held in the ring buffer, oldest first"""
+        with self._lock:
+            return list(self._buffer)
+
+    def flush(self, timeout=5.0):
+        """Wait until queued events have been written; returns False on timeout"""
+        if self._worker is None or not self._worker.is_alive():
+            return self._queue.empty()
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def shutdown(self, timeout=2.0):
+        """Stop recording and write the events still queued"""
+        self.flush(timeout)
+        self.enabled = False
+
+    def _run(self):
+        """Writer thread: collect queued events into batches and write them"""
+        while True:
+            batch = []
+            markers = []
+            deadline = time.monotonic() + self.config['flush_interval']
+            while len(batch) < self.config['batch_size']:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if isinstance(item, threading.Event):
+                    markers.append(item)
+                    break
+                batch.append(item)
+
+            if batch:
+                try:
+                    self._write(batch)
+                except Exception as e:
+                    print(f"Warning: Failed to write telemetry events: {e}")
+            for marker in markers:
+                marker.set()
+
+    def _write(self, batch):
+        # Live exceptions are only for Sentry; the sinks get the formatted traceback
+        exc_infos = [event.pop('exc_info', None) for event in batch]
+        with self._lock:
+            self._buffer.extend(batch)
+            config = self.config
+
+        if config['sink'] == 'file':
+            self._write_file(config, batch)
+
+        if config['sentry_enabled'] and config['sentry_dsn']:
+            self._forward_errors(config, [(event, exc_info) for event, exc_info in zip(batch, exc_infos)
+                                          if event['category'] == 'error'])
+
+    @staticmethod
+    def _write_file(config, batch):
+        """Append events as JSON lines, rotating the file when it gets too large"""
+        path = config['file']
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        try:
+            if os.path.getsize(path) > config['max_file_mb'] * 1024 * 1024:
+                os.replace(path, f"{path}.1")
+        except OSError:
+            pass
+
+        with open(path, 'a', encoding='utf-8') as f:
+            for event in batch:
+                f.write(json.dumps(event, default=str) + '\n')
+
+    def _forward_errors(self, config, errors):
+        """
+        Send error events to Sentry; sentry_sdk is imported and initialized on first use.
+
+        Sentry only receives errors: performance tracing is left off, and
+        sample_rate, which samples local events, is not passed on.
+
+        Args:
+            config (dict): Telemetry configuration
+            errors (list): (event, exc_info or None) pairs
+        """
+        if not errors:
+            return
+        if self._sentry is None:
+            try:
+                import sentry_sdk
+            except ImportError:
+                print("Warning: sentry_sdk not installed, errors are only recorded locally")
+                self._sentry = False
+                return
+            sentry_sdk.init(dsn=config['sentry_dsn'])
+            self._sentry = sentry_sdk
+        if not self._sentry:
+            return
+
+        for event, exc_info in errors:
+            if exc_info is not None:
+                self._sentry.capture_exception(exc_info)
+            else:
+                message = f"{event.get('exception')}: {event.get('message')}"
+                if event.get('traceback'):
+                    message = f"{message}\n\n{event['traceback']}"
+                self._sentry.capture_message(message, level='error')
+
+
+# Process-wide telemetry client; disabled until configured
+TELEMETRY = Telemetry()
+atexit.register(TELEMETRY.shutdown)
+
+
+def configure(config):
+    """Apply a telemetry configuration to the process-wide client"""
+    TELEMETRY.configure(config)
+
+
+def record(name, category='performance', **fields):
+    """Queue one event on the process-wide client (see Telemetry.record)"""
+    TELEMETRY.record(name, category, **fields)
@@ -0,0 +1,231 @@
+"""
+Contingency Analysis Tracing - Geophysics Contingency Analysis Tool v1.0
+
+Copyright (C) 2025 TraceSeis, Inc. All rights reserved.
+
+Opt-in timing instrumentation for the analysis pipeline. Code is wrapped in
+named spans (see span and traced); while tracing is off a span costs a
+single attribute check. Recorded spans carry the process and thread they
+ran in, can be exported as Chrome trace-event JSON (chrome://tracing,
+https://ui.perfetto.dev) and summarized per stage.
+
+Spans recorded in process pool workers are collected by running the task
+through run_traced and merging the returned events with Tracer.add_events.
+"""
+
+import functools
+import json
+import multiprocessing
+import os
+import threading
+import time
+from contextlib import nullcontext
+
+_NULL_SPAN = nullcontext()
+
+
+class _Span:
+    """Context manager timing one span"""
+    __slots__ = ('tracer', 'name', 'category', 'args', 'start_ns')
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start_ns = 0
+
+    def __enter__(self):
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.tracer._record(self.name, self.category, self.start_ns, time.perf_counter_ns(), self.args)
+        return False
+
+
+class Tracer:
+    """
+    Thread-safe collector of timed spans.
+
+    Events use the Chrome trace-event format: one complete ('X') event per
+    span with timestamps in microseconds, plus metadata ('M') events naming
+    each process and thread the first time it records a span.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._events = []
+        self._named_threads = set()
+        self._lock = threading.Lock()
+
+    def enable(self):
+        """Start recording spans"""
+        self.enabled = True
+
+    def disable(self):
+        """Stop recording spans; recorded events are kept"""
+        self.enabled = False
+
+    def clear(self):
+        """Discard all recorded events"""
+        with self._lock:
+            self._events = []
+            self._named_threads = set()
+
+    def span(self, name, category='analysis', **args):
+        """
+        Time the enclosed block as one span.
+
+        Args:
+            name (str): Stage name
+            category (str): Stage category ('io', 'analysis', 'render', ...)
+            **args: Extra values shown with the span (e.g. sheet name)
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category, args)
+
+    def _record(self, name, category, start_ns, end_ns, args):
+        pid = os.getpid()
+        tid = threading.get_ident()
+        event = {
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': start_ns / 1000,
+            'dur': (end_ns - start_ns) / 1000,
+            'pid': pid,
+            'tid': tid
+        }
+        if args:
+            event['args'] = {key: str(value) for key, value in args.items()}
+
+        with self._lock:
+            if (pid, None) not in self._named_threads:
+                self._named_threads.add((pid, None))
+                self._events.append({
+                    'name': 'process_name', 'ph': 'M', 'pid': pid,
+                    'args': {'name': f"{multiprocessing.current_process().name} ({pid})"}
+                })
+            if (pid, tid) not in self._named_threads:
+                self._named_threads.add((pid, tid))
+                self._events.append({
+                    'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+                    'args': {'name': threading.current_thread().name}
+                })
+            self._events.append(event)
+
+    def events(self):
+        """Return a copy of the recorded events"""
+        with self._lock:
+            return list(self._events)
+
+    def drain(self):
+        """Return the recorded events and clear them"""
+        with self._lock:
+            events, self._events = self._events, []
+            self._named_threads = set()
+        return events
+
+    def add_events(self, events):
+        """Merge events recorded elsewhere, e.g. in a worker process"""
+        if events:
+            with self._lock:
+                self._events.extend(events)
+
+    def export_chrome_trace(self, file_path):
+        """Write the recorded events as a Chrome trace-event JSON file"""
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': self.events(), 'displayTimeUnit': 'ms'}, f)
+
+    def summary(self, events=None):
+        """
+        Aggregate spans per stage.
+
+        Args:
+            events (list, optional): Events to summarize; all recorded events when omitted
+
+        Returns:
+            list: Dicts with name, category, calls, total_ms, mean_ms and max_ms,
+                sorted by total time (nested spans are also counted in their parents)
+        """
+        stages = {}
+        for event in self.events() if events is None else events:
+            if event['ph'] != 'X':
+                continue
+            key = (event['name'], event['cat'])
+            calls, total, longest = stages.get(key, (0, 0.0, 0.0))
+            stages[key] = (calls + 1, total + event['dur'], max(longest, event['dur']))
+
+        rows = [
+            {
+                'name': name,
+                'category': category,
+                'calls': calls,
+                'total_ms': total / 1000,
+                'mean_ms': total / calls / 1000,
+                'max_ms': longest / 1000
+            }
+            for (name, category), (calls, total, longest) in stages.items()
+        ]
+        rows.sort(key=lambda row: row['total_ms'], reverse=True)
+        return rows
+
+    def format_summary(self):
+        """Return the per-stage summary as a text table"""
+        rows = self.summary()
+        if not rows:
+            return "No spans recorded."
+
+        name_width = max(len('Stage'), max(len(row['name']) for row in rows))
+        lines = [
+            f"{'Stage':<{name_width}}  {'Category':<10} {'Calls':>7} {'Total (ms)':>12} {'Mean (ms)':>11} {'Max (ms)':>11}",
+            '-' * (name_width + 57)
+        ]
+        for row in rows:
+            lines.append(
+                f"{row['name']:<{name_width}}  {row['category']:<10} {row['calls']:>7} "
+                f"{row['total_ms']:>12.2f} {row['mean_ms']:>11.3f} {row['max_ms']:>11.3f}"
+            )
+        return '\n'.join(lines)
+
+
+# Process-wide tracer used by the analysis pipeline, the GUI and the CLI
+TRACER = Tracer()
+
+
+def span(name, category='analysis', **args):
+    """Time the enclosed block on the process-wide tracer (see Tracer.span)"""
+    return TRACER.span(name, category, **args)
+
+
+def traced(category='analysis', name=None):
+    """Decorator recording each call of the function as a span on the process-wide tracer"""
+    def decorator(fn):
+        span_name = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not TRACER.enabled:
+                return fn(*args, **kwargs)
+            with TRACER.span(span_name, category):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def run_traced(fn, *args, **kwargs):
+    """
+    Run fn with tracing enabled; process pool entry point.
+
+    Returns:
+        tuple: (fn result, list of events recorded during the call)
+    """
+    TRACER.enable()
+    try:
+        result = fn(*args, **kwargs)
+    finally:
+        TRACER.disable()
+        events = TRACER.drain()
+    return result, events
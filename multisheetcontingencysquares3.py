@@ -1,10 +1,3 @@
-import sentry_sdk
-
-sentry_sdk.init(
-    dsn="https://507cd6c4eef6dffe261e7ab059c1d464@o4509867581440000.ingest.us.sentry.io/4509888618627072",
-    traces_sample_rate=1.0,
-)
-
 #!/usr/bin/env python3
 """
 Geophysics Contingency Analysis Tool v1.0
@@ -39,16 +32,9 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import seaborn as sns
-from scipy.stats import chi2_contingency, pearsonr
-from scipy.ndimage import uniform_filter1d
 import os
 import traceback
 import time
-from math import pi
 import threading
 from queue import Queue, Empty
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -56,6 +42,7 @@ import concurrent.futures
 import tempfile
 import zipfile
 import json
+import base64
 import datetime
 import hashlib
 import shutil
@@ -65,12 +52,97 @@ import weakref
 import signal
 import sys
 import gc
+import multiprocessing
+import importlib
+import importlib.util
+
+from contingency_core import (
+    STREAMING_MIN_CELLS,
+    som_to_confusion_matrix,
+    sparse_counts,
+    contingency_statistics,
+    clean_sheet_frame,
+    sanitize_count_matrix,
+    build_som_matrix,
+    analyze_sheet_file,
+    analyze_workbook_sheets,
+    sheet_results_from_statistics,
+    sheet_results_from_compact,
+    SheetResult,
+    WorkbookReader,
+    AnalysisCache,
+    worksheet_fingerprints,
+    worksheet_sizes,
+    build_comparison_summary,
+    sheet_contingency_statistics,
+    cached_normalized_confusion_matrix,
+    qc_grade_summary,
+    chi_square_qc_summary,
+    overall_qc_grade,
+    comparison_readiness_status,
+    format_qc_report,
+)
+from contingency_memory import MemoryBudget, process_memory_mb
+from contingency_trace import TRACER, span, traced, run_traced
+from contingency_figures import FigureCache
+from contingency_render import (
+    EXPORT_DPI,
+    RENDER_WORKERS,
+    SHEET_CHART_METRICS,
+    RenderService,
+    draw_chart,
+    export_charts as export_chart_files,
+)
+from contingency_telemetry import (
+    TELEMETRY,
+    load_config as load_telemetry_config,
+    configure as configure_telemetry,
+)
+
+class LazyImport:
+    """
+    Stand-in for a module, or a module attribute, that is imported on first use.
+    matplotlib and seaborn account for most of the start-up time, so they are
+    only loaded when the first chart is drawn.
+    """
+    def __init__(self, module_name, attribute=None):
+        self._module_name = module_name
+        self._attribute = attribute
+        self._target = None
+    
+    def _resolve(self):
+        if self._target is None:
+            target = importlib.import_module(self._module_name)
+            if self._attribute is not None:
+                target = getattr(target, self._attribute)
+            self._target = target
+        return self._target
+    
+    def __getattr__(self, name):
+        return getattr(self._resolve(), name)
+    
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+plt = LazyImport('matplotlib.pyplot')
+sns = LazyImport('seaborn')
+Figure = LazyImport('matplotlib.figure', 'Figure')
+FigureCanvasTkAgg = LazyImport('matplotlib.backends.backend_tkagg', 'FigureCanvasTkAgg')
+NavigationToolbar2Tk = LazyImport('matplotlib.backends.backend_tkagg', 'NavigationToolbar2Tk')
 
 # Thread Pool Safety Constants
 MAX_WORKERS = 2
 THREAD_POOL_TIMEOUT = 30
 EMERGENCY_CLEANUP_TIMEOUT = 10
 
+# Process pool for parallel sheet analysis (one core is left for the GUI)
+PROCESS_POOL_WORKERS = max(1, (os.cpu_count() or 1) - 1)
+PARALLEL_MIN_SHEETS = 2
+PROCESS_POLL_INTERVAL = 0.2
+
+# Milliseconds between checks for charts rendered by worker processes
+RENDER_POLL_MS = 50
+
 class SafeThreadPoolManager:
     """
     Thread-safe thread pool manager with comprehensive cleanup and error handling.
@@ -163,16 +235,57 @@ class SafeThreadPoolManager:
             print("Emergency thread pool cleanup...")
             self.shutdown(wait=True, timeout=EMERGENCY_CLEANUP_TIMEOUT)
 
+class SafeProcessPoolManager:
+    """
+    Process pool manager for CPU-bound sheet analysis.
+    Workers are started lazily and the pool is reused across analyses.
+    """
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers or PROCESS_POOL_WORKERS
+        self._executor = None
+        self._lock = threading.Lock()
+        
+        # Register cleanup on program exit
+        atexit.register(self.shutdown, wait=False)
+    
+    def get_executor(self):
+        """Thread-safe lazy initialization of process pool executor"""
+        with self._lock:
+            if self._executor is None:
+                # Spawned workers do not inherit the Tk interpreter and threads of this process
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._executor
+    
+    def submit_task(self, fn, *args, **kwargs):
+        """Submit a task to the process pool"""
+        return self.get_executor().submit(fn, *args, **kwargs)
+    
+    def shutdown(self, wait=True):
+        """Shut down the worker processes, cancelling queued tasks"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is None:
+            return True
+        try:
+            executor.shutdown(wait=wait, cancel_futures=True)
+            return True
+        except Exception as e:
+            print(f"Error during process pool shutdown: {e}")
+            return False
+
 def signal_handler(signum, frame):
     """Handle Ctrl+C and other interrupt signals gracefully"""
     print("Received interrupt signal, cleaning up...")
     # Force cleanup and exit
     sys.exit(0)
 
-# Register signal handlers for graceful shutdown
-signal.signal(signal.SIGINT, signal_handler)
-if hasattr(signal, 'SIGTERM'):
-    signal.signal(signal.SIGTERM, signal_handler)
+def install_signal_handlers():
+    """Register signal handlers for graceful shutdown"""
+    signal.signal(signal.SIGINT, signal_handler)
+    if hasattr(signal, 'SIGTERM'):
+        signal.signal(signal.SIGTERM, signal_handler)
 
 class VisualizationWindow:
     """Separate window for displaying visualizations with better UI"""
@@ -181,6 +294,9 @@ class VisualizationWindow:
         self.analyzer = analyzer
         self.window = None
         self.notebook = None
+        # Tabs are registered as placeholders and rendered on first selection
+        self.pending_tabs = {}
+        self._rendering_frame = None
         
     def create_window(self):
         """Create the visualization window"""
@@ -256,6 +372,7 @@ class VisualizationWindow:
         # Create notebook for tabs with larger size
         self.notebook = ttk.Notebook(main_frame)
         self.notebook.pack(fill=tk.BOTH, expand=True)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         
         # Load visualizations
         self.load_visualizations()
@@ -263,6 +380,7 @@ class VisualizationWindow:
     def load_visualizations(self):
         """Load all available visualizations into the window"""
         try:
+            self.pending_tabs.clear()
             if hasattr(self, 'notebook') and self.notebook:
                 for tab in self.notebook.tabs():
                     self.notebook.forget(tab)
@@ -278,70 +396,161 @@ class VisualizationWindow:
             else:
                 print("Warning: No valid data available for visualization")
                 self.create_placeholder()
+            
+            # Only the selected tab is rendered now; the others on first selection
+            if self.pending_tabs:
+                self.prepare_visualizations()
+                self.notebook.after_idle(self.render_selected_tab)
         except Exception as e:
             print(f"Warning: Failed to load visualizations: {e}")
             self.create_error_tab(str(e))
     
     def create_multi_sheet_visualizations(self):
-        """Create visualizations for multi-sheet analysis"""
+        """Register the visualization tabs of a multi-sheet analysis"""
         try:
             # Summary Dashboard
-            self.create_summary_dashboard_in_window()
+            self.register_tab("Summary Dashboard", self.create_summary_dashboard_in_window)
             
             # Performance Comparison
-            self.create_performance_comparison_in_window()
+            self.register_tab("Performance Comparison", self.create_performance_comparison_in_window)
             
             # NEW: Multi-Sheet Side-by-Side View
-            self.create_multi_sheet_side_by_side_view()
+            self.register_tab("Multi-Sheet View", self.create_multi_sheet_side_by_side_view)
             
             # Individual Sheet Details (enhanced)
-            self.create_individual_sheets_in_window()
+            self.register_tab("Individual Sheets", self.create_individual_sheets_in_window)
             
             # NEW: All Sheets Combined View
-            self.create_all_sheets_combined_view()
+            self.register_tab("Performance Matrix", self.create_all_sheets_combined_view)
             
             # NEW: Multi-Sheet Radar Analysis
-            self.create_multi_sheet_radar_analysis_in_window()
+            self.register_tab("Multi-Sheet Radar Analysis", self.create_multi_sheet_radar_analysis_in_window)
             
             # NEW: Multi-Sheet Pie Chart Analysis
-            self.create_multi_sheet_pie_chart_analysis_in_window()
+            self.register_tab("Multi-Sheet Pie Analysis", self.create_multi_sheet_pie_chart_analysis_in_window)
             
         except Exception as e:
             self.create_error_tab(f"Multi-sheet visualization error: {str(e)}")
     
     def create_single_sheet_visualizations(self):
-        """Create visualizations for single sheet analysis"""
+        """Register the visualization tabs of a single sheet analysis"""
         try:
-            # Get the single sheet data
-            if hasattr(self.analyzer, 'batch_results') and self.analyzer.batch_results:
-                sheet_name = list(self.analyzer.batch_results.keys())[0]
-                sheet_data = self.analyzer.batch_results[sheet_name]
-            else:
-                sheet_name = "Current Analysis"
-                sheet_data = None
-            
             # Confusion Heatmap
-            self.create_confusion_heatmap_in_window()
+            self.register_tab("Confusion Heatmap", self.create_confusion_heatmap_in_window)
             
             # Distribution Charts
-            self.create_distribution_charts_in_window()
+            self.register_tab("Distributions", self.create_distribution_charts_in_window)
             
             # Metrics Comparison
-            self.create_metrics_comparison_in_window()
+            self.register_tab("Metrics Comparison", self.create_metrics_comparison_in_window)
             
             # Radar Chart Analysis
-            self.create_radar_analysis_in_window()
+            self.register_tab("Radar Analysis", self.create_radar_analysis_in_window)
             
             # Pie Chart Analysis
-            self.create_pie_chart_analysis_in_window()
+            self.register_tab("Pie Chart Analysis", self.create_pie_chart_analysis_in_window)
             
         except Exception as e:
             self.create_error_tab(f"Single-sheet visualization error: {str(e)}")
     
+    def register_tab(self, title, builder):
+        """
+        Add a placeholder tab that is rendered by builder when it is first selected.
+        
+        Args:
+            title (str): Tab title
+            builder (callable): Method that fills the tab (see tab_frame)
+        """
+        frame = ttk.Frame(self.notebook)
+        self.notebook.add(frame, text=title)
+        ttk.Label(frame, text=f"Loading {title}...", font=('Arial', 14),
+                 foreground='gray').pack(expand=True)
+        self.pending_tabs[str(frame)] = builder
+    
+    def tab_frame(self, title):
+        """
+        Frame a tab builder draws into.
+        
+        While a registered tab is being rendered this is its placeholder frame
+        (emptied); otherwise a new tab is added to the notebook.
+        
+        Args:
+            title (str): Tab title
+            
+        Returns:
+            ttk.Frame: Tab frame
+        """
+        frame = self._rendering_frame
+        if frame is None:
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=title)
+        else:
+            for child in frame.winfo_children():
+                child.destroy()
+        return frame
+    
+    def render_tab(self, tab_id):
+        """Render a registered tab if it has not been rendered yet"""
+        builder = self.pending_tabs.pop(tab_id, None)
+        if builder is None:
+            return
+        
+        frame = self.notebook.nametowidget(tab_id)
+        self._rendering_frame = frame
+        try:
+            with span('render_tab', 'render', tab=self.notebook.tab(tab_id, 'text')):
+                builder()
+        except Exception as e:
+            print(f"Warning: Failed to render visualization tab: {e}")
+            for child in frame.winfo_children():
+                child.destroy()
+            ttk.Label(frame, text=f"Error creating visualization:\n\n{e}", font=('Arial', 12),
+                     foreground='red', wraplength=600).pack(expand=True, padx=20, pady=20)
+        finally:
+            self._rendering_frame = None
+    
+    def render_selected_tab(self):
+        """Render the selected tab if it is still a placeholder"""
+        if self.window is None or self.notebook is None or not self.notebook.winfo_exists():
+            return
+        selected = self.notebook.select()
+        if selected in self.pending_tabs:
+            self.render_tab(selected)
+    
+    def _on_tab_changed(self, event=None):
+        """Render a placeholder tab once it is selected"""
+        # Let the placeholder show before the figures are drawn
+        self.notebook.after_idle(self.render_selected_tab)
+    
+    def prepare_visualizations(self):
+        """
+        Prepare tab rendering in a background thread.
+        
+        Loads the chart modules and computes the normalized confusion matrices
+        and QC summaries the tabs display, so the first render of a tab only
+        builds widgets. Tk widgets themselves are only created on the UI thread.
+        """
+        results = dict(getattr(self.analyzer, 'batch_results', None) or {})
+        
+        def prepare():
+            try:
+                with span('prepare_visualizations', 'render', sheets=len(results)):
+                    Figure._resolve()
+                    FigureCanvasTkAgg._resolve()
+                    for result in results.values():
+                        if result is None or result.get('confusion_matrix') is None:
+                            continue
+                        cached_normalized_confusion_matrix(result['confusion_matrix'])
+                        chi_square_qc_summary(result)
+            except Exception as e:
+                print(f"Warning: Could not prepare visualizations: {e}")
+        
+        threading.Thread(target=prepare, name="VisualizationPrepare", daemon=True).start()
+    
+    @traced('render')
     def create_summary_dashboard_in_window(self):
         """Create summary dashboard tab"""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="Summary Dashboard")
+        frame = self.tab_frame("Summary Dashboard")
         
         # Create scrollable canvas
         canvas = tk.Canvas(frame, bg='white')
@@ -450,10 +659,10 @@ Total Samples: {best_config['Total_Samples']:,}"""
         tree.configure(yscrollcommand=tree_scroll.set)
         tree_scroll.pack(side=tk.RIGHT, fill=tk.Y)
     
+    @traced('render')
     def create_performance_comparison_in_window(self):
         """Create performance comparison charts"""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="Performance Comparison")
+        frame = self.tab_frame("Performance Comparison")
         
         # Create scrollable canvas
         canvas = tk.Canvas(frame, bg='white')
@@ -469,72 +678,9 @@ Total Samples: {best_config['Total_Samples']:,}"""
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set, xscrollcommand=h_scrollbar.set)
         
-        # Create figure with subplots
-        fig = Figure(figsize=(15, 10), dpi=100, facecolor='white')
-        
-        # Accuracy comparison
-        ax1 = fig.add_subplot(2, 2, 1)
-        sheets = self.analyzer.comparison_summary['SOM_Config']
-        accuracies = self.analyzer.comparison_summary['Global_Fit']
-        
-        bars = ax1.bar(range(len(sheets)), accuracies, color='skyblue', edgecolor='navy')
-        ax1.set_title('Classification Accuracy by Sheet', fontsize=14, fontweight='bold')
-        ax1.set_ylabel('Classification Accuracy (%)')
-        ax1.set_xticks(range(len(sheets)))
-        ax1.set_xticklabels(sheets, rotation=45, ha='right')
-        ax1.grid(True, alpha=0.3)
-        
-        # Add value labels on bars
-        for bar, acc in zip(bars, accuracies):
-            ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1,
-                    f'{acc:.1f}%', ha='center', va='bottom', fontweight='bold')
-        
-        # Cramer's V comparison
-        ax2 = fig.add_subplot(2, 2, 2)
-        cramers_v = self.analyzer.comparison_summary['Cramers_V']
-        
-        bars2 = ax2.bar(range(len(sheets)), cramers_v, color='lightcoral', edgecolor='darkred')
-        ax2.set_title('Association Strength (Cramer\'s V)', fontsize=14, fontweight='bold')
-        ax2.set_ylabel('Cramer\'s V')
-        ax2.set_xticks(range(len(sheets)))
-        ax2.set_xticklabels(sheets, rotation=45, ha='right')
-        ax2.grid(True, alpha=0.3)
-        
-        # Utilization comparison
-        ax3 = fig.add_subplot(2, 2, 3)
-        utilization = self.analyzer.comparison_summary['Utilization']
-        
-        bars3 = ax3.bar(range(len(sheets)), utilization, color='lightgreen', edgecolor='darkgreen')
-        ax3.set_title('Neuron Utilization', fontsize=14, fontweight='bold')
-        ax3.set_ylabel('Neuron Utilization (%)')
-        ax3.set_xticks(range(len(sheets)))
-        ax3.set_xticklabels(sheets, rotation=45, ha='right')
-        ax3.grid(True, alpha=0.3)
-        
-        # Combined scatter plot
-        ax4 = fig.add_subplot(2, 2, 4)
-        scatter = ax4.scatter(cramers_v, accuracies, c=utilization, 
-                             cmap='viridis', s=100, alpha=0.7, edgecolors='black')
-        ax4.set_xlabel('Cramer\'s V (Association Strength)')
-        ax4.set_ylabel('Classification Accuracy (%)')
-        ax4.set_title('Performance Overview', fontsize=14, fontweight='bold')
-        ax4.grid(True, alpha=0.3)
-        
-        # Add colorbar
-        cbar = fig.colorbar(scatter, ax=ax4)
-        cbar.set_label('Neuron Utilization (%)')
-        
-        # Add sheet labels to scatter points
-        for i, sheet in enumerate(sheets):
-            ax4.annotate(sheet, (cramers_v.iloc[i], accuracies.iloc[i]), 
-                        xytext=(5, 5), textcoords='offset points', 
-                        fontsize=8, alpha=0.8)
-        
-        fig.tight_layout()
-        
-        canvas_fig = FigureCanvasTkAgg(fig, scrollable_frame)
-        canvas_fig.draw()
-        canvas_fig.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        # Accuracy, association strength and utilization per sheet
+        self.show_figure(scrollable_frame, 'performance_comparison', {'summary': self.analyzer.comparison_summary},
+                         (15, 10), fill=tk.BOTH, expand=True)
         
         # Configure scrolling
         canvas.pack(side="left", fill="both", expand=True)
@@ -569,10 +715,10 @@ Total Samples: {best_config['Total_Samples']:,}"""
             except Exception:
                 pass
     
+    @traced('render')
     def create_individual_sheets_in_window(self):
         """Create individual sheet details"""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="Individual Sheets")
+        frame = self.tab_frame("Individual Sheets")
         
         # Create scrollable canvas for the entire tab
         canvas = tk.Canvas(frame, bg='white')
@@ -666,6 +812,98 @@ Inactive Neurons: {sheet_data['percent_undefined']:.1f}%"""
             
             self.create_mini_heatmap(matrix_frame, sheet_data['confusion_matrix'])
     
+    def normalization_enabled(self):
+        """Whether confusion matrices are shown as row percentages"""
+        normalize = getattr(self.analyzer, 'normalize_confusion_matrices', None)
+        return bool(normalize is not None and normalize.get())
+    
+    def show_figure(self, parent, chart, params, figsize, dpi=100, **pack_options):
+        """
+        Display a chart rendered off the UI thread.
+        
+        The chart is drawn with the Agg backend by the analyzer's render
+        service (worker processes) and shown as an image once it is ready;
+        images of views drawn before come from the figure cache at once.
+        Double-clicking the image opens the chart on an interactive canvas
+        for zooming and panning. Without a render service the chart is drawn
+        into a FigureCanvasTkAgg on the UI thread.
+        
+        Args:
+            parent: Widget the chart is packed into
+            chart (str): Chart type (see contingency_render.CHARTS)
+            params (dict): Data and options of the drawing function
+            figsize (tuple): Figure size in inches
+            dpi (int): Rendering resolution
+            **pack_options: Options for packing the chart widget
+            
+        Returns:
+            tk.Widget: The packed chart widget
+        """
+        service = getattr(self.analyzer, 'render_service', None)
+        if service is None:
+            canvas = FigureCanvasTkAgg(draw_chart(chart, params, figsize, dpi), parent)
+            canvas.draw()
+            widget = canvas.get_tk_widget()
+            widget.pack(**pack_options)
+            return widget
+        
+        future = service.submit(chart, params, figsize, dpi, self.normalization_enabled())
+        widget = tk.Label(parent, text="Rendering chart...", font=('Arial', 11), foreground='gray',
+                          bg='white', borderwidth=0, padx=20, pady=20)
+        widget.pack(**pack_options)
+        self._show_rendered_figure(widget, future, chart, params, figsize, dpi)
+        return widget
+    
+    def _show_rendered_figure(self, widget, future, chart, params, figsize, dpi):
+        """Put the image of a finished render into its placeholder; polls until the render is done"""
+        if not widget.winfo_exists():
+            future.cancel()
+            return
+        if not future.done():
+            widget.after(RENDER_POLL_MS, self._show_rendered_figure, widget, future, chart, params, figsize, dpi)
+            return
+        
+        try:
+            image = future.result()
+            photo = tk.PhotoImage(master=widget, data=base64.b64encode(image).decode('ascii'))
+        except Exception as e:
+            print(f"Warning: Failed to render {chart} chart: {e}")
+            widget.configure(text=f"Failed to render chart: {str(e)}", foreground='red')
+            return
+        
+        widget.configure(image=photo, text="", cursor='hand2')
+        widget.image = photo  # Keep a reference; Tk does not
+        widget.bind("<Double-Button-1>",
+                    lambda event: self.open_interactive_figure(chart, params, figsize, dpi))
+    
+    def first_sheet_metrics(self):
+        """
+        Metrics of the first analyzed sheet for the single-sheet radar and pie charts.
+        
+        Returns:
+            dict: Sheet metrics (missing values as 0), or None without batch results
+        """
+        batch_results = getattr(self.analyzer, 'batch_results', None)
+        if not batch_results:
+            return None
+        sheet_data = next(iter(batch_results.values()))
+        return {name: sheet_data.get(name) or 0 for name in SHEET_CHART_METRICS + ('data_completeness',)}
+    
+    def open_interactive_figure(self, chart, params, figsize, dpi=100):
+        """Open a chart on an interactive canvas with zoom and pan tools"""
+        try:
+            top = tk.Toplevel(self.window)
+            top.title("TraceSeis Geophysics Analysis - Chart")
+            top.configure(bg='white')
+            
+            canvas = FigureCanvasTkAgg(draw_chart(chart, params, figsize, dpi), top)
+            toolbar = NavigationToolbar2Tk(canvas, top)
+            toolbar.update()
+            canvas.draw()
+            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        except Exception as e:
+            messagebox.showerror("Chart Error", f"Failed to open the chart: {str(e)}")
+    
     def create_mini_heatmap(self, parent, confusion_matrix):
         """Create a small heatmap for the confusion matrix"""
         try:
@@ -682,43 +920,9 @@ Inactive Neurons: {sheet_data['percent_undefined']:.1f}%"""
                     display_matrix = confusion_matrix
                     matrix_title = 'Confusion Matrix Heatmap (Normalization Failed)'
             
-            fig = Figure(figsize=(8, 6), dpi=100, facecolor='white')
-            ax = fig.add_subplot(111)
-            
-            # Create heatmap
-            im = ax.imshow(display_matrix.values, cmap='Blues', aspect='auto')
-            
-            # Set ticks and labels
-            ax.set_xticks(range(len(display_matrix.columns)))
-            ax.set_yticks(range(len(display_matrix.index)))
-            ax.set_xticklabels(display_matrix.columns, rotation=45, ha='right')
-            ax.set_yticklabels(display_matrix.index)
-            
-            # Add text annotations
-            for i in range(len(display_matrix.index)):
-                for j in range(len(display_matrix.columns)):
-                    value = display_matrix.iloc[i, j]
-                    if hasattr(self.analyzer, 'normalize_confusion_matrices') and self.analyzer.normalize_confusion_matrices.get():
-                        # Show as percentage with 1 decimal place
-                        text = ax.text(j, i, f"{value:.1f}%",
-                                      ha="center", va="center", color="black", fontweight='bold')
-                    else:
-                        # Show as integer count
-                        text = ax.text(j, i, f"{int(value)}",
-                                      ha="center", va="center", color="black", fontweight='bold')
-            
-            ax.set_title(matrix_title, fontsize=12, fontweight='bold')
-            ax.set_xlabel('Actual')
-            ax.set_ylabel('Predicted')
-            
-            # Add colorbar
-            fig.colorbar(im, ax=ax, shrink=0.6)
-            
-            fig.tight_layout()
-            
-            canvas = FigureCanvasTkAgg(fig, parent)
-            canvas.draw()
-            canvas.get_tk_widget().pack()
+            self.show_figure(parent, 'matrix_grid',
+                             {'matrix': display_matrix, 'title': matrix_title, 'percent': self.normalization_enabled()},
+                             (8, 6))
             
         except Exception as e:
             print(f"Error creating mini heatmap: {e}")
@@ -727,10 +931,10 @@ Inactive Neurons: {sheet_data['percent_undefined']:.1f}%"""
                                    font=('Arial', 10), foreground='red')
             error_label.pack(pady=10)
     
+    @traced('render')
     def create_multi_sheet_side_by_side_view(self):
         """Create side-by-side view of multiple sheets simultaneously"""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="Multi-Sheet View")
+        frame = self.tab_frame("Multi-Sheet View")
         
         # Create main scrollable canvas
         main_canvas = tk.Canvas(frame, bg='white')
@@ -833,43 +1037,9 @@ Neuron Utilization: {(sheet_data['active_neurons']/sheet_data['total_neurons']*1
                     display_matrix = confusion_matrix
                     matrix_title = 'Confusion Matrix (Normalization Failed)'
             
-            fig = Figure(figsize=(4, 3), dpi=80, facecolor='white')
-            ax = fig.add_subplot(111)
-            
-            # Create heatmap
-            im = ax.imshow(display_matrix.values, cmap='Blues', aspect='auto')
-            
-            # Simplified labels for mini view
-            if len(display_matrix.columns) <= 6:
-                ax.set_xticks(range(len(display_matrix.columns)))
-                ax.set_yticks(range(len(display_matrix.index)))
-                ax.set_xticklabels([str(c)[:8] for c in display_matrix.columns], rotation=45, ha='right', fontsize=8)
-                ax.set_yticklabels([str(i)[:8] for i in display_matrix.index], fontsize=8)
-            else:
-                ax.set_xticks([])
-                ax.set_yticks([])
-            
-            # Add text annotations for small matrices
-            if display_matrix.shape[0] <= 5 and display_matrix.shape[1] <= 5:
-                for i in range(len(display_matrix.index)):
-                    for j in range(len(display_matrix.columns)):
-                        value = display_matrix.iloc[i, j]
-                        if hasattr(self.analyzer, 'normalize_confusion_matrices') and self.analyzer.normalize_confusion_matrices.get():
-                            # Show as percentage with 1 decimal place
-                            ax.text(j, i, f"{value:.1f}%",
-                                   ha="center", va="center", color="black", fontsize=8, fontweight='bold')
-                        else:
-                            # Show as integer count
-                            ax.text(j, i, f"{int(value)}",
-                                   ha="center", va="center", color="black", fontsize=8, fontweight='bold')
-            
-            ax.set_title(matrix_title, fontsize=10, fontweight='bold')
-            
-            fig.tight_layout()
-            
-            canvas = FigureCanvasTkAgg(fig, parent)
-            canvas.draw()
-            canvas.get_tk_widget().pack()
+            self.show_figure(parent, 'mini_matrix',
+                             {'matrix': display_matrix, 'title': matrix_title, 'percent': self.normalization_enabled()},
+                             (4, 3), dpi=80)
             
         except Exception as e:
             print(f"Error creating mini confusion heatmap: {e}")
@@ -878,10 +1048,10 @@ Neuron Utilization: {(sheet_data['active_neurons']/sheet_data['total_neurons']*1
                                    font=('Arial', 10), foreground='red')
             error_label.pack(pady=10)
     
+    @traced('render')
     def create_all_sheets_combined_view(self):
         """Create performance matrix heatmap showing all sheets comparison"""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="Performance Matrix")
+        frame = self.tab_frame("Performance Matrix")
         
         # Create scrollable canvas for controls and heatmap
         canvas = tk.Canvas(frame, bg='white')
@@ -1008,23 +1178,9 @@ Neuron Utilization: {(sheet_data['active_neurons']/sheet_data['total_neurons']*1
                     matrix_title = 'Confusion Matrix (Normalization Failed)'
                     fmt_param = 'd'
             
-            fig = Figure(figsize=(6, 4), dpi=100, facecolor='white')
-            ax = fig.add_subplot(111)
-            
-            # Create heatmap
-            import seaborn as sns
-            sns.heatmap(display_matrix, annot=True, fmt=fmt_param, cmap='Blues', 
-                       ax=ax, cbar_kws={'shrink': 0.8})
-            
-            ax.set_title(matrix_title, fontsize=12, fontweight='bold')
-            ax.set_xlabel('Actual')
-            ax.set_ylabel('Predicted')
-            
-            fig.tight_layout()
-            
-            canvas = FigureCanvasTkAgg(fig, parent)
-            canvas.draw()
-            canvas.get_tk_widget().pack()
+            self.show_figure(parent, 'confusion_heatmap',
+                             {'matrix': display_matrix, 'title': matrix_title, 'fmt': fmt_param, 'title_size': 12},
+                             (6, 4))
             
         except Exception as e:
             print(f"Error creating detailed heatmap: {e}")
@@ -1104,56 +1260,12 @@ Neuron Utilization: {(sheet_data['active_neurons']/sheet_data['total_neurons']*1
                 normalized_data = normalized_data.fillna(0.5)
                 normalized_data = normalized_data.clip(0, 1)
             
-            # Create the heatmap
-            fig = Figure(figsize=(14, 10), dpi=100, facecolor='white')
-            ax = fig.add_subplot(111)
-            
-            # Create heatmap using seaborn
-            import seaborn as sns
-            
-            # Set up the heatmap with proper formatting
-            heatmap = sns.heatmap(
-                normalized_data.T,  # Transpose to show metrics as rows, configs as columns
-                annot=plot_data.T,  # Show actual values
-                fmt='.1f',  # Consistent formatting for better readability
-                cmap='RdYlGn',  # Red-Yellow-Green colormap (industry standard for performance)
-                ax=ax,
-                cbar_kws={
-                    'label': 'Normalized Performance\n(0=Worst, 1=Best)',
-                    'shrink': 0.8,
-                    'aspect': 20
-                },
-                linewidths=0.5,
-                linecolor='white',
-                square=False,
-                xticklabels=df['SOM_Config'].tolist(),  # Ensure it's a list
-                yticklabels=metric_labels,
-                annot_kws={'size': 9}  # Adjust annotation font size
-            )
-            
-            # Customize the heatmap appearance
-            ax.set_title('Performance Matrix - Performance Metrics\n(Color: Normalized Performance)', 
-                        fontsize=14, fontweight='bold', pad=20)
-            ax.set_xlabel('SOM Configuration', fontsize=12, fontweight='bold', labelpad=10)
-            ax.set_ylabel('Performance Metrics', fontsize=12, fontweight='bold', labelpad=10)
-            
-            # Rotate x-axis labels for better readability
-            try:
-                plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
-            except Exception as label_error:
-                print(f"Warning: Could not rotate x-axis labels: {label_error}")
-            
-            # Adjust layout
+            # Render and display
             try:
-                fig.tight_layout()
-            except Exception as layout_error:
-                print(f"Warning: Could not adjust layout: {layout_error}")
-            
-                        # Create canvas and display
-            try:
-                canvas = FigureCanvasTkAgg(fig, parent)
-                canvas.draw()
-                canvas.get_tk_widget().pack(pady=20)
+                self.show_figure(parent, 'performance_matrix',
+                                 {'normalized': normalized_data, 'values': plot_data,
+                                  'configs': df['SOM_Config'].tolist(), 'metric_labels': metric_labels},
+                                 (14, 10), pady=20)
                 
                 # Add interpretation guide
                 try:
@@ -1298,10 +1410,10 @@ Neuron Utilization: {config_data['Utilization']:.1f}%"""
                                    font=('Arial', 10), foreground='red')
             error_label.pack(pady=10)
     
+    @traced('render')
     def create_multi_sheet_radar_analysis_in_window(self):
         """Create comprehensive radar chart analysis for multi-sheet comparison"""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="Multi-Sheet Radar Analysis")
+        frame = self.tab_frame("Multi-Sheet Radar Analysis")
         
         # Create scrollable canvas
         canvas = tk.Canvas(frame, bg='white')
@@ -1318,98 +1430,10 @@ Neuron Utilization: {config_data['Utilization']:.1f}%"""
         canvas.configure(yscrollcommand=scrollbar.set, xscrollcommand=h_scrollbar.set)
         
         try:
-            if hasattr(self.analyzer, 'comparison_summary') and self.analyzer.comparison_summary is not None:
-                # Create figure with subplots for different radar analyses
-                fig = Figure(figsize=(15, 10), dpi=100, facecolor='white')
-                
-                # Performance comparison radar
-                ax1 = fig.add_subplot(2, 2, 1, projection='polar')
-                sheets = self.analyzer.comparison_summary['SOM_Config']
-                accuracies = self.analyzer.comparison_summary['Global_Fit'] / 100  # Normalize to 0-1
-                cramers_v = self.analyzer.comparison_summary['Cramers_V']
-                utilization = self.analyzer.comparison_summary['Utilization'] / 100  # Normalize to 0-1
-                
-                # Create radar for top 6 sheets
-                top_sheets = sheets.head(6)
-                top_accuracies = accuracies.head(6)
-                top_cramers = cramers_v.head(6)
-                top_utilization = utilization.head(6)
-                
-                angles = [n / float(len(top_sheets)) * 2 * pi for n in range(len(top_sheets))]
-                angles += angles[:1]
-                
-                # Plot accuracy
-                acc_values = list(top_accuracies.values) + [top_accuracies.iloc[0]]
-                ax1.plot(angles, acc_values, 'o-', linewidth=2, label='Classification Accuracy', color='blue')
-                ax1.fill(angles, acc_values, alpha=0.15, color='blue')
-                
-                ax1.set_xticks(angles[:-1])
-                ax1.set_xticklabels([str(name)[:8] for name in top_sheets], fontsize=8)
-                ax1.set_ylim(0, 1)
-                ax1.set_title('Sheet Classification Accuracy Comparison', fontsize=12, fontweight='bold', pad=20)
-                ax1.legend(loc='upper right', bbox_to_anchor=(1.3, 1.0), fontsize=8)
-                ax1.grid(True)
-                
-                # Association strength radar
-                ax2 = fig.add_subplot(2, 2, 2, projection='polar')
-                cramers_values = list(top_cramers.values) + [top_cramers.iloc[0]]
-                ax2.plot(angles, cramers_values, 'o-', linewidth=2, label='Association Strength (Cramer\'s V)', color='red')
-                ax2.fill(angles, cramers_values, alpha=0.15, color='red')
-                
-                ax2.set_xticks(angles[:-1])
-                ax2.set_xticklabels([str(name)[:8] for name in top_sheets], fontsize=8)
-                ax2.set_ylim(0, 1)
-                ax2.set_title('Association Strength (Cramer\'s V) Comparison', fontsize=12, fontweight='bold', pad=20)
-                ax2.legend(loc='upper right', bbox_to_anchor=(1.3, 1.0), fontsize=8)
-                ax2.grid(True)
-                
-                # Utilization radar
-                ax3 = fig.add_subplot(2, 2, 3, projection='polar')
-                util_values = list(top_utilization.values) + [top_utilization.iloc[0]]
-                ax3.plot(angles, util_values, 'o-', linewidth=2, label='Neuron Utilization', color='green')
-                ax3.fill(angles, util_values, alpha=0.15, color='green')
-                
-                ax3.set_xticks(angles[:-1])
-                ax3.set_xticklabels([str(name)[:8] for name in top_sheets], fontsize=8)
-                ax3.set_ylim(0, 1)
-                ax3.set_title('Neuron Utilization Comparison', fontsize=12, fontweight='bold', pad=20)
-                ax3.legend(loc='upper right', bbox_to_anchor=(1.3, 1.0), fontsize=8)
-                ax3.grid(True)
-                
-                # Overall performance radar
-                ax4 = fig.add_subplot(2, 2, 4, projection='polar')
-                # Calculate composite score for each sheet
-                composite_scores = []
-                for i in range(len(top_sheets)):
-                    score = (top_accuracies.iloc[i] * 0.4 + 
-                            top_cramers.iloc[i] * 0.3 + 
-                            top_utilization.iloc[i] * 0.3)
-                    composite_scores.append(score)
-                
-                composite_scores += [composite_scores[0]]
-                ax4.plot(angles, composite_scores, 'o-', linewidth=2, label='Composite Score', color='purple')
-                ax4.fill(angles, composite_scores, alpha=0.15, color='purple')
-                
-                ax4.set_xticks(angles[:-1])
-                ax4.set_xticklabels([str(name)[:8] for name in top_sheets], fontsize=8)
-                ax4.set_ylim(0, 1)
-                ax4.set_title('Overall Performance Score', fontsize=12, fontweight='bold', pad=20)
-                ax4.legend(loc='upper right', bbox_to_anchor=(1.3, 1.0), fontsize=8)
-                ax4.grid(True)
-                
-            else:
-                # No comparison data available
-                fig = Figure(figsize=(12, 8), dpi=100, facecolor='white')
-                ax = fig.add_subplot(111)
-                ax.text(0.5, 0.5, 'No multi-sheet comparison data available for radar analysis', 
-                       ha='center', va='center', fontsize=14, transform=ax.transAxes)
-                ax.set_title('Multi-Sheet Radar Analysis', fontsize=14, fontweight='bold')
-            
-            fig.tight_layout()
-            
-            canvas_fig = FigureCanvasTkAgg(fig, scrollable_frame)
-            canvas_fig.draw()
-            canvas_fig.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            summary = getattr(self.analyzer, 'comparison_summary', None)
+            figsize = (15, 10) if summary is not None else (12, 8)
+            self.show_figure(scrollable_frame, 'radar_comparison', {'summary': summary}, figsize,
+                             fill=tk.BOTH, expand=True)
             
         except Exception as e:
             ttk.Label(scrollable_frame, text=f"Error creating multi-sheet radar analysis: {str(e)}", 
@@ -1438,10 +1462,10 @@ Neuron Utilization: {config_data['Utilization']:.1f}%"""
         scrollable_frame.bind("<Shift-Button-4>", _on_shift_mousewheel)
         scrollable_frame.bind("<Shift-Button-5>", _on_shift_mousewheel)
     
+    @traced('render')
     def create_multi_sheet_pie_chart_analysis_in_window(self):
         """Create comprehensive pie chart analysis for multi-sheet comparison"""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="Multi-Sheet Pie Analysis")
+        frame = self.tab_frame("Multi-Sheet Pie Analysis")
         
         # Create scrollable canvas
         canvas = tk.Canvas(frame, bg='white')
@@ -1458,173 +1482,10 @@ Neuron Utilization: {config_data['Utilization']:.1f}%"""
         canvas.configure(yscrollcommand=scrollbar.set, xscrollcommand=h_scrollbar.set)
         
         try:
-            if hasattr(self.analyzer, 'comparison_summary') and self.analyzer.comparison_summary is not None:
-                # Create figure with subplots for different pie analyses
-                fig = Figure(figsize=(15, 10), dpi=100, facecolor='white')
-                
-                # Performance distribution pie chart
-                ax1 = fig.add_subplot(2, 2, 1)
-                accuracies = self.analyzer.comparison_summary['Global_Fit']
-                
-                # Categorize performance levels
-                excellent = len(accuracies[accuracies >= 80])
-                good = len(accuracies[(accuracies >= 60) & (accuracies < 80)])
-                fair = len(accuracies[(accuracies >= 40) & (accuracies < 60)])
-                poor = len(accuracies[accuracies < 40])
-                
-                performance_data = [excellent, good, fair, poor]
-                performance_labels = ['Excellent (≥80%)', 'Good (60-79%)', 'Fair (40-59%)', 'Poor (<40%)']
-                performance_colors = ['#2E7D32', '#388E3C', '#F57C00', '#D32F2F']
-                
-                # Only show labels for slices with data > 0
-                labels_to_show = [label if data > 0 else '' for label, data in zip(performance_labels, performance_data)]
-                
-                wedges, texts, autotexts = ax1.pie(performance_data, labels=labels_to_show, autopct='%1.1f%%', 
-                                                   colors=performance_colors, startangle=90,
-                                                   labeldistance=1.1, pctdistance=0.85)
-                
-                # Improve text formatting and positioning
-                for i, (wedge, text, autotext) in enumerate(zip(wedges, texts, autotexts)):
-                    if performance_data[i] > 0:
-                        autotext.set_color('white')
-                        autotext.set_fontweight('bold')
-                        autotext.set_fontsize(9)
-                        # Position text better for small slices
-                        if performance_data[i] == 1:  # Single item
-                            text.set_position((1.2, 0))
-                        text.set_fontsize(9)
-                    else:
-                        # Hide text for empty slices
-                        text.set_visible(False)
-                        autotext.set_visible(False)
-                
-                ax1.set_title('Performance Distribution Across Sheets', fontsize=12, fontweight='bold')
-                
-                # Association strength distribution pie chart
-                ax2 = fig.add_subplot(2, 2, 2)
-                cramers_v = self.analyzer.comparison_summary['Cramers_V']
-                
-                # Categorize association strength
-                strong = len(cramers_v[cramers_v >= 0.7])
-                moderate = len(cramers_v[(cramers_v >= 0.5) & (cramers_v < 0.7)])
-                weak = len(cramers_v[(cramers_v >= 0.3) & (cramers_v < 0.5)])
-                negligible = len(cramers_v[cramers_v < 0.3])
-                
-                association_data = [strong, moderate, weak, negligible]
-                association_labels = ['Strong (≥0.7)', 'Moderate (0.5-0.7)', 'Weak (0.3-0.5)', 'Negligible (<0.3)']
-                association_colors = ['#1976D2', '#42A5F5', '#90CAF9', '#E3F2FD']
-                
-                # Only show labels for slices with data > 0
-                labels_to_show = [label if data > 0 else '' for label, data in zip(association_labels, association_data)]
-                
-                wedges, texts, autotexts = ax2.pie(association_data, labels=labels_to_show, autopct='%1.1f%%', 
-                                                   colors=association_colors, startangle=90,
-                                                   labeldistance=1.1, pctdistance=0.85)
-                
-                # Improve text formatting and positioning
-                for i, (wedge, text, autotext) in enumerate(zip(wedges, texts, autotexts)):
-                    if association_data[i] > 0:
-                        autotext.set_color('white')
-                        autotext.set_fontweight('bold')
-                        autotext.set_fontsize(9)
-                        # Position text better for small slices
-                        if association_data[i] == 1:  # Single item
-                            text.set_position((1.2, 0))
-                        text.set_fontsize(9)
-                    else:
-                        # Hide text for empty slices
-                        text.set_visible(False)
-                        autotext.set_visible(False)
-                
-                ax2.set_title('Association Strength Distribution', fontsize=12, fontweight='bold')
-                
-                # Neuron utilization distribution pie chart
-                ax3 = fig.add_subplot(2, 2, 3)
-                utilization = self.analyzer.comparison_summary['Utilization']
-                
-                # Categorize utilization levels
-                high_util = len(utilization[utilization >= 80])
-                medium_util = len(utilization[(utilization >= 50) & (utilization < 80)])
-                low_util = len(utilization[utilization < 50])
-                
-                utilization_data = [high_util, medium_util, low_util]
-                utilization_labels = ['High (≥80%)', 'Medium (50-79%)', 'Low (<50%)']
-                utilization_colors = ['#4CAF50', '#8BC34A', '#CDDC39']
-                
-                # Only show labels for slices with data > 0
-                labels_to_show = [label if data > 0 else '' for label, data in zip(utilization_labels, utilization_data)]
-                
-                wedges, texts, autotexts = ax3.pie(utilization_data, labels=labels_to_show, autopct='%1.1f%%', 
-                                                   colors=utilization_colors, startangle=90,
-                                                   labeldistance=1.1, pctdistance=0.85)
-                
-                # Improve text formatting and positioning
-                for i, (wedge, text, autotext) in enumerate(zip(wedges, texts, autotexts)):
-                    if utilization_data[i] > 0:
-                        autotext.set_color('white')
-                        autotext.set_fontweight('bold')
-                        autotext.set_fontsize(9)
-                        # Position text better for small slices
-                        if utilization_data[i] == 1:  # Single item
-                            text.set_position((1.2, 0))
-                        text.set_fontsize(9)
-                    else:
-                        # Hide text for empty slices
-                        text.set_visible(False)
-                        autotext.set_visible(False)
-                
-                ax3.set_title('Neuron Utilization Distribution', fontsize=12, fontweight='bold')
-                
-                # Sample size distribution pie chart
-                ax4 = fig.add_subplot(2, 2, 4)
-                sample_sizes = self.analyzer.comparison_summary['Total_Samples']
-                
-                # Categorize sample sizes
-                large = len(sample_sizes[sample_sizes >= 1000])
-                medium = len(sample_sizes[(sample_sizes >= 100) & (sample_sizes < 1000)])
-                small = len(sample_sizes[sample_sizes < 100])
-                
-                sample_data = [large, medium, small]
-                sample_labels = ['Large (≥1000)', 'Medium (100-999)', 'Small (<100)']
-                sample_colors = ['#FF9800', '#FFB74D', '#FFCC02']
-                
-                # Only show labels for slices with data > 0
-                labels_to_show = [label if data > 0 else '' for label, data in zip(sample_labels, sample_data)]
-                
-                wedges, texts, autotexts = ax4.pie(sample_data, labels=labels_to_show, autopct='%1.1f%%', 
-                                                   colors=sample_colors, startangle=90,
-                                                   labeldistance=1.1, pctdistance=0.85)
-                
-                # Improve text formatting and positioning
-                for i, (wedge, text, autotext) in enumerate(zip(wedges, texts, autotexts)):
-                    if sample_data[i] > 0:
-                        autotext.set_color('white')
-                        autotext.set_fontweight('bold')
-                        autotext.set_fontsize(9)
-                        # Position text better for small slices
-                        if sample_data[i] == 1:  # Single item
-                            text.set_position((1.2, 0))
-                        text.set_fontsize(9)
-                    else:
-                        # Hide text for empty slices
-                        text.set_visible(False)
-                        autotext.set_visible(False)
-                
-                ax4.set_title('Sample Size Distribution', fontsize=12, fontweight='bold')
-                
-            else:
-                # No comparison data available
-                fig = Figure(figsize=(12, 8), dpi=100, facecolor='white')
-                ax = fig.add_subplot(111)
-                ax.text(0.5, 0.5, 'No multi-sheet comparison data available for pie chart analysis', 
-                       ha='center', va='center', fontsize=14, transform=ax.transAxes)
-                ax.set_title('Multi-Sheet Pie Chart Analysis', fontsize=14, fontweight='bold')
-            
-            fig.tight_layout()
-            
-            canvas_fig = FigureCanvasTkAgg(fig, scrollable_frame)
-            canvas_fig.draw()
-            canvas_fig.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            summary = getattr(self.analyzer, 'comparison_summary', None)
+            figsize = (15, 10) if summary is not None else (12, 8)
+            self.show_figure(scrollable_frame, 'summary_pies', {'summary': summary}, figsize,
+                             fill=tk.BOTH, expand=True)
             
         except Exception as e:
             ttk.Label(scrollable_frame, text=f"Error creating multi-sheet pie chart analysis: {str(e)}", 
@@ -1655,10 +1516,10 @@ Neuron Utilization: {config_data['Utilization']:.1f}%"""
     
 
     
+    @traced('render')
     def create_confusion_heatmap_in_window(self):
         """Create confusion matrix heatmap for single sheet"""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="Confusion Heatmap")
+        frame = self.tab_frame("Confusion Heatmap")
         
         # Create scrollable canvas
         canvas = tk.Canvas(frame, bg='white')
@@ -1692,23 +1553,9 @@ Neuron Utilization: {config_data['Utilization']:.1f}%"""
                         matrix_title = 'Confusion Matrix Heatmap (Normalization Failed)'
                         fmt_param = 'd'
                 
-                fig = Figure(figsize=(12, 8), dpi=100, facecolor='white')
-                ax = fig.add_subplot(111)
-                
-                # Create heatmap
-                import seaborn as sns
-                sns.heatmap(display_matrix, annot=True, fmt=fmt_param, 
-                           cmap='Blues', ax=ax, cbar_kws={'shrink': 0.8})
-                
-                ax.set_title(matrix_title, fontsize=14, fontweight='bold')
-                ax.set_xlabel('Actual')
-                ax.set_ylabel('Predicted')
-                
-                fig.tight_layout()
-                
-                canvas_fig = FigureCanvasTkAgg(fig, scrollable_frame)
-                canvas_fig.draw()
-                canvas_fig.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+                self.show_figure(scrollable_frame, 'confusion_heatmap',
+                                 {'matrix': display_matrix, 'title': matrix_title, 'fmt': fmt_param, 'title_size': 14},
+                                 (12, 8), fill=tk.BOTH, expand=True)
             else:
                 ttk.Label(scrollable_frame, text="No confusion matrix data available", 
                          font=('Arial', 14)).pack(pady=50)
@@ -1740,10 +1587,10 @@ Neuron Utilization: {config_data['Utilization']:.1f}%"""
         scrollable_frame.bind("<Shift-Button-4>", _on_shift_mousewheel)
         scrollable_frame.bind("<Shift-Button-5>", _on_shift_mousewheel)
     
+    @traced('render')
     def create_distribution_charts_in_window(self):
         """Create distribution charts"""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="Distributions")
+        frame = self.tab_frame("Distributions")
         
         # Create scrollable canvas
         canvas = tk.Canvas(frame, bg='white')
@@ -1761,33 +1608,8 @@ Neuron Utilization: {config_data['Utilization']:.1f}%"""
         
         try:
             if hasattr(self.analyzer, 'confusion_matrix') and self.analyzer.confusion_matrix is not None:
-                fig = Figure(figsize=(15, 8), dpi=100, facecolor='white')
-                
-                # Actual distribution
-                ax1 = fig.add_subplot(1, 2, 1)
-                actual_counts = self.analyzer.confusion_matrix.sum(axis=0)
-                ax1.bar(range(len(actual_counts)), actual_counts.values, color='skyblue', edgecolor='navy')
-                ax1.set_title('Actual Type Distribution', fontsize=14, fontweight='bold')
-                ax1.set_ylabel('Count')
-                ax1.set_xticks(range(len(actual_counts)))
-                ax1.set_xticklabels(actual_counts.index, rotation=45, ha='right')
-                ax1.grid(True, alpha=0.3)
-                
-                # Predicted distribution
-                ax2 = fig.add_subplot(1, 2, 2)
-                predicted_counts = self.analyzer.confusion_matrix.sum(axis=1)
-                ax2.bar(range(len(predicted_counts)), predicted_counts.values, color='lightcoral', edgecolor='darkred')
-                ax2.set_title('Predicted Type Distribution', fontsize=14, fontweight='bold')
-                ax2.set_ylabel('Count')
-                ax2.set_xticks(range(len(predicted_counts)))
-                ax2.set_xticklabels(predicted_counts.index, rotation=45, ha='right')
-                ax2.grid(True, alpha=0.3)
-                
-                fig.tight_layout()
-                
-                canvas_fig = FigureCanvasTkAgg(fig, scrollable_frame)
-                canvas_fig.draw()
-                canvas_fig.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+                self.show_figure(scrollable_frame, 'distributions', {'matrix': self.analyzer.confusion_matrix},
+                                 (15, 8), fill=tk.BOTH, expand=True)
             else:
                 ttk.Label(scrollable_frame, text="No distribution data available", 
                          font=('Arial', 14)).pack(pady=50)
@@ -1819,10 +1641,10 @@ Neuron Utilization: {config_data['Utilization']:.1f}%"""
         scrollable_frame.bind("<Shift-Button-4>", _on_shift_mousewheel)
         scrollable_frame.bind("<Shift-Button-5>", _on_shift_mousewheel)
     
+    @traced('render')
     def create_metrics_comparison_in_window(self):
         """Create metrics comparison chart"""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="Metrics Comparison")
+        frame = self.tab_frame("Metrics Comparison")
         
         # Create scrollable canvas
         canvas = tk.Canvas(frame, bg='white')
@@ -1840,36 +1662,9 @@ Neuron Utilization: {config_data['Utilization']:.1f}%"""
         
         try:
             if hasattr(self.analyzer, 'results') and 'class_metrics' in self.analyzer.results:
-                fig = Figure(figsize=(12, 8), dpi=100, facecolor='white')
-                ax = fig.add_subplot(111)
-                
-                # Prepare data
-                classes = list(self.analyzer.results['class_metrics'].keys())
-                precisions = [self.analyzer.results['class_metrics'][c]['precision'] for c in classes]
-                recalls = [self.analyzer.results['class_metrics'][c]['recall'] for c in classes]
-                f1_scores = [self.analyzer.results['class_metrics'][c]['f1_score'] for c in classes]
-                
-                x = np.arange(len(classes))
-                width = 0.25
-                
-                ax.bar(x - width, precisions, width, label='Precision', color='skyblue', edgecolor='navy')
-                ax.bar(x, recalls, width, label='Recall', color='lightgreen', edgecolor='darkgreen')
-                ax.bar(x + width, f1_scores, width, label='F1-Score', color='lightcoral', edgecolor='darkred')
-                
-                ax.set_title('Performance Metrics by Class', fontsize=14, fontweight='bold')
-                ax.set_ylabel('Score')
-                ax.set_xlabel('Classes')
-                ax.set_xticks(x)
-                ax.set_xticklabels(classes, rotation=45, ha='right')
-                ax.legend()
-                ax.grid(True, alpha=0.3)
-                ax.set_ylim(0, 1.1)
-                
-                fig.tight_layout()
-                
-                canvas_fig = FigureCanvasTkAgg(fig, scrollable_frame)
-                canvas_fig.draw()
-                canvas_fig.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+                self.show_figure(scrollable_frame, 'class_metrics',
+                                 {'class_metrics': self.analyzer.results['class_metrics']},
+                                 (12, 8), fill=tk.BOTH, expand=True)
             else:
                 ttk.Label(scrollable_frame, text="No metrics data available", 
                          font=('Arial', 14)).pack(pady=50)
@@ -1901,10 +1696,10 @@ Neuron Utilization: {config_data['Utilization']:.1f}%"""
         scrollable_frame.bind("<Shift-Button-4>", _on_shift_mousewheel)
         scrollable_frame.bind("<Shift-Button-5>", _on_shift_mousewheel)
     
+    @traced('render')
     def create_radar_analysis_in_window(self):
         """Create comprehensive radar chart analysis for single sheet"""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="Radar Analysis")
+        frame = self.tab_frame("Radar Analysis")
         
         # Create scrollable canvas
         canvas = tk.Canvas(frame, bg='white')
@@ -1921,152 +1716,22 @@ Neuron Utilization: {config_data['Utilization']:.1f}%"""
         canvas.configure(yscrollcommand=scrollbar.set, xscrollcommand=h_scrollbar.set)
         
         try:
-            # Create figure with subplots for different radar analyses
-            fig = Figure(figsize=(15, 10), dpi=100, facecolor='white')
-            
             if hasattr(self.analyzer, 'results') and 'class_metrics' in self.analyzer.results:
-                if len(self.analyzer.results['class_metrics']) >= 3:
-                    # Performance metrics radar
-                    ax1 = fig.add_subplot(2, 2, 1, projection='polar')
-                    classes = list(self.analyzer.results['class_metrics'].keys())[:6]
-                    metrics = ['Precision', 'Recall', 'F1-Score']
-                    
-                    angles = [n / float(len(metrics)) * 2 * pi for n in range(len(metrics))]
-                    angles += angles[:1]
-                    
-                    colors = plt.cm.tab10(np.linspace(0, 1, len(classes)))
-                    
-                    for i, (class_name, color) in enumerate(zip(classes, colors)):
-                        class_data = self.analyzer.results['class_metrics'][class_name]
-                        values = [class_data['precision'], class_data['recall'], class_data['f1_score']]
-                        values += values[:1]
-                        
-                        ax1.plot(angles, values, 'o-', linewidth=2, label=str(class_name), color=color)
-                        ax1.fill(angles, values, alpha=0.15, color=color)
-                    
-                    ax1.set_xticks(angles[:-1])
-                    ax1.set_xticklabels(metrics)
-                    ax1.set_ylim(0, 1)
-                    ax1.set_title('Performance Metrics Radar', fontsize=12, fontweight='bold', pad=20)
-                    ax1.legend(loc='upper right', bbox_to_anchor=(1.3, 1.0), fontsize=8)
-                    ax1.grid(True)
-                    
-                    # Statistical significance radar
-                    ax2 = fig.add_subplot(2, 2, 2, projection='polar')
-                    if hasattr(self.analyzer, 'confusion_matrix') and self.analyzer.confusion_matrix is not None:
-                        # Calculate statistical metrics for each class
-                        actual_counts = self.analyzer.confusion_matrix.sum(axis=0)
-                        predicted_counts = self.analyzer.confusion_matrix.sum(axis=1)
-                        
-                        # Normalize counts for radar display
-                        max_count = max(actual_counts.max(), predicted_counts.max())
-                        actual_norm = actual_counts / max_count
-                        predicted_norm = predicted_counts / max_count
-                        
-                        # Create radar for first 6 classes
-                        class_names = list(actual_counts.index)[:6]
-                        angles = [n / float(len(class_names)) * 2 * pi for n in range(len(class_names))]
-                        angles += angles[:1]
-                        
-                        actual_values = [actual_norm[name] for name in class_names]
-                        predicted_values = [predicted_norm[name] for name in class_names]
-                        actual_values += actual_values[:1]
-                        predicted_values += predicted_values[:1]
-                        
-                        ax2.plot(angles, actual_values, 'o-', linewidth=2, label='Actual Distribution', color='blue')
-                        ax2.fill(angles, actual_values, alpha=0.15, color='blue')
-                        ax2.plot(angles, predicted_values, 'o-', linewidth=2, label='Predicted Distribution', color='red')
-                        ax2.fill(angles, predicted_values, alpha=0.15, color='red')
-                        
-                        ax2.set_xticks(angles[:-1])
-                        ax2.set_xticklabels([str(name)[:8] for name in class_names], fontsize=8)
-                        ax2.set_ylim(0, 1)
-                        ax2.set_title('Distribution Comparison Radar', fontsize=12, fontweight='bold', pad=20)
-                        ax2.legend(loc='upper right', bbox_to_anchor=(1.3, 1.0), fontsize=8)
-                        ax2.grid(True)
-                    
-                    # Quality metrics radar
-                    ax3 = fig.add_subplot(2, 2, 3, projection='polar')
-                    if hasattr(self.analyzer, 'confusion_matrix') and self.analyzer.confusion_matrix is not None:
-                        # Calculate quality metrics for each class
-                        quality_metrics = ['Accuracy', 'Precision', 'Recall', 'F1-Score', 'Support']
-                        
-                        angles = [n / float(len(quality_metrics)) * 2 * pi for n in range(len(quality_metrics))]
-                        angles += angles[:1]
-                        
-                        # Use first class as representative
-                        first_class = list(self.analyzer.results['class_metrics'].keys())[0]
-                        class_data = self.analyzer.results['class_metrics'][first_class]
-                        
-                        values = [
-                            class_data.get('accuracy', 0),
-                            class_data.get('precision', 0),
-                            class_data.get('recall', 0),
-                            class_data.get('f1_score', 0),
-                            min(class_data.get('support', 0) / 100, 1.0)  # Normalize support
-                        ]
-                        values += values[:1]
-                        
-                        ax3.plot(angles, values, 'o-', linewidth=2, label=first_class, color='green')
-                        ax3.fill(angles, values, alpha=0.15, color='green')
-                        
-                        ax3.set_xticks(angles[:-1])
-                        ax3.set_xticklabels(quality_metrics)
-                        ax3.set_ylim(0, 1)
-                        ax3.set_title('Quality Metrics Radar', fontsize=12, fontweight='bold', pad=20)
-                        ax3.legend(loc='upper right', bbox_to_anchor=(1.3, 1.0), fontsize=8)
-                        ax3.grid(True)
-                    
-                    # Overall performance radar
-                    ax4 = fig.add_subplot(2, 2, 4, projection='polar')
-                    overall_metrics = ['Global Accuracy', 'Association Strength', 'Neuron Utilization', 'Data Quality']
-                    
-                    angles = [n / float(len(overall_metrics)) * 2 * pi for n in range(len(overall_metrics))]
-                    angles += angles[:1]
-                    
-                    # Calculate overall metrics
-                    if hasattr(self.analyzer, 'batch_results') and self.analyzer.batch_results:
-                        sheet_name = list(self.analyzer.batch_results.keys())[0]
-                        sheet_data = self.analyzer.batch_results[sheet_name]
-                        
-                        overall_values = [
-                            min(sheet_data.get('global_fit', 0) / 100, 1.0),  # Normalize accuracy
-                            min(sheet_data.get('cramers_v', 0) * 2, 1.0),     # Scale Cramer's V
-                            min(sheet_data.get('active_neurons', 0) / sheet_data.get('total_neurons', 1), 1.0),
-                            min(sheet_data.get('data_completeness', 0) / 100, 1.0)  # Normalize completeness
-                        ]
-                    else:
-                        overall_values = [0.5, 0.5, 0.5, 0.5]  # Default values
-                    
-                    overall_values += overall_values[:1]
-                    
-                    ax4.plot(angles, overall_values, 'o-', linewidth=2, label='Overall Performance', color='purple')
-                    ax4.fill(angles, overall_values, alpha=0.15, color='purple')
-                    
-                    ax4.set_xticks(angles[:-1])
-                    ax4.set_xticklabels(overall_metrics)
-                    ax4.set_ylim(0, 1)
-                    ax4.set_title('Overall Performance Radar', fontsize=12, fontweight='bold', pad=20)
-                    ax4.legend(loc='upper right', bbox_to_anchor=(1.3, 1.0), fontsize=8)
-                    ax4.grid(True)
-                    
+                class_metrics = self.analyzer.results['class_metrics']
+                if len(class_metrics) >= 3:
+                    self.show_figure(scrollable_frame, 'sheet_radar',
+                                     {'matrix': getattr(self.analyzer, 'confusion_matrix', None),
+                                      'metrics': self.first_sheet_metrics(), 'class_metrics': class_metrics},
+                                     (15, 10), fill=tk.BOTH, expand=True)
                 else:
                     # Not enough classes for radar
-                    ax = fig.add_subplot(111)
-                    ax.text(0.5, 0.5, 'Radar analysis requires at least 3 classes', 
-                           ha='center', va='center', fontsize=14, transform=ax.transAxes)
-                    ax.set_title('Radar Analysis', fontsize=14, fontweight='bold')
+                    self.show_figure(scrollable_frame, 'message',
+                                     {'title': 'Radar Analysis', 'message': 'Radar analysis requires at least 3 classes'},
+                                     (15, 10), fill=tk.BOTH, expand=True)
             else:
-                ax = fig.add_subplot(111)
-                ax.text(0.5, 0.5, 'No analysis data available for radar charts', 
-                       ha='center', va='center', fontsize=14, transform=ax.transAxes)
-                ax.set_title('Radar Analysis', fontsize=14, fontweight='bold')
-            
-            fig.tight_layout()
-            
-            canvas_fig = FigureCanvasTkAgg(fig, scrollable_frame)
-            canvas_fig.draw()
-            canvas_fig.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+                self.show_figure(scrollable_frame, 'message',
+                                 {'title': 'Radar Analysis', 'message': 'No analysis data available for radar charts'},
+                                 (15, 10), fill=tk.BOTH, expand=True)
             
         except Exception as e:
             ttk.Label(scrollable_frame, text=f"Error creating radar analysis: {str(e)}", 
@@ -2095,10 +1760,10 @@ Neuron Utilization: {config_data['Utilization']:.1f}%"""
         scrollable_frame.bind("<Shift-Button-4>", _on_shift_mousewheel)
         scrollable_frame.bind("<Shift-Button-5>", _on_shift_mousewheel)
     
+    @traced('render')
     def create_pie_chart_analysis_in_window(self):
         """Create comprehensive pie chart analysis for single sheet"""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="Pie Chart Analysis")
+        frame = self.tab_frame("Pie Chart Analysis")
         
         # Create scrollable canvas
         canvas = tk.Canvas(frame, bg='white')
@@ -2115,133 +1780,19 @@ Neuron Utilization: {config_data['Utilization']:.1f}%"""
         canvas.configure(yscrollcommand=scrollbar.set, xscrollcommand=h_scrollbar.set)
         
         try:
-            # Create figure with subplots for different pie analyses
-            fig = Figure(figsize=(15, 10), dpi=100, facecolor='white')
-            
             if hasattr(self.analyzer, 'confusion_matrix') and self.analyzer.confusion_matrix is not None:
-                # Class distribution pie chart
-                ax1 = fig.add_subplot(2, 2, 1)
-                actual_counts = self.analyzer.confusion_matrix.sum(axis=0)
-                
-                # Limit to top 8 classes for readability
-                top_classes = actual_counts.nlargest(8)
-                other_count = actual_counts.sum() - top_classes.sum()
-                
-                if other_count > 0:
-                    pie_data = list(top_classes.values) + [other_count]
-                    pie_labels = list(top_classes.index) + ['Others']
-                else:
-                    pie_data = list(top_classes.values)
-                    pie_labels = list(top_classes.index)
-                
-                colors = plt.cm.tab10(np.linspace(0, 1, len(pie_data)))
-                wedges, texts, autotexts = ax1.pie(pie_data, labels=pie_labels, autopct='%1.1f%%', 
-                                                   colors=colors, startangle=90)
-                
-                # Enhance text readability
-                for autotext in autotexts:
-                    autotext.set_color('white')
-                    autotext.set_fontweight('bold')
-                
-                ax1.set_title('Actual Class Distribution', fontsize=12, fontweight='bold')
-                
-                # Predicted distribution pie chart
-                ax2 = fig.add_subplot(2, 2, 2)
-                predicted_counts = self.analyzer.confusion_matrix.sum(axis=1)
-                
-                # Limit to top 8 classes for readability
-                top_predicted = predicted_counts.nlargest(8)
-                other_predicted = predicted_counts.sum() - top_predicted.sum()
-                
-                if other_predicted > 0:
-                    pie_data_pred = list(top_predicted.values) + [other_predicted]
-                    pie_labels_pred = list(top_predicted.index) + ['Others']
-                else:
-                    pie_data_pred = list(top_predicted.values)
-                    pie_labels_pred = list(top_predicted.index)
-                
-                colors_pred = plt.cm.tab20(np.linspace(0, 1, len(pie_data_pred)))
-                wedges, texts, autotexts = ax2.pie(pie_data_pred, labels=pie_labels_pred, autopct='%1.1f%%', 
-                                                   colors=colors_pred, startangle=90)
-                
-                for autotext in autotexts:
-                    autotext.set_color('white')
-                    autotext.set_fontweight('bold')
-                
-                ax2.set_title('Predicted Class Distribution', fontsize=12, fontweight='bold')
-                
-                # Performance metrics pie chart
-                ax3 = fig.add_subplot(2, 2, 3)
-                if hasattr(self.analyzer, 'results') and 'class_metrics' in self.analyzer.results:
-                    # Calculate average performance metrics
-                    classes = list(self.analyzer.results['class_metrics'].keys())
-                    avg_precision = np.mean([self.analyzer.results['class_metrics'][c]['precision'] for c in classes])
-                    avg_recall = np.mean([self.analyzer.results['class_metrics'][c]['recall'] for c in classes])
-                    avg_f1 = np.mean([self.analyzer.results['class_metrics'][c]['f1_score'] for c in classes])
-                    
-                    # Calculate remaining as "Other Metrics"
-                    remaining = 3 - (avg_precision + avg_recall + avg_f1)
-                    
-                    performance_data = [avg_precision, avg_recall, avg_f1, remaining]
-                    performance_labels = ['Avg Precision', 'Avg Recall', 'Avg F1-Score', 'Other Metrics']
-                    performance_colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4']
-                    
-                    wedges, texts, autotexts = ax3.pie(performance_data, labels=performance_labels, autopct='%1.1f%%', 
-                                                       colors=performance_colors, startangle=90)
-                    
-                    for autotext in autotexts:
-                        autotext.set_color('white')
-                        autotext.set_fontweight('bold')
-                    
-                    ax3.set_title('Average Performance Metrics', fontsize=12, fontweight='bold')
-                
-                # Data quality pie chart
-                ax4 = fig.add_subplot(2, 2, 4)
-                if hasattr(self.analyzer, 'batch_results') and self.analyzer.batch_results:
-                    sheet_name = list(self.analyzer.batch_results.keys())[0]
-                    sheet_data = self.analyzer.batch_results[sheet_name]
-                    
-                    # Calculate quality metrics
-                    accuracy = sheet_data.get('global_fit', 0)
-                    association = sheet_data.get('cramers_v', 0) * 100  # Convert to percentage
-                    utilization = sheet_data.get('active_neurons', 0) / sheet_data.get('total_neurons', 1) * 100
-                    completeness = sheet_data.get('data_completeness', 0)
-                    
-                    # Normalize to percentages that sum to 100
-                    total = accuracy + association + utilization + completeness
-                    if total > 0:
-                        accuracy_norm = (accuracy / total) * 100
-                        association_norm = (association / total) * 100
-                        utilization_norm = (utilization / total) * 100
-                        completeness_norm = (completeness / total) * 100
-                    else:
-                        accuracy_norm = association_norm = utilization_norm = completeness_norm = 25
-                    
-                    quality_data = [accuracy_norm, association_norm, utilization_norm, completeness_norm]
-                    quality_labels = ['Accuracy', 'Association', 'Utilization', 'Completeness']
-                    quality_colors = ['#FFD93D', '#6BCF7F', '#4D96FF', '#FF6B9D']
-                    
-                    wedges, texts, autotexts = ax4.pie(quality_data, labels=quality_labels, autopct='%1.1f%%', 
-                                                       colors=quality_colors, startangle=90)
-                    
-                    for autotext in autotexts:
-                        autotext.set_color('white')
-                        autotext.set_fontweight('bold')
-                    
-                    ax4.set_title('Data Quality Metrics', fontsize=12, fontweight='bold')
-                
+                results = getattr(self.analyzer, 'results', None) or {}
+                self.show_figure(scrollable_frame, 'class_pies',
+                                 {'matrix': self.analyzer.confusion_matrix,
+                                  'class_metrics': results.get('class_metrics'),
+                                  'metrics': self.first_sheet_metrics()},
+                                 (15, 10), fill=tk.BOTH, expand=True)
             else:
                 # No data available
-                ax = fig.add_subplot(111)
-                ax.text(0.5, 0.5, 'No confusion matrix data available for pie charts', 
-                       ha='center', va='center', fontsize=14, transform=ax.transAxes)
-                ax.set_title('Pie Chart Analysis', fontsize=14, fontweight='bold')
-            
-            fig.tight_layout()
-            
-            canvas_fig = FigureCanvasTkAgg(fig, scrollable_frame)
-            canvas_fig.draw()
-            canvas_fig.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+                self.show_figure(scrollable_frame, 'message',
+                                 {'title': 'Pie Chart Analysis',
+                                  'message': 'No confusion matrix data available for pie charts'},
+                                 (15, 10), fill=tk.BOTH, expand=True)
             
         except Exception as e:
             ttk.Label(scrollable_frame, text=f"Error creating pie chart analysis: {str(e)}", 
@@ -2349,12 +1900,8 @@ def check_dependencies():
         return False
     return True
 
-# Try to import adjustText for better label positioning
-try:
-    from adjustText import adjust_text  # type: ignore
-    ADJUST_TEXT_AVAILABLE = True
-except ImportError:
-    ADJUST_TEXT_AVAILABLE = False
+# adjustText (better label positioning) imports matplotlib, so only check that it is installed
+ADJUST_TEXT_AVAILABLE = importlib.util.find_spec('adjustText') is not None
 
 class ProfessionalVisualizationDesigner:
     """Professional visualization designer for client-ready charts"""
@@ -2625,9 +2172,10 @@ class ProfessionalVisualizationDesigner:
     def create_consistent_heatmap(self, data, ax, title=None, xlabel=None, ylabel=None,
                                  colorbar_label="Count", cmap='Blues', annotate=True):
         """Create a consistently styled heatmap"""
+        from contingency_heatmap import fast_heatmap
         
-        # Create heatmap
-        im = sns.heatmap(
+        # Create heatmap (one image; cell labels drawn only where legible)
+        im = fast_heatmap(
             data,
             annot=annotate,
             fmt='d' if annotate else None,
@@ -2660,8 +2208,15 @@ class ProfessionalVisualizationDesigner:
         
         return fig
 
-# Global designer instance
-designer = ProfessionalVisualizationDesigner()
+# Shared designer instance, created on first use (see get_designer)
+_designer = None
+
+def get_designer():
+    """Return the shared ProfessionalVisualizationDesigner instance"""
+    global _designer
+    if _designer is None:
+        _designer = ProfessionalVisualizationDesigner()
+    return _designer
 
 class NumpyEncoder(json.JSONEncoder):
     """Custom JSON encoder for numpy types"""
@@ -2683,15 +2238,28 @@ class SheetSelectionConfig:
         self.auto_select_valid = True
         self.show_preview_info = True
 
-# Security and resource configuration
+# Security and resource configuration (see load_resource_limits)
 MAX_MEMORY_MB = 512
 OPERATION_TIMEOUT = 300
-MAX_CELLS = 1000000
+MAX_CELLS = STREAMING_MIN_CELLS  # Larger sheets are streamed in row chunks, not rejected
+MAX_FILE_MB = 1024
+MAX_SHEETS = 1000
 
 # Data management configuration
 PROJECTS_DIR = Path.home() / "TraceSeis_Projects"
 BACKUPS_DIR = PROJECTS_DIR / "Backups"
+CACHE_DIR = PROJECTS_DIR / "Cache"
+MAX_CACHE_MB = 256
+FIGURE_CACHE_DIR = CACHE_DIR / "Figures"
+MAX_FIGURE_MEMORY_MB = 64
+MAX_FIGURE_CACHE_MB = 128
+EXPORT_FIGURE_CACHE_DIR = CACHE_DIR / "ExportFigures"
+MAX_EXPORT_FIGURE_CACHE_MB = 256
 SETTINGS_FILE = PROJECTS_DIR / "settings.json"
+TELEMETRY_FILE = PROJECTS_DIR / "Telemetry" / "telemetry.jsonl"
+
+# Sentry project used only when error forwarding is enabled in the telemetry settings
+SENTRY_DSN = "https://507cd6c4eef6dffe261e7ab059c1d464@o4509867581440000.ingest.us.sentry.io/4509888618627072"
 MAX_BACKUPS = 10
 
 class GeophysicsAnalyzer:
@@ -2709,6 +2277,7 @@ class GeophysicsAnalyzer:
         # NEW: Batch processing data storage
         self.batch_results = {}  # Store results for all sheets
         self.comparison_summary = None  # Summary comparison table
+        self._previous_sheet_results = {}  # Worksheet fingerprint -> result of the last run
         
         # Visualization window
         self.viz_window = None
@@ -2723,6 +2292,19 @@ class GeophysicsAnalyzer:
         
         # Threading infrastructure with comprehensive safety
         self.thread_manager = SafeThreadPoolManager(max_workers=MAX_WORKERS)
+        self.process_manager = SafeProcessPoolManager(max_workers=PROCESS_POOL_WORKERS)
+        self.parallel_analysis = tk.BooleanVar(value=PROCESS_POOL_WORKERS > 1)
+        self.trace_enabled = tk.BooleanVar(value=TRACER.enabled)
+        self.analysis_cache = AnalysisCache(CACHE_DIR, max_bytes=MAX_CACHE_MB * 1024 * 1024)
+        self.figure_cache = FigureCache(max_bytes=MAX_FIGURE_MEMORY_MB * 1024 * 1024, directory=FIGURE_CACHE_DIR,
+                                        max_disk_bytes=MAX_FIGURE_CACHE_MB * 1024 * 1024)
+        self.render_service = RenderService(max_workers=RENDER_WORKERS, cache=self.figure_cache)
+        # Disk only, so that high-resolution export images do not evict the on-screen charts
+        self.export_figure_cache = FigureCache(max_bytes=0, directory=EXPORT_FIGURE_CACHE_DIR,
+                                               max_disk_bytes=MAX_EXPORT_FIGURE_CACHE_MB * 1024 * 1024)
+        self.export_cancel_event = None  # Set by cancel_operations while charts are exported
+        self.memory_budget = MemoryBudget(MAX_MEMORY_MB)
+        self.sheet_size_estimates = {}  # Sheet name -> uncompressed worksheet size (bytes)
         self.current_tasks = []
         self.cancel_event = threading.Event()
         self.progress_queue = Queue()
@@ -2743,6 +2325,7 @@ class GeophysicsAnalyzer:
         try:
             PROJECTS_DIR.mkdir(parents=True, exist_ok=True)
             BACKUPS_DIR.mkdir(parents=True, exist_ok=True)
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
         except Exception as e:
             pass
     
@@ -2820,36 +2403,15 @@ class GeophysicsAnalyzer:
                     self.comparison_summary = None
                 
                 total_sheets = len(selected_sheets)
-                processed_count = 0
-                skipped_count = 0
                 
                 self.update_progress_status(f'Processing {total_sheets} sheet(s)...', 5)
                 self.root.after(0, lambda: self.show_processing_overlay(f"Starting analysis of {total_sheets} sheet(s)..."))
                 
-                # Process each selected sheet
-                for i, sheet_name in enumerate(selected_sheets):
-                    if self.cancel_event.is_set():
-                        return
-                    
-                    progress = 10 + (i / total_sheets) * 70  # 10-80% for processing
-                    self.update_progress_status(f'Analyzing sheet: {sheet_name} ({i+1}/{total_sheets})', progress)
-                    self.root.after(0, lambda name=sheet_name, idx=i+1, total=total_sheets: 
-                                  self.show_processing_overlay(f"Analyzing sheet {idx}/{total}: {name}"))
-                    
-                    try:
-                        # Process single sheet
-                        sheet_results = self.process_single_sheet_for_batch(sheet_name)
-                        
-                        if sheet_results and isinstance(sheet_results, dict):
-                            with self.data_lock:
-                                self.batch_results[sheet_name] = sheet_results
-                                processed_count += 1
-                        else:
-                            skipped_count += 1
-                                
-                    except Exception as e:
-                        skipped_count += 1
-                        continue
+                # Process the selected sheets
+                counts = self._run_sheet_analysis(selected_sheets)
+                if counts is None:
+                    return
+                processed_count, skipped_count = counts
                 
                 # Create comparison summary if multiple sheets
                 if len(selected_sheets) > 1:
@@ -2933,36 +2495,15 @@ class GeophysicsAnalyzer:
                     self.comparison_summary = None
                 
                 total_sheets = len(selected_sheets)
-                processed_count = 0
-                skipped_count = 0
                 
                 self.update_progress_status(f'Processing {total_sheets} sheet(s)...', 5)
                 self.root.after(0, lambda: self.show_processing_overlay(f"Starting analysis of {total_sheets} sheet(s)..."))
                 
-                # Process each selected sheet
-                for i, sheet_name in enumerate(selected_sheets):
-                    if self.cancel_event.is_set():
-                        return
-                    
-                    progress = 10 + (i / total_sheets) * 70  # 10-80% for processing
-                    self.update_progress_status(f'Analyzing sheet: {sheet_name} ({i+1}/{total_sheets})', progress)
-                    self.root.after(0, lambda name=sheet_name, idx=i+1, total=total_sheets: 
-                                  self.show_processing_overlay(f"Analyzing sheet {idx}/{total}: {name}"))
-                    
-                    try:
-                        # Process single sheet
-                        sheet_results = self.process_single_sheet_for_batch(sheet_name)
-                        
-                        if sheet_results and isinstance(sheet_results, dict):
-                            with self.data_lock:
-                                self.batch_results[sheet_name] = sheet_results
-                                processed_count += 1
-                        else:
-                            skipped_count += 1
-                                
-                    except Exception as e:
-                        skipped_count += 1
-                        continue
+                # Process the selected sheets
+                counts = self._run_sheet_analysis(selected_sheets)
+                if counts is None:
+                    return
+                processed_count, skipped_count = counts
                 
                 # Create comparison summary if multiple sheets
                 if len(selected_sheets) > 1:
@@ -3168,96 +2709,72 @@ class GeophysicsAnalyzer:
             self.update_activity_indicator("Exporting charts...")
             self.start_activity_animation()
             
+            # The Cancel button stops the export
+            cancel_event = threading.Event()
+            self.export_cancel_event = cancel_event
+            if 'cancel' in self.button_states:
+                self.button_states['cancel'].config(state='normal')
+            
+            def finish_export():
+                self.export_cancel_event = None
+                if 'cancel' in self.button_states and not self.processing_state:
+                    self.button_states['cancel'].config(state='disabled')
+                self.stop_activity_animation()
+            
             def export_worker():
+                timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+                chart_dir = os.path.join(save_dir, f"GeophysicsCharts_{timestamp}")
+                
+                def report_progress(done, total, chart_path, error):
+                    if error:
+                        print(f"Warning: Failed to export chart {chart_path}: {error}")
+                    self.root.after(0, lambda: self.update_activity_indicator(f"Exporting charts... {done}/{total}"))
+                
                 try:
-                    # Create subdirectory for this export
-                    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                    chart_dir = os.path.join(save_dir, f"GeophysicsCharts_{timestamp}")
-                    os.makedirs(chart_dir, exist_ok=True)
-                    
-                    exported_count = 0
-                    designer = ProfessionalVisualizationDesigner()
-                    
-                    # Export charts for each successful analysis
-                    for sheet_name, result in self.batch_results.items():
-                        if result.get('status') != 'success':
-                            continue
-                            
-                        try:
-                            # Create sheet-specific directory
-                            safe_sheet_name = sheet_name.replace('/', '_').replace('\\', '_')
-                            sheet_dir = os.path.join(chart_dir, "Sheet_" + safe_sheet_name)
-                            os.makedirs(sheet_dir, exist_ok=True)
-                            
-                            # Export confusion matrix heatmap
-                            if 'confusion_matrix' in result:
-                                matrix = result['confusion_matrix']
-                                fig = designer.create_confusion_matrix_heatmap(matrix, sheet_name)
-                                fig.savefig(os.path.join(sheet_dir, f"{sheet_name}_confusion_matrix.png"), 
-                                          dpi=300, bbox_inches='tight')
-                                plt.close(fig)
-                                exported_count += 1
-                            
-                            # Export correlation matrix
-                            if 'correlation_matrix' in result:
-                                corr_matrix = result['correlation_matrix']
-                                fig = designer.create_correlation_matrix(corr_matrix, sheet_name)
-                                fig.savefig(os.path.join(sheet_dir, f"{sheet_name}_correlation_matrix.png"), 
-                                          dpi=300, bbox_inches='tight')
-                                plt.close(fig)
-                                exported_count += 1
-                            
-                            # Export statistical summary chart
-                            stats = result.get('statistics', {})
-                            if stats:
-                                fig = designer.create_statistical_summary_chart(stats, sheet_name)
-                                fig.savefig(os.path.join(sheet_dir, f"{sheet_name}_statistics.png"), 
-                                          dpi=300, bbox_inches='tight')
-                                plt.close(fig)
-                                exported_count += 1
-                                
-                        except Exception as e:
-                            print(f"Error exporting charts for {sheet_name}: {e}")
-                            continue
-                    
-                    # Create summary report
-                    summary_path = os.path.join(chart_dir, "export_summary.txt")
-                    with open(summary_path, 'w') as f:
-                        f.write(f"Geophysics Analysis Charts Export Summary\n")
-                        f.write(f"{'='*50}\n")
-                        f.write(f"Export Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                        f.write(f"Total Sheets Analyzed: {len(self.batch_results)}\n")
-                        f.write(f"Total Charts Exported: {exported_count}\n")
-                        f.write(f"Export Directory: {chart_dir}\n\n")
-                        
-                        f.write("Exported Charts by Sheet:\n")
-                        f.write("-" * 30 + "\n")
-                        for sheet_name, result in self.batch_results.items():
-                            status = "Success" if result.get('status') == 'success' else "Failed"
-                            f.write(f"{sheet_name}: {status}\n")
+                    # Charts of all sheets are rendered by the shared render workers and written as they finish
+                    summary = export_chart_files(
+                        dict(self.batch_results), chart_dir, dpi=EXPORT_DPI,
+                        normalize=self.normalize_confusion_matrices.get() if hasattr(self, 'normalize_confusion_matrices') else False,
+                        cache=self.export_figure_cache, progress=report_progress,
+                        cancel_event=cancel_event, service=self.render_service
+                    )
                     
                     def show_success():
-                        self.stop_activity_animation()
+                        finish_export()
+                        if summary['cancelled']:
+                            self.update_activity_indicator("Chart export cancelled")
+                            messagebox.showinfo("Export Cancelled",
+                                              f"Chart export was cancelled.\n\n"
+                                              f"Location: {chart_dir}\n"
+                                              f"Charts exported: {summary['exported']} of {summary['total']}")
+                            return
                         self.update_activity_indicator("Charts exported!")
+                        failed_note = f"\nCharts failed: {len(summary['failed'])}" if summary['failed'] else ""
+                        if summary['skipped']:
+                            failed_note += f"\nSheets skipped: {len(summary['skipped'])} (see export_summary.txt)"
                         messagebox.showinfo("Export Complete", 
                                           f"Charts exported successfully!\n\n"
                                           f"Location: {chart_dir}\n"
-                                          f"Charts exported: {exported_count}\n"
-                                          f"Sheets processed: {len([r for r in self.batch_results.values() if r.get('status') == 'success'])}")
+                                          f"Charts exported: {summary['exported']}\n"
+                                          f"Sheets processed: {len(self.batch_results)}"
+                                          f"{failed_note}")
                     
                     self.root.after(0, show_success)
                     
                 except Exception as e:
+                    error_message = str(e)
+                    
                     def show_error():
-                        self.stop_activity_animation()
+                        finish_export()
                         self.update_activity_indicator("Export failed")
-                        messagebox.showerror("Export Error", f"Failed to export charts:\n{str(e)}")
+                        messagebox.showerror("Export Error", f"Failed to export charts:\n{error_message}")
                     self.root.after(0, show_error)
             
             # Submit the export task
             self.submit_task(export_worker)
             
         except Exception as e:
+            self.export_cancel_event = None
             self.stop_activity_animation()
             self.update_activity_indicator("Export failed")
             messagebox.showerror("Export Error", f"Failed to start chart export:\n{str(e)}")
@@ -3526,11 +3043,8 @@ class GeophysicsAnalyzer:
                 # Include confusion matrix if available (convert to list for JSON)
                 if 'confusion_matrix' in result and result['confusion_matrix'] is not None:
                     try:
-                        matrix = result['confusion_matrix']
-                        if hasattr(matrix, 'tolist'):  # numpy array
-                            serializable_result['confusion_matrix'] = matrix.tolist()
-                        else:
-                            serializable_result['confusion_matrix'] = matrix
+                        # DataFrame views of analysis results and arrays of loaded projects
+                        serializable_result['confusion_matrix'] = np.asarray(result['confusion_matrix']).tolist()
                     except Exception:
                         pass  # Skip if can't serialize matrix
                 
@@ -4395,6 +3909,24 @@ class GeophysicsAnalyzer:
         menubar = tk.Menu(self.root)
         self.root.config(menu=menubar)
         
+        # Options menu
+        options_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Options", menu=options_menu)
+        
+        options_menu.add_checkbutton(
+            label=f"Parallel Sheet Analysis ({PROCESS_POOL_WORKERS} processes)",
+            variable=self.parallel_analysis
+        )
+        options_menu.add_separator()
+        options_menu.add_command(label="Clear Analysis Cache", command=self.clear_analysis_cache)
+        options_menu.add_separator()
+        options_menu.add_checkbutton(
+            label="Record Performance Trace",
+            variable=self.trace_enabled,
+            command=self.toggle_performance_trace
+        )
+        options_menu.add_command(label="Export Performance Trace...", command=self.export_performance_trace)
+        
         # Help menu
         help_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Help", menu=help_menu)
@@ -4405,6 +3937,57 @@ class GeophysicsAnalyzer:
         help_menu.add_separator()
         help_menu.add_command(label="About TraceSeis", command=self.show_about)
     
+    def clear_analysis_cache(self):
+        """Remove all cached sheet analyses and rendered charts"""
+        try:
+            self.analysis_cache.clear()
+            self.figure_cache.clear()
+            self.export_figure_cache.clear()
+            messagebox.showinfo("Analysis Cache", "Cached sheet analyses and charts have been cleared.")
+        except Exception as e:
+            messagebox.showerror("Analysis Cache", f"Failed to clear the analysis cache: {str(e)}")
+    
+    def toggle_performance_trace(self):
+        """Start or stop recording per-stage timing spans"""
+        if self.trace_enabled.get():
+            TRACER.clear()
+            TRACER.enable()
+        else:
+            TRACER.disable()
+    
+    def export_performance_trace(self):
+        """Export recorded spans as a Chrome trace and a per-stage summary table"""
+        try:
+            if not TRACER.events():
+                messagebox.showwarning(
+                    "Performance Trace",
+                    "No spans recorded. Enable Options > Record Performance Trace and run an analysis first."
+                )
+                return
+            
+            filename = filedialog.asksaveasfilename(
+                title="Export Performance Trace",
+                defaultextension=".json",
+                filetypes=[("Chrome trace files", "*.json"), ("All files", "*.*")],
+                initialdir="C:/Users/Desktop"
+            )
+            if not filename:
+                return
+            
+            TRACER.export_chrome_trace(filename)
+            summary_file = os.path.splitext(filename)[0] + "_summary.txt"
+            with open(summary_file, 'w', encoding='utf-8') as f:
+                f.write(TRACER.format_summary())
+            
+            messagebox.showinfo(
+                "Export Complete",
+                f"Performance trace exported to: {filename}\n"
+                f"Stage summary exported to: {summary_file}\n\n"
+                f"Open the trace in chrome://tracing or https://ui.perfetto.dev"
+            )
+        except Exception as e:
+            messagebox.showerror("Export Error", f"Failed to export performance trace: {str(e)}")
+    
     def show_about(self):
         """Show About dialog"""
         about_window = tk.Toplevel(self.root)
@@ -4859,8 +4442,7 @@ TraceSeis® is a registered trademark of TraceSeis, Inc."""
         """Unified error handling method"""
         full_msg = f"{context} failed: {error_msg}"
         if exception:
-            # Log error details for debugging
-            pass
+            TELEMETRY.record_exception(type(exception), exception, exception.__traceback__, context)
         
         def show_error():
             messagebox.showerror("Error", full_msg)
@@ -4871,6 +4453,8 @@ TraceSeis® is a registered trademark of TraceSeis, Inc."""
     def cancel_operations(self):
         """Cancel current operations"""
         self.cancel_event.set()
+        if self.export_cancel_event is not None:
+            self.export_cancel_event.set()
         self.update_progress_status('Cancelling operations...', -1)
         
         # Cancel futures
@@ -4922,9 +4506,9 @@ TraceSeis® is a registered trademark of TraceSeis, Inc."""
             
             # Check file size
             file_size = os.path.getsize(filename)
-            max_size = 100 * 1024 * 1024  # 100MB
+            max_size = MAX_FILE_MB * 1024 * 1024
             if file_size > max_size:
-                raise ValueError(f"File too large. Maximum size allowed is {max_size // (1024*1024)}MB")
+                raise ValueError(f"File too large. Maximum size allowed is {MAX_FILE_MB:g}MB")
             
             # SECURITY: Enhanced path validation
             abs_path = os.path.abspath(filename)
@@ -4987,6 +4571,31 @@ TraceSeis® is a registered trademark of TraceSeis, Inc."""
             except Exception as e:
                 self.handle_error(str(e), e, "File validation")
             
+    def check_workbook_memory(self, file_path):
+        """
+        Start memory accounting for a newly loaded workbook.
+        
+        Records the process memory and the uncompressed size of each worksheet,
+        which is used to estimate the memory a sheet takes to analyze, and
+        notes when the workbook is likely to exceed the memory budget.
+        
+        Args:
+            file_path (str): Workbook path
+        """
+        self.memory_budget.reset()
+        self.memory_budget.account_results(self.batch_results)
+        baseline_mb = self.memory_budget.sample_process_memory()
+        self.sheet_size_estimates = worksheet_sizes(file_path)
+        
+        total_mb = sum(self.sheet_size_estimates.values()) / (1024 * 1024)
+        if total_mb > MAX_MEMORY_MB:
+            self.memory_budget.note(
+                f"workbook holds ~{total_mb:.0f} MB of sheet data, more than the {MAX_MEMORY_MB} MB budget; "
+                f"sheets will be analyzed in chunks"
+            )
+        if baseline_mb is not None and baseline_mb > MAX_MEMORY_MB:
+            print(f"Warning: Process already uses {baseline_mb:.0f} MB, above the {MAX_MEMORY_MB} MB memory budget")
+    
     def load_excel_sheets_threaded(self):
         """Load Excel sheets in background thread"""
         if self.processing_state:
@@ -5011,15 +4620,15 @@ TraceSeis® is a registered trademark of TraceSeis, Inc."""
                     return
                 
                 # SECURITY: Monitor memory during Excel loading
-                initial_memory_check = True  # Placeholder for memory monitoring
+                self.check_workbook_memory(file_path)
                 
                 # Read Excel file to get sheet names
                 excel_file = pd.ExcelFile(file_path)
                 sheet_names = excel_file.sheet_names
                 
                 # SECURITY: Check for reasonable file size (basic validation)
-                if len(sheet_names) > 100:  # Sanity check
-                    raise ValueError("Excel file has too many sheets (possible corruption)")
+                if len(sheet_names) > MAX_SHEETS:  # Sanity check
+                    raise ValueError(f"Excel file has more than {MAX_SHEETS} sheets (possible corruption)")
                 
                 self.update_progress_status('Processing sheet information...', 75)
                 
@@ -5315,26 +4924,34 @@ TraceSeis® is a registered trademark of TraceSeis, Inc."""
         sheet_names = self.excel_file.sheet_names
         
         def preview_worker():
-            for i, sheet_name in enumerate(sheet_names):
-                try:
-                    # Load preview with timeout
-                    preview_data = self._load_sheet_preview(sheet_name)
-                    if preview_data is not None:
-                        status, preview_info, is_valid = self._validate_sheet_data(preview_data, sheet_name)
+            listed = 0
+            try:
+                # One streaming pass over a single open workbook, reading only the first rows of each sheet
+                with WorkbookReader(self.file_path.get()) as reader:
+                    for i, sheet_name in enumerate(sheet_names):
+                        try:
+                            preview_data, dimensions = reader.preview(sheet_name)
+                            status, preview_info, is_valid = self._validate_sheet_data(
+                                preview_data, sheet_name, dimensions)
+                        except Exception as e:
+                            status, preview_info, is_valid = "Error", f"Error: {str(e)[:30]}...", False
                         
                         # Update UI safely
-                        self._update_ui_safely(lambda: self._add_sheet_to_tree(
-                            tree, sheet_name, status, preview_info, is_valid, checked_items))
+                        self._update_ui_safely(
+                            lambda name=sheet_name, st=status, info=preview_info, valid=is_valid:
+                            self._add_sheet_to_tree(tree, name, st, info, valid, checked_items))
+                        listed += 1
                         
                         # Update progress
                         progress = (i + 1) / len(sheet_names) * 100
-                        self._update_ui_safely(lambda: status_label.config(
+                        self._update_ui_safely(lambda progress=progress: status_label.config(
                             text=f"Loading sheets... {progress:.0f}%"))
-                    
-                except Exception as e:
-                    # Add error entry
-                    self._update_ui_safely(lambda: self._add_sheet_to_tree(
-                        tree, sheet_name, "Error", f"Error: {str(e)[:30]}...", False, checked_items))
+                        
+            except Exception as e:
+                # Workbook could not be opened: list the remaining sheets as errors
+                for sheet_name in sheet_names[listed:]:
+                    self._update_ui_safely(lambda name=sheet_name, error=str(e): self._add_sheet_to_tree(
+                        tree, name, "Error", f"Error: {error[:30]}...", False, checked_items))
             
             # Final status update
             self._update_ui_safely(lambda: status_label.config(
@@ -5343,17 +4960,7 @@ TraceSeis® is a registered trademark of TraceSeis, Inc."""
         # Start preview loading in background thread
         threading.Thread(target=preview_worker, daemon=True).start()
 
-    def _load_sheet_preview(self, sheet_name):
-        """Load preview data for a single sheet with memory management"""
-        try:
-            # Use a context manager to ensure proper cleanup
-            with pd.ExcelFile(self.file_path.get()) as excel_file:
-                df_preview = pd.read_excel(excel_file, sheet_name=sheet_name, nrows=5)
-            return df_preview
-        except Exception as e:
-            return None
-
-    def _validate_sheet_data(self, df_preview, sheet_name):
+    def _validate_sheet_data(self, df_preview, sheet_name, dimensions=None):
         """Validate sheet data and return detailed status"""
         try:
             if df_preview.empty:
@@ -5366,8 +4973,15 @@ TraceSeis® is a registered trademark of TraceSeis, Inc."""
             if numeric_cols == 0:
                 return "No Numeric", "No numeric data found", False
             
-            rows, cols = df_preview.shape
-            preview_info = f"{rows}+ rows, {cols} cols, {numeric_cols} numeric columns"
+            if dimensions:
+                # Declared sheet extent, excluding the header row
+                rows, cols = dimensions[0] - 1, dimensions[1]
+                preview_info = f"{rows} rows, {cols} cols, {numeric_cols} numeric columns"
+                if dimensions[0] * dimensions[1] > MAX_CELLS:
+                    preview_info += " (read in chunks)"
+            else:
+                rows, cols = df_preview.shape
+                preview_info = f"{rows}+ rows, {cols} cols, {numeric_cols} numeric columns"
             return "Valid", preview_info, True
             
         except Exception as e:
@@ -5469,57 +5083,7 @@ TraceSeis® is a registered trademark of TraceSeis, Inc."""
         Raises:
             ValueError: If data fails validation criteria
         """
-        if df is None:
-            raise ValueError("Input dataframe is None - cannot process empty data.")
-            
-        if df.empty:
-            raise ValueError("The selected sheet appears to be empty.")
-        
-        # Store original dimensions for reporting
-        original_shape = df.shape
-        original_columns = list(df.columns)
-        
-        # Remove completely empty rows and columns
-        df_cleaned = df.dropna(how='all').dropna(axis=1, how='all')
-        
-        if df_cleaned.empty:
-            raise ValueError(
-                f"Sheet contains no valid data after removing empty rows/columns. "
-                f"Original shape: {original_shape}, cleaned shape: {df_cleaned.shape}"
-            )
-        
-        # Check minimum structural requirements
-        if len(df_cleaned.columns) < 2:
-            raise ValueError(
-                f"Data must have at least 2 columns (neuron IDs + lithofacies data). "
-                f"Found: {len(df_cleaned.columns)} columns"
-            )
-        
-        # Check for reasonable data dimensions
-        if df_cleaned.shape[0] < 5:
-            raise ValueError(
-                f"Insufficient data rows for meaningful analysis. "
-                f"Minimum required: 5 rows, found: {df_cleaned.shape[0]} rows"
-            )
-        
-        # Validate column names (should not be empty or purely numeric)
-        invalid_cols = []
-        for col in df_cleaned.columns:
-            if pd.isna(col) or str(col).strip() == '' or str(col).isdigit():
-                invalid_cols.append(col)
-        
-        if invalid_cols:
-            # Try to fix column names
-            df_cleaned.columns = [f"Column_{i}" if pd.isna(col) or str(col).strip() == '' or str(col).isdigit() 
-                                else col for i, col in enumerate(df_cleaned.columns)]
-        
-        # Report cleaning results
-        rows_removed = original_shape[0] - df_cleaned.shape[0]
-        cols_removed = original_shape[1] - df_cleaned.shape[1]
-        
-        # Note: rows_removed and cols_removed are calculated but not displayed to avoid logging
-        
-        return df_cleaned
+        return clean_sheet_frame(df)
     
     def convert_to_numeric_safe(self, matrix_data):
         """
@@ -5534,89 +5098,26 @@ TraceSeis® is a registered trademark of TraceSeis, Inc."""
         Raises:
             ValueError: If data fails safety criteria or is unsuitable for analysis
         """
-        if matrix_data is None or matrix_data.empty:
-            raise ValueError("Matrix data is empty or None - cannot convert to numeric.")
-        
-        # Store original info for reporting
-        original_dtypes = matrix_data.dtypes.value_counts()
-        original_shape = matrix_data.shape
-        
-        # Convert to numeric with error handling
-        numeric_matrix = matrix_data.apply(pd.to_numeric, errors='coerce')
-        nan_count = numeric_matrix.isnull().sum().sum()
-        total_cells = numeric_matrix.size
-        
-        # Comprehensive data quality assessment
-        if nan_count > 0:
-            nan_percentage = (nan_count / total_cells) * 100
-            
-            # Note: Data quality issues are detected but not logged to avoid excessive output
-            
-            # Warn user about significant data quality issues
-            if nan_percentage > 50:
-                def warn_quality():
-                    messagebox.showwarning(
-                        "Data Quality Warning", 
-                        f"{nan_percentage:.1f}% of data cells are non-numeric.\n"
-                        f"This may affect analysis reliability. Consider reviewing your data source."
-                    )
-                self.root.after(0, warn_quality)
-            elif nan_percentage > 20:
-                def warn_moderate():
-                    messagebox.showwarning(
-                        "Data Quality Notice", 
-                        f"{nan_percentage:.1f}% of data cells are non-numeric.\n"
-                        f"These will be converted to zero for analysis."
-                    )
-                self.root.after(0, warn_moderate)
-        
-        # SECURITY: Comprehensive bounds checking and data sanitization
-        numeric_matrix = numeric_matrix.fillna(0)
-        
-        # Check for negative values and convert to absolute values
-        negative_count = (numeric_matrix < 0).sum().sum()
-        if negative_count > 0:
-            # Note: Negative values are converted but not logged to avoid excessive output
-            numeric_matrix = numeric_matrix.abs()
-        
-        # Check for unreasonably large values that could cause overflow or computational issues
-        max_val = numeric_matrix.max().max()
-        if max_val > 1e10:
-            raise ValueError(
-                f"Data contains extremely large values (max: {max_val:.2e}) that could cause "
-                f"computational overflow. Please review your data source."
-            )
-        elif max_val > 1e6:
-            # Note: Large values are detected but not logged to avoid excessive output
-            print(f"Warning: Large values detected (max: {max_val:.2e}) - monitoring for potential issues")
-        
-        # Check for unreasonably small values that might be floating point errors
-        min_val = numeric_matrix[numeric_matrix > 0].min().min() if (numeric_matrix > 0).any().any() else 0
-        if 0 < min_val < 1e-10:
-            # Note: Very small values are detected but not logged to avoid excessive output
-            pass
-        
-        # Convert to integer for contingency analysis
-        try:
-            numeric_matrix = numeric_matrix.astype(int)
-        except (ValueError, OverflowError) as e:
-            raise ValueError(
-                f"Failed to convert data to integers: {str(e)}. "
-                f"Data may contain values outside integer range."
-            )
-        
-        # Final validation: ensure we have meaningful data for analysis
-        total_sum = numeric_matrix.sum().sum()
-        if total_sum == 0:
-            raise ValueError(
-                "All lithofacies data values are zero - no samples available for analysis. "
-                "Please check your data source and selection criteria."
-            )
-        
-        # Report conversion results
-        # Note: Conversion results are calculated but not displayed to avoid logging
-        
-        return numeric_matrix
+        return sanitize_count_matrix(matrix_data, self._warn_data_quality)
+    
+    def _warn_data_quality(self, nan_percentage):
+        """Warn the user when a significant share of the data cells is non-numeric"""
+        if nan_percentage > 50:
+            def warn_quality():
+                messagebox.showwarning(
+                    "Data Quality Warning", 
+                    f"{nan_percentage:.1f}% of data cells are non-numeric.\n"
+                    f"This may affect analysis reliability. Consider reviewing your data source."
+                )
+            self.root.after(0, warn_quality)
+        elif nan_percentage > 20:
+            def warn_moderate():
+                messagebox.showwarning(
+                    "Data Quality Notice", 
+                    f"{nan_percentage:.1f}% of data cells are non-numeric.\n"
+                    f"These will be converted to zero for analysis."
+                )
+            self.root.after(0, warn_moderate)
 
     def normalize_confusion_matrix(self, confusion_matrix):
         """
@@ -5638,24 +5139,8 @@ TraceSeis® is a registered trademark of TraceSeis, Inc."""
                 print("Warning: Invalid confusion matrix format for normalization")
                 return confusion_matrix
             
-            # Create a copy to avoid modifying original
-            normalized_matrix = confusion_matrix.copy()
-            
-            # Calculate row sums
-            row_sums = normalized_matrix.sum(axis=1)
-            
-            # Check for all-zero rows and handle them
-            zero_rows = row_sums == 0
-            if zero_rows.any():
-                print(f"Warning: Found {zero_rows.sum()} rows with no observations - keeping as 0%")
-            
-            # Normalize each row (avoid division by zero)
-            for idx in normalized_matrix.index:
-                if row_sums[idx] > 0:
-                    normalized_matrix.loc[idx] = (normalized_matrix.loc[idx] / row_sums[idx]) * 100
-                else:
-                    # If row sum is 0, keep as 0
-                    normalized_matrix.loc[idx] = 0
+            # Row percentages in one broadcast division, cached per matrix
+            normalized_matrix = cached_normalized_confusion_matrix(confusion_matrix)
             
             # Validate output
             if not normalized_matrix.isna().any().any():
@@ -5710,36 +5195,15 @@ TraceSeis® is a registered trademark of TraceSeis, Inc."""
                     self.comparison_summary = None
                 
                 total_sheets = len(selected_sheets)
-                processed_count = 0
-                skipped_count = 0
                 
                 self.update_progress_status(f'Processing {total_sheets} selected sheets...', 5)
                 self.root.after(0, lambda: self.show_processing_overlay(f"Starting batch analysis of {total_sheets} sheets..."))
                 
-                # Process each selected sheet
-                for i, sheet_name in enumerate(selected_sheets):
-                    if self.cancel_event.is_set():
-                        return
-                    
-                    progress = 10 + (i / total_sheets) * 70  # 10-80% for processing
-                    self.update_progress_status(f'Analyzing sheet: {sheet_name} ({i+1}/{total_sheets})', progress)
-                    self.root.after(0, lambda name=sheet_name, idx=i+1, total=total_sheets: 
-                                  self.show_processing_overlay(f"Analyzing sheet {idx}/{total}: {name}"))
-                    
-                    try:
-                        # Process single sheet
-                        sheet_results = self.process_single_sheet_for_batch(sheet_name)
-                        
-                        if sheet_results and isinstance(sheet_results, dict):
-                            with self.data_lock:
-                                self.batch_results[sheet_name] = sheet_results
-                                processed_count += 1
-                        else:
-                            skipped_count += 1
-                                
-                    except Exception as e:
-                        skipped_count += 1
-                        continue
+                # Process the selected sheets
+                counts = self._run_sheet_analysis(selected_sheets)
+                if counts is None:
+                    return
+                processed_count, skipped_count = counts
                 
                 # Create comparison summary
                 self.update_progress_status('Creating comparison summary...', 85)
@@ -5822,34 +5286,14 @@ TraceSeis® is a registered trademark of TraceSeis, Inc."""
                 # Get all sheet names
                 sheet_names = self.excel_file.sheet_names
                 total_sheets = len(sheet_names)
-                processed_count = 0
-                skipped_count = 0
                 
                 self.update_progress_status(f'Processing {total_sheets} sheets...', 5)
                 
                 # Process each sheet
-                for i, sheet_name in enumerate(sheet_names):
-                    if self.cancel_event.is_set():
-                        return
-                    
-                    progress = 10 + (i / total_sheets) * 70  # 10-80% for processing
-                    self.update_progress_status(f'Analyzing sheet: {sheet_name}', progress)
-                    
-                    try:
-                        # Process single sheet
-                        sheet_results = self.process_single_sheet_for_batch(sheet_name)
-                        
-                        if sheet_results and isinstance(sheet_results, dict):
-                            with self.data_lock:
-                                self.batch_results[sheet_name] = sheet_results
-                                processed_count += 1
-                        else:
-                            skipped_count += 1
-                                
-                    except Exception as e:
-                        skipped_count += 1
-                        # Continue with other sheets
-                        continue
+                counts = self._run_sheet_analysis(sheet_names, show_overlay=False)
+                if counts is None:
+                    return
+                processed_count, skipped_count = counts
                 
                 # Create comparison summary
                 self.update_progress_status('Creating comparison summary...', 85)
@@ -5883,171 +5327,376 @@ TraceSeis® is a registered trademark of TraceSeis, Inc."""
         
         self.submit_task(batch_worker)
     
+    def _run_sheet_analysis(self, selected_sheets, show_overlay=True):
+        """
+        Analyze the selected sheets into batch_results with per-sheet progress reporting.
+        
+        Args:
+            selected_sheets (list): Sheets to analyze
+            show_overlay (bool): Whether to mirror progress in the processing overlay
+            
+        Returns:
+            tuple: (processed_count, skipped_count), or None if the operation was cancelled
+        """
+        total_sheets = len(selected_sheets)
+        
+        def report_progress(i, sheet_name):
+            progress = 10 + (i / total_sheets) * 70  # 10-80% for processing
+            self.update_progress_status(f'Analyzing sheet: {sheet_name} ({i+1}/{total_sheets})', progress)
+            if show_overlay:
+                self.root.after(0, lambda name=sheet_name, idx=i+1, total=total_sheets: 
+                              self.show_processing_overlay(f"Analyzing sheet {idx}/{total}: {name}"))
+        
+        start_time = time.perf_counter()
+        trace_start = len(TRACER.events())
+        sheet_results = self.process_sheets_for_batch(selected_sheets, report_progress)
+        if sheet_results is None:
+            return None
+        
+        with self.data_lock:
+            self.batch_results.update(sheet_results)
+            self.enforce_memory_budget()
+        
+        processed_count = len(sheet_results)
+        if TELEMETRY.enabled:
+            self._record_analysis_telemetry(
+                sheet_results, selected_sheets, time.perf_counter() - start_time, trace_start
+            )
+        return processed_count, total_sheets - processed_count
+    
+    def _record_analysis_telemetry(self, sheet_results, selected_sheets, seconds, trace_start=0):
+        """Record timing, sheet sizes, memory use and (when tracing) stage timings of one analysis run"""
+        shapes = [(result['total_neurons'], result['matrix_shape'][0]) for result in sheet_results.values()]
+        memory_budget = getattr(self, 'memory_budget', None)
+        fields = {
+            'sheets_selected': len(selected_sheets),
+            'sheets_analyzed': len(sheet_results),
+            'seconds': round(seconds, 4),
+            'parallel': self._use_process_pool(selected_sheets),
+            'max_neurons': max((shape[0] for shape in shapes), default=0),
+            'max_facies': max((shape[1] for shape in shapes), default=0),
+            'total_observations': int(sum(result['total_observations'] for result in sheet_results.values())),
+            'memory_mb': process_memory_mb(),
+            'spilled_sheets': len(memory_budget.spilled_sheets) if memory_budget is not None else 0
+        }
+        if TRACER.enabled:
+            run_events = TRACER.events()[trace_start:]
+            fields['stages_ms'] = {row['name']: round(row['total_ms'], 3) for row in TRACER.summary(run_events)}
+        TELEMETRY.record('sheet_analysis', **fields)
+    
     def process_single_sheet_for_batch(self, sheet_name, df=None):
         """Process a single sheet and return key metrics for comparison"""
         try:
-            # Read the sheet data if not provided
-            if df is None:
-                # Use the loaded Excel file if available, otherwise read from file path
-                if self.excel_file:
-                    df = pd.read_excel(self.excel_file, sheet_name=sheet_name)
-                else:
-                    df = pd.read_excel(self.file_path.get(), sheet_name=sheet_name)
-            
-            # Check if sheet is empty before validation
-            if df.empty:
+            som_matrix = self.prepare_som_matrix(sheet_name, df)
+            if som_matrix is None:
                 return None
             
-            # Check for minimum data requirements
-            if len(df.columns) < 2 or len(df) < 1:
-                return None
+            return self.analyze_som_matrix(sheet_name, som_matrix)
             
-            # Validate and clean data (reuse existing method)
-            try:
-                df = self.validate_and_clean_data(df)
-            except ValueError as e:
-                return None
+        except Exception as e:
+            return None
+    
+    def prepare_som_matrix(self, sheet_name, df=None):
+        """
+        Read, validate and convert a sheet into its neuron x lithofacies count matrix.
+        
+        Args:
+            sheet_name (str): Name of the sheet to read when df is not provided
+            df (pd.DataFrame, optional): Raw sheet data
             
-            # Extract matrix data
-            row_labels = df.iloc[:, 0].astype(str)
-            col_labels = df.columns[1:].astype(str)
-            matrix_data = df.iloc[:, 1:]
+        Returns:
+            pd.DataFrame: Integer counts indexed by neuron ID, or None if the sheet is unusable
+        """
+        # Read the sheet data if not provided
+        if df is None:
+            # Use the loaded Excel file if available, otherwise read from file path
+            with span('read_sheet', 'io', sheet=sheet_name):
+                if self.excel_file:
+                    df = pd.read_excel(self.excel_file, sheet_name=sheet_name)
+                else:
+                    df = pd.read_excel(self.file_path.get(), sheet_name=sheet_name)
+        
+        return build_som_matrix(df, self._warn_data_quality)
+    
+    def analyze_som_matrix(self, sheet_name, som_matrix):
+        """Compute the confusion matrix and key metrics for one prepared SOM matrix"""
+        try:
+            # Transform SOM to confusion matrix directly on the count array (CSR when mostly empty)
+            winner_idx, confusion_counts = som_to_confusion_matrix(sparse_counts(som_matrix.values))
             
-            # Convert to numeric (reuse existing method)
-            numeric_matrix = self.convert_to_numeric_safe(matrix_data)
+            # Calculate key metrics from the fused statistics kernel
+            stats = contingency_statistics(confusion_counts)
             
-            # Create confusion matrix
-            som_matrix = pd.DataFrame(
-                numeric_matrix.values,
-                index=row_labels,
-                columns=col_labels
+            return sheet_results_from_statistics(
+                sheet_name, som_matrix, winner_idx, confusion_counts, stats
             )
             
-            # Transform SOM to confusion matrix
-            neuron_winners = {}
-            for neuron_id in som_matrix.index:
-                neuron_counts = som_matrix.loc[neuron_id]
-                if neuron_counts.sum() > 0:
-                    winning_type = neuron_counts.idxmax()
-                    neuron_winners[neuron_id] = winning_type
-                else:
-                    neuron_winners[neuron_id] = None
-            
-            # Create sample records
-            sample_records = []
-            for neuron_id in som_matrix.index:
-                neuron_counts = som_matrix.loc[neuron_id]
-                predicted_type = neuron_winners[neuron_id]
-                
-                if predicted_type is not None:
-                    for actual_type, count in neuron_counts.items():
-                        for _ in range(int(count)):
-                            sample_records.append({
-                                'neuron': neuron_id,
-                                'predicted': predicted_type,
-                                'actual': actual_type
-                            })
-            
-            # Create traditional confusion matrix
-            lithofacies_types = list(som_matrix.columns)
-            confusion_matrix = pd.DataFrame(
-                0, 
-                index=lithofacies_types,
-                columns=lithofacies_types
-            )
+        except Exception as e:
+            return None
+    
+    @traced('batch')
+    def process_sheets_for_batch(self, sheet_names, progress_callback=None):
+        """
+        Process several sheets, re-analyzing only the ones that changed.
+        
+        Worksheets of .xlsx files are fingerprinted from the ZIP directory
+        (see worksheet_fingerprints). Sheets with the same fingerprint as in the
+        previous run, or with a fingerprint in the analysis cache, are reused
+        without being read. The remaining sheets are analyzed in the process
+        pool when parallel analysis is enabled (see process_sheets_parallel),
+        otherwise in this process (see _process_sheets_in_process).
+        
+        Args:
+            sheet_names (list): Sheets to process
+            progress_callback (callable, optional): Called with (index, sheet_name) for each analyzed sheet
             
-            for record in sample_records:
-                predicted = record['predicted']
-                actual = record['actual']
-                confusion_matrix.loc[predicted, actual] += 1
+        Returns:
+            dict: Sheet name -> result dictionary (unusable sheets are omitted),
+                or None if the operation was cancelled
+        """
+        fingerprints = worksheet_fingerprints(self.file_path.get())
+        results = self._reuse_unchanged_sheets(sheet_names, fingerprints)
+        pending = [name for name in sheet_names if name not in results]
+        
+        if pending:
+            # Progress indices continue after the reused sheets
+            offset = len(results)
             
-            # Calculate key metrics
-            matrix = confusion_matrix.values
-            total_observations = np.sum(matrix)
+            def report_progress(i, sheet_name):
+                if progress_callback:
+                    progress_callback(offset + i, sheet_name)
             
-            if total_observations == 0:
-                return None  # Skip sheets with no data
+            analyzed = None
+            parallel_done = False
+            if self._use_process_pool(pending):
+                try:
+                    analyzed = self.process_sheets_parallel(pending, report_progress, fingerprints)
+                    parallel_done = True
+                except Exception as e:
+                    print(f"Warning: Parallel sheet analysis failed, falling back to in-process analysis: {e}")
+                    self.process_manager.shutdown(wait=False)
+            if not parallel_done:
+                analyzed = self._process_sheets_in_process(pending, report_progress, fingerprints)
             
-            # Global fit (accuracy)
-            if matrix.shape[0] == matrix.shape[1]:
-                diagonal_sum = np.trace(matrix)
-                global_fit = (diagonal_sum / total_observations) * 100
-            else:
-                min_dim = min(matrix.shape)
-                diagonal_sum = sum(matrix[i, i] for i in range(min_dim))
-                global_fit = (diagonal_sum / total_observations) * 100
+            if analyzed is None:
+                return None
+            results.update(analyzed)
+        
+        # Remember this run's results for change detection on the next one
+        self._previous_sheet_results = {
+            fingerprints[name]: sheet_results for name, sheet_results in results.items() if name in fingerprints
+        }
+        
+        # Preserve the selection order
+        return {name: results[name] for name in sheet_names if name in results}
+    
+    def _reuse_unchanged_sheets(self, sheet_names, fingerprints):
+        """
+        Collect results for sheets whose worksheet fingerprint is already known.
+        
+        Args:
+            sheet_names (list): Sheets to process
+            fingerprints (dict): Sheet name -> worksheet fingerprint
             
-            # Cramer's V
-            try:
-                chi2, p_value, dof, expected = chi2_contingency(matrix)
-                n = total_observations
-                min_dim = min(matrix.shape) - 1
-                
-                if min_dim > 0 and n > 0:
-                    cramers_v = np.sqrt(chi2 / (n * min_dim))
+        Returns:
+            dict: Sheet name -> result dictionary for the unchanged sheets
+        """
+        previous = getattr(self, '_previous_sheet_results', None) or {}
+        cache = getattr(self, 'analysis_cache', None)
+        
+        reused = {}
+        for sheet_name in sheet_names:
+            fingerprint = fingerprints.get(sheet_name)
+            if not fingerprint:
+                continue
+            if fingerprint in previous:
+                sheet_results = previous[fingerprint]
+                if isinstance(sheet_results, SheetResult):
+                    # Keep the compact record (and anything it spilled or memoized)
+                    sheet_results = sheet_results.renamed(sheet_name)
                 else:
-                    cramers_v = 0
-            except:
-                cramers_v = 0
-                p_value = 1
+                    sheet_results = dict(sheet_results)
+                    sheet_results['sheet_name'] = sheet_name
+                reused[sheet_name] = sheet_results
+            elif cache is not None:
+                compact = cache.get(fingerprint)
+                if compact is not None:
+                    sheet_results = self._sheet_results_from_compact(sheet_name, compact)
+                    if sheet_results:
+                        reused[sheet_name] = sheet_results
+        return reused
+    
+    def _process_sheets_in_process(self, sheet_names, progress_callback=None, fingerprints=None):
+        """
+        Analyze sheets in this process with the batched metrics kernel (see analyze_workbook_sheets).
+        
+        The workbook is reopened from its path rather than using self.excel_file so a
+        re-exported workbook is read as it is now on disk, consistent with its
+        worksheet fingerprints.
+        
+        Args:
+            sheet_names (list): Sheets to process
+            progress_callback (callable, optional): Called with (index, sheet_name) before each sheet is read
+            fingerprints (dict, optional): Sheet name -> worksheet fingerprint to cache results under
             
-            # Percent Zero Entries (inactive neurons)
-            total_neurons = len(som_matrix)
-            active_neurons = len([w for w in neuron_winners.values() if w is not None])
-            inactive_neurons = total_neurons - active_neurons
-            percent_undefined = (inactive_neurons / total_neurons) * 100
+        Returns:
+            dict: Sheet name -> result dictionary (unusable sheets are omitted),
+                or None if the operation was cancelled
+        """
+        compact_results = analyze_workbook_sheets(
+            self.file_path.get() or self.excel_file, sheet_names,
+            cache=getattr(self, 'analysis_cache', None), fingerprints=fingerprints,
+            progress_callback=progress_callback, cancel_event=self.cancel_event,
+            memory_budget=getattr(self, 'memory_budget', None), stream_min_cells=MAX_CELLS
+        )
+        if compact_results is None:
+            return None
+        
+        results = {}
+        for sheet_name, compact in compact_results.items():
+            sheet_results = self._sheet_results_from_compact(sheet_name, compact)
+            if sheet_results:
+                results[sheet_name] = sheet_results
+        return results
+    
+    def _use_process_pool(self, sheet_names):
+        """Whether a sheet selection should be analyzed in the process pool"""
+        if not getattr(self, 'parallel_analysis', None) or not self.parallel_analysis.get():
+            return False
+        if PROCESS_POOL_WORKERS < 2 or len(sheet_names) < PARALLEL_MIN_SHEETS:
+            return False
+        return os.path.isfile(self.file_path.get())
+    
+    def parallel_sheet_limit(self, sheet_names):
+        """
+        Number of sheets the process pool may analyze at once within the memory budget.
+        
+        The memory held by a worker is estimated from the uncompressed size of
+        the largest selected worksheet.
+        
+        Args:
+            sheet_names (list): Sheets to process
             
-            # Return summary results
-            return {
-                'sheet_name': sheet_name,
-                'total_observations': total_observations,
-                'total_neurons': total_neurons,
-                'active_neurons': active_neurons,
-                'global_fit': global_fit,
-                'cramers_v': cramers_v,
-                'percent_undefined': percent_undefined,
-                'chi2_p_value': p_value,
-                'matrix_shape': confusion_matrix.shape,
-                'confusion_matrix': confusion_matrix,
-                'som_matrix': som_matrix,
-                'neuron_winners': neuron_winners
-            }
+        Returns:
+            int: Between 1 and PROCESS_POOL_WORKERS
+        """
+        memory_budget = getattr(self, 'memory_budget', None)
+        if memory_budget is None:
+            return PROCESS_POOL_WORKERS
+        
+        sizes = self.sheet_size_estimates or worksheet_sizes(self.file_path.get())
+        per_sheet = max((sizes.get(name, 0) for name in sheet_names), default=0)
+        return memory_budget.max_concurrency(PROCESS_POOL_WORKERS, per_sheet)
+    
+    def enforce_memory_budget(self):
+        """
+        Account the held sheet results against the memory budget and spill the
+        largest ones to disk while it is exceeded. Call with data_lock held.
+        """
+        memory_budget = getattr(self, 'memory_budget', None)
+        if memory_budget is None:
+            return
+        
+        memory_budget.account_results(self.batch_results)
+        memory_budget.sample_process_memory()
+        if memory_budget.enforce(self.batch_results):
+            spilled = len(memory_budget.spilled_sheets)
+            self.update_progress_status(
+                f'Memory budget of {MAX_MEMORY_MB} MB reached: {spilled} sheet result(s) moved to disk'
+            )
+    
+    def process_sheets_parallel(self, sheet_names, progress_callback=None, fingerprints=None):
+        """
+        Read and analyze sheets in the process pool.
+        
+        Each worker process parses one sheet and returns its count matrix,
+        winners, confusion matrix and contingency statistics as plain arrays;
+        the result dictionaries are rebuilt here. Sheets are submitted as
+        earlier ones complete, with no more in flight than the memory budget
+        allows (see parallel_sheet_limit). Pending sheets are cancelled as
+        soon as cancel_event is set.
+        
+        Args:
+            sheet_names (list): Sheets to process
+            progress_callback (callable, optional): Called with (index, sheet_name) as each sheet completes
+            fingerprints (dict, optional): Sheet name -> worksheet fingerprint to cache results under
             
-        except Exception as e:
-            return None
+        Returns:
+            dict: Sheet name -> result dictionary (unusable sheets are omitted),
+                or None if the operation was cancelled
+        """
+        file_path = self.file_path.get()
+        cache = getattr(self, 'analysis_cache', None)
+        fingerprints = fingerprints or {}
+        
+        # Spans recorded in the workers are sent back with each result
+        tracing = TRACER.enabled
+        task = (run_traced, analyze_sheet_file) if tracing else (analyze_sheet_file,)
+        
+        # Only as many sheets are in flight as the memory budget allows
+        max_in_flight = self.parallel_sheet_limit(sheet_names)
+        queued = iter(sheet_names)
+        futures = {}
+        
+        def submit_next():
+            sheet_name = next(queued, None)
+            if sheet_name is None:
+                return False
+            future = self.process_manager.submit_task(
+                *task, file_path, sheet_name, cache, fingerprints.get(sheet_name), MAX_CELLS
+            )
+            futures[future] = sheet_name
+            pending.add(future)
+            return True
+        
+        results = {}
+        pending = set()
+        while len(pending) < max_in_flight and submit_next():
+            pass
+        completed = 0
+        try:
+            while pending:
+                if self.cancel_event.is_set():
+                    return None
+                done, pending = concurrent.futures.wait(
+                    pending, timeout=PROCESS_POLL_INTERVAL, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    submit_next()
+                    sheet_name = futures.pop(future)
+                    if progress_callback:
+                        progress_callback(completed, sheet_name)
+                    completed += 1
+                    
+                    compact = future.result()
+                    if tracing:
+                        compact, events = compact
+                        TRACER.add_events(events)
+                    if compact is None:
+                        continue
+                    sheet_results = self._sheet_results_from_compact(sheet_name, compact)
+                    if sheet_results:
+                        results[sheet_name] = sheet_results
+        finally:
+            for future in pending:
+                future.cancel()
+        
+        # Preserve the selection order
+        return {name: results[name] for name in sheet_names if name in results}
+    
+    def _sheet_results_from_compact(self, sheet_name, compact):
+        """Rebuild a sheet result dictionary from a compact result, warning about data quality"""
+        if compact['non_numeric_percentage'] > 0:
+            self._warn_data_quality(compact['non_numeric_percentage'])
+        
+        return sheet_results_from_compact(sheet_name, compact)
     
     def create_comparison_summary(self):
         """Create a summary table comparing all processed sheets"""
         if not self.batch_results:
             return
         
-        summary_data = []
-        
-        for sheet_name, results in self.batch_results.items():
-            summary_data.append({
-                'SOM_Config': sheet_name,
-                'Global_Fit': results['global_fit'],
-                'Cramers_V': results['cramers_v'],
-                'Percent_Zero_Entries': results['percent_undefined'],
-                'Total_Samples': results['total_observations'],
-                'Active_Neurons': results['active_neurons'],
-                'Total_Neurons': results['total_neurons'],
-                'Utilization': (results['active_neurons'] / results['total_neurons']) * 100,
-                'P_Value': results['chi2_p_value']
-            })
-        
-        # Create DataFrame and sort by Global Fit (descending)
-        self.comparison_summary = pd.DataFrame(summary_data)
-        self.comparison_summary = self.comparison_summary.sort_values('Global_Fit', ascending=False)
-        
-        # Add ranking
-        self.comparison_summary['Rank'] = range(1, len(self.comparison_summary) + 1)
-        
-        # Reorder columns for better display
-        column_order = ['Rank', 'SOM_Config', 'Global_Fit', 'Cramers_V', 
-                       'Percent_Zero_Entries', 'Total_Samples', 'Active_Neurons', 
-                       'Total_Neurons', 'Utilization', 'P_Value']
-        self.comparison_summary = self.comparison_summary[column_order]
+        self.comparison_summary = build_comparison_summary(self.batch_results)
     
     def update_single_sheet_results_display(self, sheet_name):
         """Update the results display to show single sheet analysis results"""
@@ -6295,307 +5944,13 @@ PERFORMANCE INTERPRETATION:
     
     # =============== QC ORCHESTRATION METHODS ===============
     
-    def get_chi_square_qc_summary(self, sheet_data):
-        """
-        Generate comprehensive Chi-square test QC summary with statistical validation
-        and quality assessment.
-        
-        Args:
-            sheet_data (dict): Dictionary containing sheet analysis results
-            
-        Returns:
-            dict: Comprehensive QC summary with statistical metrics and quality indicators
-        """
-        # Input validation
-        if not sheet_data or not isinstance(sheet_data, dict):
-            return self._get_default_qc_result("Invalid sheet data format")
-        
-        if 'confusion_matrix' not in sheet_data:
-            return self._get_default_qc_result("Missing confusion matrix data")
-        
-        try:
-            matrix = sheet_data['confusion_matrix']
-            
-            # Validate matrix structure
-            if not hasattr(matrix, 'values') or not hasattr(matrix, 'shape'):
-                return self._get_default_qc_result("Invalid confusion matrix format")
-            
-            matrix_values = matrix.values
-            matrix_shape = matrix.shape
-            
-            # Check matrix dimensions
-            if len(matrix_shape) != 2:
-                return self._get_default_qc_result(f"Invalid matrix dimensions: {matrix_shape}")
-            
-            if matrix_shape[0] < 2 or matrix_shape[1] < 2:
-                return self._get_default_qc_result(f"Matrix too small for chi-square test: {matrix_shape}")
-            
-            total_observations = np.sum(matrix_values)
-            
-            if total_observations == 0:
-                return self._get_default_qc_result("No observations in confusion matrix")
-            
-            # Check for minimum sample size requirements
-            if total_observations < 20:
-                return self._get_default_qc_result(
-                    f"Insufficient sample size for reliable chi-square test: {total_observations} observations"
-                )
-            
-            # Calculate chi-square test with error handling
-            try:
-                chi2, p_value, dof, expected = chi2_contingency(matrix_values)
-            except Exception as chi_error:
-                return self._get_default_qc_result(f"Chi-square calculation failed: {str(chi_error)}")
-            
-            # Validate chi-square results
-            if not np.isfinite(chi2) or not np.isfinite(p_value):
-                return self._get_default_qc_result("Chi-square test produced invalid results")
-            
-            # Calculate Cramer's V (effect size) with validation
-            min_dim = min(matrix_shape) - 1
-            if min_dim > 0 and total_observations > 0 and chi2 > 0:
-                cramers_v = np.sqrt(chi2 / (total_observations * min_dim))
-                # Clamp Cramer's V to valid range [0, 1]
-                cramers_v = max(0.0, min(1.0, cramers_v))
-            else:
-                cramers_v = 0.0
-            
-            # Comprehensive expected frequency validation
-            expected_freq_ok = True
-            expected_freq_warnings = []
-            
-            if expected is not None:
-                # Check for cells with expected frequency < 5 (chi-square assumption violation)
-                low_freq_cells = expected < 5
-                low_freq_count = np.sum(low_freq_cells)
-                
-                if low_freq_count > 0:
-                    low_freq_percentage = (low_freq_count / expected.size) * 100
-                    expected_freq_ok = low_freq_percentage < 20  # Allow up to 20% low frequency cells
-                    
-                    if low_freq_percentage > 50:
-                        expected_freq_warnings.append(f"Severe: {low_freq_percentage:.1f}% of cells have expected frequency < 5")
-                    elif low_freq_percentage > 20:
-                        expected_freq_warnings.append(f"Moderate: {low_freq_percentage:.1f}% of cells have expected frequency < 5")
-            
-            # Calculate accuracy score with validation
-            diagonal_sum = np.trace(matrix_values)
-            accuracy_score = (diagonal_sum / total_observations) if total_observations > 0 else 0.0
-            
-            # Validate accuracy score
-            if not np.isfinite(accuracy_score) or accuracy_score < 0 or accuracy_score > 1:
-                accuracy_score = 0.0
-            
-            # Determine QC grade based on multiple criteria
-            qc_grade = self._calculate_qc_grade(p_value, cramers_v, accuracy_score, expected_freq_ok)
-            
-            # Enhanced QC status with confidence levels
-            if p_value < 0.001:
-                qc_status = "Highly significant association (p < 0.001)"
-                confidence_level = "99.9%"
-            elif p_value < 0.01:
-                qc_status = "Very significant association (p < 0.01)"
-                confidence_level = "99%"
-            elif p_value < 0.05:
-                qc_status = "Significant association (p < 0.05)"
-                confidence_level = "95%"
-            else:
-                qc_status = "No significant association (p >= 0.05)"
-                confidence_level = "Not applicable"
-            
-            # Calculate additional quality metrics
-            matrix_density = np.count_nonzero(matrix_values) / matrix_values.size
-            row_balance = np.std(np.sum(matrix_values, axis=1)) / np.mean(np.sum(matrix_values, axis=1)) if np.mean(np.sum(matrix_values, axis=1)) > 0 else 0
-            col_balance = np.std(np.sum(matrix_values, axis=0)) / np.mean(np.sum(matrix_values, axis=0)) if np.mean(np.sum(matrix_values, axis=0)) > 0 else 0
-            
-            # Determine overall quality assessment
-            quality_assessment = self._assess_overall_quality(
-                p_value, cramers_v, accuracy_score, expected_freq_ok, 
-                matrix_density, row_balance, col_balance
-            )
-            
-            return {
-                'test_valid': True,
-                'chi2_statistic': float(chi2),
-                'p_value': float(p_value),
-                'effect_size': float(cramers_v),
-                'expected_freq_ok': expected_freq_ok,
-                'expected_freq_warnings': expected_freq_warnings,
-                'qc_status': qc_status,
-                'confidence_level': confidence_level,
-                'qc_grade': qc_grade,
-                'accuracy_score': float(accuracy_score),
-                'total_observations': int(total_observations),
-                'matrix_dimensions': matrix_shape,
-                'matrix_density': float(matrix_density),
-                'row_balance': float(row_balance),
-                'col_balance': float(col_balance),
-                'quality_assessment': quality_assessment,
-                'degrees_of_freedom': int(dof),
-                'analysis_timestamp': datetime.datetime.now().isoformat()
-            }
-            
-        except Exception as e:
-            error_msg = f"Error in QC analysis: {str(e)}"
-            print(f"QC analysis error: {error_msg}")
-            return self._get_default_qc_result(error_msg)
-    
-    def _get_default_qc_result(self, error_message):
-        """Generate default QC result for error cases"""
-        return {
-            'test_valid': False,
-            'chi2_statistic': 0.0,
-            'p_value': 1.0,
-            'effect_size': 0.0,
-            'expected_freq_ok': False,
-            'expected_freq_warnings': [error_message],
-            'qc_status': 'Analysis failed',
-            'confidence_level': 'Not applicable',
-            'qc_grade': 'F',
-            'accuracy_score': 0.0,
-            'total_observations': 0,
-            'matrix_dimensions': (0, 0),
-            'matrix_density': 0.0,
-            'row_balance': 0.0,
-            'col_balance': 0.0,
-            'quality_assessment': 'Unable to assess',
-            'degrees_of_freedom': 0,
-            'analysis_timestamp': datetime.datetime.now().isoformat()
-        }
-    
-    def _assess_overall_quality(self, p_value, cramers_v, accuracy_score, expected_freq_ok, 
-                               matrix_density, row_balance, col_balance):
-        """Assess overall data quality based on multiple metrics"""
-        quality_score = 0
-        max_score = 100
-        
-        # Statistical significance (25 points)
-        if p_value < 0.001:
-            quality_score += 25
-        elif p_value < 0.01:
-            quality_score += 20
-        elif p_value < 0.05:
-            quality_score += 15
-        elif p_value < 0.1:
-            quality_score += 10
-        
-        # Effect size (25 points)
-        if cramers_v >= 0.7:
-            quality_score += 25
-        elif cramers_v >= 0.5:
-            quality_score += 20
-        elif cramers_v >= 0.3:
-            quality_score += 15
-        elif cramers_v >= 0.1:
-            quality_score += 10
-        
-        # Accuracy (20 points)
-        if accuracy_score >= 0.9:
-            quality_score += 20
-        elif accuracy_score >= 0.8:
-            quality_score += 18
-        elif accuracy_score >= 0.7:
-            quality_score += 15
-        elif accuracy_score >= 0.6:
-            quality_score += 12
-        elif accuracy_score >= 0.5:
-            quality_score += 8
-        
-        # Expected frequency validity (15 points)
-        if expected_freq_ok:
-            quality_score += 15
-        
-        # Matrix quality (15 points)
-        if matrix_density >= 0.8:
-            quality_score += 15
-        elif matrix_density >= 0.6:
-            quality_score += 12
-        elif matrix_density >= 0.4:
-            quality_score += 8
-        
-        # Balance assessment (bonus/penalty)
-        balance_penalty = min(10, (row_balance + col_balance) * 5)
-        quality_score = max(0, quality_score - balance_penalty)
-        
-        # Convert to quality level
-        if quality_score >= 85:
-            return "Excellent"
-        elif quality_score >= 70:
-            return "Good"
-        elif quality_score >= 55:
-            return "Fair"
-        elif quality_score >= 40:
-            return "Poor"
-        else:
-            return "Very Poor"
+    def _get_contingency_statistics(self, sheet_data):
+        """Return the fused contingency statistics of a sheet, reusing those computed during analysis"""
+        return sheet_contingency_statistics(sheet_data)
     
     def get_comparison_readiness_status(self, sheet_results_dict):
         """Sheet comparison readiness analysis"""
-        if not sheet_results_dict:
-            return {
-                'total_sheets': 0,
-                'comparable_sheets': 0,
-                'readiness_score': 0.0,
-                'comparison_groups': {'high_quality': [], 'medium_quality': [], 'low_quality': []},
-                'readiness_warnings': ['No sheets available']
-            }
-        
-        try:
-            total_sheets = len(sheet_results_dict)
-            comparable_sheets = 0
-            comparison_groups = {'high_quality': [], 'medium_quality': [], 'low_quality': []}
-            readiness_warnings = []
-            
-            for sheet_name, sheet_data in sheet_results_dict.items():
-                if not sheet_data:
-                    continue
-                    
-                global_fit = sheet_data.get('global_fit', 0)
-                cramers_v = sheet_data.get('cramers_v', 0)
-                total_observations = sheet_data.get('total_observations', 0)
-                percent_undefined = sheet_data.get('percent_undefined', 100)
-                
-                quality_score = (
-                    (global_fit / 100) * 0.4 +
-                    cramers_v * 0.3 +
-                    min(total_observations / 1000, 1.0) * 0.2 +
-                    (100 - percent_undefined) / 100 * 0.1
-                ) * 100
-                
-                if quality_score >= 75:
-                    comparison_groups['high_quality'].append(sheet_name)
-                    comparable_sheets += 1
-                elif quality_score >= 50:
-                    comparison_groups['medium_quality'].append(sheet_name)
-                    comparable_sheets += 1
-                else:
-                    comparison_groups['low_quality'].append(sheet_name)
-                
-                if total_observations < 100:
-                    readiness_warnings.append(f'{sheet_name}: Small sample size')
-                if percent_undefined > 50:
-                    readiness_warnings.append(f'{sheet_name}: High undefined neurons')
-                if global_fit < 50:
-                    readiness_warnings.append(f'{sheet_name}: Low accuracy')
-            
-            readiness_score = (comparable_sheets / total_sheets * 100) if total_sheets > 0 else 0
-            
-            return {
-                'total_sheets': total_sheets,
-                'comparable_sheets': comparable_sheets,
-                'readiness_score': readiness_score,
-                'comparison_groups': comparison_groups,
-                'readiness_warnings': readiness_warnings
-            }
-            
-        except Exception as e:
-            return {
-                'total_sheets': len(sheet_results_dict) if sheet_results_dict else 0,
-                'comparable_sheets': 0,
-                'readiness_score': 0.0,
-                'comparison_groups': {'high_quality': [], 'medium_quality': [], 'low_quality': []},
-                'readiness_warnings': [f'Analysis error: {str(e)[:50]}']
-            }
+        return comparison_readiness_status(sheet_results_dict)
     
     # =============== QC PANEL METHODS ===============
     
@@ -6719,35 +6074,7 @@ QUALITY DISTRIBUTION:
     
     def calculate_qc_grade(self, sheet_data, chi_square_qc):
         """Calculate overall QC grade for a sheet"""
-        try:
-            # Weight different factors
-            accuracy_score = min(sheet_data.get('global_fit', 0) / 100, 1.0)  # 0-1 scale
-            effect_size_score = min(sheet_data.get('cramers_v', 0), 1.0)      # 0-1 scale
-            sample_size_score = min(sheet_data.get('total_observations', 0) / 1000, 1.0)  # 0-1 scale
-            validity_score = 1.0 if chi_square_qc.get('test_valid', False) else 0.5  # Valid test or not
-            
-            # Weighted overall score
-            overall_score = (
-                accuracy_score * 0.4 +     # Classification accuracy (40%)
-                effect_size_score * 0.3 +  # Effect size strength (30%)
-                sample_size_score * 0.2 +  # Sample adequacy (20%)
-                validity_score * 0.1       # Test validity (10%)
-            ) * 100
-            
-            # Grade assignment
-            if overall_score >= 85:
-                return 'A'
-            elif overall_score >= 75:
-                return 'B'
-            elif overall_score >= 65:
-                return 'C'
-            elif overall_score >= 50:
-                return 'D'
-            else:
-                return 'F'
-                
-        except Exception:
-            return 'F'
+        return overall_qc_grade(sheet_data, chi_square_qc)
     
     def update_comparison_readiness(self):
         """Update the comparison readiness status and buttons"""
@@ -6855,52 +6182,10 @@ QUALITY DISTRIBUTION:
                 return
             
             # Generate comprehensive QC report
-            readiness_status = self.get_comparison_readiness_status(self.batch_results)
-            
-            report_content = f"""GEOPHYSICS QC ANALYSIS REPORT
-{'='*60}
-Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-File: {os.path.basename(self.file_path.get()) if hasattr(self, 'file_path') and self.file_path.get() else 'Unknown'}
-
-EXECUTIVE SUMMARY:
-Total Sheets Analyzed: {readiness_status['total_sheets']}
-Sheets Ready for Comparison: {readiness_status['comparable_sheets']}
-Overall Readiness Score: {readiness_status['readiness_score']:.1f}%
-
-QUALITY DISTRIBUTION:
-High Quality (Grade A/B): {len(readiness_status['comparison_groups']['high_quality'])}
-Medium Quality (Grade C): {len(readiness_status['comparison_groups']['medium_quality'])}
-Low Quality (Grade D/F): {len(readiness_status['comparison_groups']['low_quality'])}
-
-DETAILED SHEET ANALYSIS:
-{'='*60}
-"""
-            
-            # Add detailed sheet information
-            for sheet_name, sheet_data in self.batch_results.items():
-                chi_square_qc = self.get_chi_square_qc_summary(sheet_data)
-                qc_grade = self.calculate_qc_grade(sheet_data, chi_square_qc)
-                
-                report_content += f"""
-Sheet: {sheet_name}
-QC Grade: {qc_grade}
-Observations: {sheet_data.get('total_observations', 0):,}
-Classification Accuracy: {sheet_data.get('global_fit', 0):.2f}%
-Effect Size (Cramer's V): {sheet_data.get('cramers_v', 0):.4f}
-Chi-square Valid: {'Yes' if chi_square_qc.get('test_valid') else 'No'}
-Statistical Significance: {chi_square_qc.get('qc_status', 'Unknown')}
-Matrix Dimensions: {sheet_data.get('matrix_shape', 'Unknown')}
-{'-'*40}"""
-            
-            # Add warnings section
-            if readiness_status['readiness_warnings']:
-                report_content += f"""
-
-QUALITY WARNINGS:
-{'='*30}
-"""
-                for warning in readiness_status['readiness_warnings']:
-                    report_content += f"• {warning}\n"
+            file_label = os.path.basename(self.file_path.get()) if hasattr(self, 'file_path') and self.file_path.get() else 'Unknown'
+            memory_budget = getattr(self, 'memory_budget', None)
+            memory_report = memory_budget.report() if memory_budget is not None else None
+            report_content = format_qc_report(self.batch_results, file_label, memory_report)
             
             # Write to file
             with open(filename, 'w', encoding='utf-8') as f:
@@ -6919,87 +6204,8 @@ QUALITY WARNINGS:
     # =============== END QC PANEL METHODS ===============
 
     def get_chi_square_qc_summary(self, sheet_data):
-        """Chi-square test QC summary - reuses existing chi2_contingency results"""
-        if not sheet_data or 'confusion_matrix' not in sheet_data:
-            return {
-                'test_valid': False,
-                'chi2_statistic': 0,
-                'p_value': 1.0,
-                'effect_size': 0.0,
-                'expected_freq_ok': False,
-                'qc_status': 'No data available',
-                'qc_grade': 'F',
-                'accuracy_score': 0.0
-            }
-        
-        try:
-            matrix = sheet_data['confusion_matrix'].values
-            total_observations = np.sum(matrix)
-            
-            if total_observations == 0:
-                return {
-                    'test_valid': False,
-                    'chi2_statistic': 0,
-                    'p_value': 1.0,
-                    'effect_size': 0.0,
-                    'expected_freq_ok': False,
-                    'qc_status': 'No observations in confusion matrix',
-                    'qc_grade': 'F',
-                    'accuracy_score': 0.0
-                }
-            
-            # Calculate chi-square test
-            chi2, p_value, dof, expected = chi2_contingency(matrix)
-            
-            # Calculate Cramer's V (effect size)
-            min_dim = min(matrix.shape) - 1
-            if min_dim > 0 and total_observations > 0:
-                cramers_v = np.sqrt(chi2 / (total_observations * min_dim))
-            else:
-                cramers_v = 0
-            
-            # Check expected frequencies (should be >= 5 for chi-square validity)
-            expected_freq_ok = np.all(expected >= 5)
-            
-            # Calculate accuracy score
-            diagonal_sum = np.trace(matrix)
-            accuracy_score = (diagonal_sum / total_observations) if total_observations > 0 else 0
-            
-            # Determine QC grade based on multiple criteria
-            qc_grade = self._calculate_qc_grade(p_value, cramers_v, accuracy_score, expected_freq_ok)
-            
-            # Determine QC status
-            if p_value < 0.001:
-                qc_status = "Highly significant association"
-            elif p_value < 0.01:
-                qc_status = "Very significant association"
-            elif p_value < 0.05:
-                qc_status = "Significant association"
-            else:
-                qc_status = "No significant association"
-            
-            return {
-                'test_valid': True,
-                'chi2_statistic': chi2,
-                'p_value': p_value,
-                'effect_size': cramers_v,
-                'expected_freq_ok': expected_freq_ok,
-                'qc_status': qc_status,
-                'qc_grade': qc_grade,
-                'accuracy_score': accuracy_score
-            }
-            
-        except Exception as e:
-            return {
-                'test_valid': False,
-                'chi2_statistic': 0,
-                'p_value': 1.0,
-                'effect_size': 0.0,
-                'expected_freq_ok': False,
-                'qc_status': f'Error in analysis: {str(e)[:50]}',
-                'qc_grade': 'F',
-                'accuracy_score': 0.0
-            }
+        """Chi-square test QC summary - computed once per sheet result and reused until its matrix changes"""
+        return chi_square_qc_summary(sheet_data)
     
     def _calculate_qc_grade(self, p_value, cramers_v, accuracy_score, expected_freq_ok):
         """
@@ -7012,112 +6218,14 @@ QUALITY WARNINGS:
             expected_freq_ok (bool): Whether expected frequencies meet chi-square assumptions
             
         Returns:
-            str: Letter grade (A, B, C, D, F) with detailed explanation
+            str: Letter grade (A, B, C, D, F); the full grade summary is kept in _last_qc_grade_details
         """
-        grade_points = 0
-        max_points = 15
-        grade_details = []
-        
-        # P-value scoring (0-5 points) - Statistical significance
-        if p_value < 0.001:
-            grade_points += 5
-            grade_details.append("Excellent statistical significance (p < 0.001)")
-        elif p_value < 0.01:
-            grade_points += 4
-            grade_details.append("Very good statistical significance (p < 0.01)")
-        elif p_value < 0.05:
-            grade_points += 3
-            grade_details.append("Good statistical significance (p < 0.05)")
-        elif p_value < 0.1:
-            grade_points += 2
-            grade_details.append("Moderate statistical significance (p < 0.1)")
-        elif p_value < 0.2:
-            grade_points += 1
-            grade_details.append("Weak statistical significance (p < 0.2)")
-        else:
-            grade_details.append("No statistical significance (p >= 0.2)")
-        
-        # Effect size scoring (0-5 points) - Practical significance
-        if cramers_v >= 0.7:
-            grade_points += 5
-            grade_details.append("Very large effect size (Cramer's V ≥ 0.7)")
-        elif cramers_v >= 0.5:
-            grade_points += 4
-            grade_details.append("Large effect size (Cramer's V ≥ 0.5)")
-        elif cramers_v >= 0.3:
-            grade_points += 3
-            grade_details.append("Medium effect size (Cramer's V ≥ 0.3)")
-        elif cramers_v >= 0.1:
-            grade_points += 2
-            grade_details.append("Small effect size (Cramer's V ≥ 0.1)")
-        elif cramers_v > 0:
-            grade_points += 1
-            grade_details.append("Minimal effect size (Cramer's V > 0)")
-        else:
-            grade_details.append("No effect size (Cramer's V = 0)")
-        
-        # Accuracy scoring (0-3 points) - Classification performance
-        if accuracy_score >= 0.9:
-            grade_points += 3
-            grade_details.append("Excellent classification accuracy (≥ 90%)")
-        elif accuracy_score >= 0.8:
-            grade_points += 2.5
-            grade_details.append("Very good classification accuracy (≥ 80%)")
-        elif accuracy_score >= 0.7:
-            grade_points += 2
-            grade_details.append("Good classification accuracy (≥ 70%)")
-        elif accuracy_score >= 0.6:
-            grade_points += 1.5
-            grade_details.append("Fair classification accuracy (≥ 60%)")
-        elif accuracy_score >= 0.5:
-            grade_points += 1
-            grade_details.append("Poor classification accuracy (≥ 50%)")
-        else:
-            grade_details.append("Very poor classification accuracy (< 50%)")
-        
-        # Expected frequency validity (0-2 points) - Statistical assumptions
-        if expected_freq_ok:
-            grade_points += 2
-            grade_details.append("Chi-square assumptions met (expected frequencies ≥ 5)")
-        else:
-            grade_details.append("Chi-square assumptions violated (some expected frequencies < 5)")
-        
-        # Calculate percentage score
-        percentage_score = (grade_points / max_points) * 100
-        
-        # Convert to letter grade with detailed explanation
-        if percentage_score >= 90:
-            grade = 'A'
-            grade_explanation = "Excellent quality - Results are highly reliable and statistically robust"
-        elif percentage_score >= 80:
-            grade = 'B'
-            grade_explanation = "Very good quality - Results are reliable with minor limitations"
-        elif percentage_score >= 70:
-            grade = 'C'
-            grade_explanation = "Good quality - Results are acceptable but with some limitations"
-        elif percentage_score >= 60:
-            grade = 'D'
-            grade_explanation = "Fair quality - Results have significant limitations and should be interpreted with caution"
-        else:
-            grade = 'F'
-            grade_explanation = "Poor quality - Results are unreliable and should not be used for decision making"
-        
-        # Store grade details for potential display
-        grade_summary = {
-            'letter_grade': grade,
-            'percentage_score': percentage_score,
-            'points_earned': grade_points,
-            'max_points': max_points,
-            'explanation': grade_explanation,
-            'details': grade_details
-        }
+        grade_summary = qc_grade_summary(p_value, cramers_v, accuracy_score, expected_freq_ok)
         
         # Store in instance for potential access by other methods
-        if not hasattr(self, '_last_qc_grade_details'):
-            self._last_qc_grade_details = {}
         self._last_qc_grade_details = grade_summary
         
-        return grade
+        return grade_summary['letter_grade']
 
     def cleanup_resources(self):
         """
@@ -7162,6 +6270,20 @@ QUALITY WARNINGS:
                 except Exception as e:
                     print(f"Warning: Thread pool shutdown error: {str(e)}")
             
+            # Stop analysis worker processes
+            if hasattr(self, 'process_manager'):
+                try:
+                    self.process_manager.shutdown(wait=False)
+                except Exception as e:
+                    print(f"Warning: Process pool shutdown error: {str(e)}")
+            
+            # Stop chart rendering worker processes
+            if hasattr(self, 'render_service'):
+                try:
+                    self.render_service.shutdown(wait=False)
+                except Exception as e:
+                    print(f"Warning: Render pool shutdown error: {str(e)}")
+            
             # Close visualization window if open
             if hasattr(self, 'viz_window') and self.viz_window and self.viz_window.window:
                 try:
@@ -7191,6 +6313,8 @@ QUALITY WARNINGS:
                 try:
                     if hasattr(self, 'batch_results'):
                         self.batch_results.clear()
+                    if hasattr(self, '_previous_sheet_results'):
+                        self._previous_sheet_results.clear()
                     if hasattr(self, 'comparison_summary'):
                         self.comparison_summary.clear()
                     if hasattr(self, 'confusion_matrix'):
@@ -7213,9 +6337,9 @@ QUALITY WARNINGS:
             
             # Clear matplotlib figures to prevent memory leaks
             try:
-                import matplotlib.pyplot as plt
-                plt.close('all')
-                print("Cleared matplotlib figures")
+                if 'matplotlib.pyplot' in sys.modules:
+                    plt.close('all')
+                    print("Cleared matplotlib figures")
             except Exception as e:
                 print(f"Warning: Error clearing matplotlib figures: {str(e)}")
             
@@ -7274,10 +6398,22 @@ QUALITY WARNINGS:
                 if not success:
                     print("Warning: Thread manager did not shut down cleanly")
             
+            # Stop analysis worker processes
+            if hasattr(self, 'process_manager'):
+                self.process_manager.shutdown(wait=False)
+            
+            # Stop chart rendering worker processes
+            if hasattr(self, 'render_service'):
+                self.render_service.shutdown(wait=False)
+            
+            # Remove sheet results spilled to disk
+            if hasattr(self, 'memory_budget'):
+                self.memory_budget.close()
+            
             # Clean up matplotlib
             try:
-                import matplotlib.pyplot as plt
-                plt.close('all')
+                if 'matplotlib.pyplot' in sys.modules:
+                    plt.close('all')
             except:
                 pass
             
@@ -7299,6 +6435,46 @@ QUALITY WARNINGS:
         except:
             pass  # Avoid errors during garbage collection
 
+def load_resource_limits(settings_file=SETTINGS_FILE):
+    """
+    Apply the 'limits' section of the settings file to the resource limits.
+    
+    Recognized keys: max_file_mb, max_sheets, max_cells (sheets with more
+    cells are streamed in row chunks) and max_memory_mb (memory budget).
+    
+    Args:
+        settings_file (Path): JSON settings file
+    """
+    global MAX_FILE_MB, MAX_SHEETS, MAX_CELLS, MAX_MEMORY_MB
+    try:
+        if not os.path.exists(settings_file):
+            return
+        with open(settings_file, 'r') as f:
+            limits = json.load(f).get('limits', {})
+        MAX_FILE_MB = float(limits.get('max_file_mb', MAX_FILE_MB))
+        MAX_SHEETS = int(limits.get('max_sheets', MAX_SHEETS))
+        MAX_CELLS = int(limits.get('max_cells', MAX_CELLS))
+        MAX_MEMORY_MB = float(limits.get('max_memory_mb', MAX_MEMORY_MB))
+    except Exception as e:
+        print(f"Warning: Could not read resource limits from settings: {e}")
+
+def start_telemetry(startup_seconds=None):
+    """
+    Configure telemetry from the 'telemetry' section of the settings file.
+    
+    Events are written locally to TELEMETRY_FILE by a background thread;
+    nothing is sent over the network unless sentry_enabled is set.
+    """
+    try:
+        config = load_telemetry_config(SETTINGS_FILE, file=str(TELEMETRY_FILE), sentry_dsn=SENTRY_DSN)
+        configure_telemetry(config)
+        if TELEMETRY.enabled:
+            TELEMETRY.install_exception_hooks()
+            TELEMETRY.record('startup', seconds=startup_seconds, memory_mb=process_memory_mb(),
+                             version=__version__, cpu_count=os.cpu_count())
+    except Exception as e:
+        print(f"Warning: Telemetry could not be started: {e}")
+
 def check_terms_acceptance():
     """Check if terms have been previously accepted"""
     try:
@@ -7467,10 +6643,15 @@ TraceSeis® is a registered trademark of TraceSeis, Inc."""
 
 def main():
     """Main application entry point with comprehensive safety measures"""
+    start_time = time.perf_counter()
+    install_signal_handlers()
+    
     # Check dependencies first
     if not check_dependencies():
         pass
     
+    load_resource_limits()
+    
     # Check if terms have been previously accepted
     if not check_terms_acceptance():
         # Show terms acceptance dialog
@@ -7486,7 +6667,8 @@ def main():
             # Force garbage collection
             gc.collect()
             # Close matplotlib
-            plt.close('all')
+            if 'matplotlib.pyplot' in sys.modules:
+                plt.close('all')
         except:
             pass
         sys.exit(1)
@@ -7511,6 +6693,16 @@ def main():
     # Create the application instance
     app = GeophysicsAnalyzer(root)
     
+    # Record exceptions raised in Tk callbacks before Tk reports them
+    report_callback_exception = root.report_callback_exception
+    def report_tk_exception(exc_type, exc_value, exc_tb):
+        TELEMETRY.record_exception(exc_type, exc_value, exc_tb, 'tk_callback')
+        report_callback_exception(exc_type, exc_value, exc_tb)
+    root.report_callback_exception = report_tk_exception
+    
+    # Start telemetry once the window is up instead of delaying it
+    root.after_idle(lambda: start_telemetry(time.perf_counter() - start_time))
+    
     def on_closing():
         """Enhanced window closing handler with comprehensive cleanup"""
         print("Application closing, starting cleanup...")
@@ -7570,4 +6762,6 @@ def main():
             pass  # Don't let cleanup errors prevent exit
 
 if __name__ == "__main__":
+    # Required for the analysis process pool in frozen Windows builds
+    multiprocessing.freeze_support()
     main()